@@ -0,0 +1,132 @@
+"""Latência de ``/auth/me`` enquanto logins concorrentes acontecem.
+
+Compara a verificação argon2 executada no event loop (``inline``) com a
+verificação delegada ao ``password_pool`` (``pool``).
+
+Uso:
+    PYTHONPATH=src python -m benchmarks.auth_me_under_login --duration 5
+"""
+
+import argparse
+import asyncio
+import time
+from collections import Counter
+from typing import Any
+
+import httpx
+
+from app.config import settings
+from app.main import app
+from app.routers.deps import (
+    get_auth_service,
+    get_refresh_token_repository,
+    get_user_loader,
+    get_user_repository,
+)
+from app.security import create_access_token, verify_password
+from app.services.auth import AuthService, IAuthServiceInterface
+from benchmarks.support import (
+    InMemoryRefreshTokenRepository,
+    InMemoryUserRepository,
+    memory_user_loader,
+    percentile,
+)
+
+EMAIL = 'bench@example.com'
+PASSWORD = 'bench-password'
+
+
+async def verify_password_inline(
+    plain_password: str, hashed_password: str
+) -> bool:
+    return verify_password(plain_password, hashed_password)
+
+
+async def run_scenario(
+    mode: str, login_concurrency: int, duration: float
+) -> dict[str, Any]:
+    repository = InMemoryUserRepository()
+    user = repository.seed(EMAIL, PASSWORD, '11999999999')
+
+    def auth_service_override() -> IAuthServiceInterface:
+        return AuthService(
+            user_repository=repository,
+            password_verifier=verify_password_inline,
+            token_creator=create_access_token,
+        )
+
+    app.dependency_overrides[get_user_repository] = lambda: repository
+    user_loader = memory_user_loader(repository)
+    app.dependency_overrides[get_user_loader] = lambda: user_loader
+    refresh_tokens = InMemoryRefreshTokenRepository()
+    app.dependency_overrides[get_refresh_token_repository] = (
+        lambda: refresh_tokens
+    )
+    if mode == 'inline':
+        app.dependency_overrides[get_auth_service] = auth_service_override
+
+    token = create_access_token(data={'sub': str(user.id)})
+    headers = {'Authorization': f'Bearer {token}'}
+    login_form = {'username': EMAIL, 'password': PASSWORD}
+    prefix = settings.API_PREFIX
+
+    latencies: list[float] = []
+    login_status: Counter[int] = Counter()
+    deadline = time.perf_counter() + duration
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url='http://bench'
+    ) as client:
+
+        async def login_worker() -> None:
+            while time.perf_counter() < deadline:
+                response = await client.post(
+                    f'{prefix}/auth/login', data=login_form
+                )
+                login_status[response.status_code] += 1
+
+        async def me_probe() -> None:
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                await client.get(f'{prefix}/auth/me', headers=headers)
+                latencies.append((time.perf_counter() - started) * 1000)
+                await asyncio.sleep(0.005)
+
+        await asyncio.gather(
+            me_probe(), *(login_worker() for _ in range(login_concurrency))
+        )
+
+    app.dependency_overrides.clear()
+    return {
+        'mode': mode,
+        'me_requests': len(latencies),
+        'p50_ms': percentile(latencies, 50),
+        'p99_ms': percentile(latencies, 99),
+        'logins': dict(login_status),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--duration', type=float, default=5.0)
+    parser.add_argument('--logins', type=int, default=8)
+    parser.add_argument(
+        '--modes',
+        nargs='+',
+        default=['inline', 'pool'],
+        choices=['inline', 'pool'],
+    )
+    args = parser.parse_args()
+
+    for mode in args.modes:
+        result = asyncio.run(run_scenario(mode, args.logins, args.duration))
+        print(
+            f'{result["mode"]:>6}: /auth/me n={result["me_requests"]} '
+            f'p50={result["p50_ms"]:.2f}ms p99={result["p99_ms"]:.2f}ms '
+            f'logins={result["logins"]}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""Compara dois relatórios JSON de ``benchmarks.load``.
+
+Sai com código 1 quando algum cenário perde mais que ``--threshold`` %
+de throughput ou ganha mais que ``--threshold`` % de latência p99.
+
+Uso:
+    PYTHONPATH=src python -m benchmarks.compare base.json head.json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+
+def load_report(path: Path) -> dict[str, Any]:
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def change(old: float, new: float) -> float:
+    return (new - old) / old * 100 if old else 0.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('base', type=Path)
+    parser.add_argument('head', type=Path)
+    parser.add_argument('--threshold', type=float, default=10.0)
+    args = parser.parse_args()
+
+    base = load_report(args.base)
+    head = load_report(args.head)
+    print(f'{base["revision"]} -> {head["revision"]}')
+
+    regressions: list[str] = []
+    for name, head_result in head['scenarios'].items():
+        base_result = base['scenarios'].get(name)
+        if base_result is None:
+            print(f'{name:<12} (novo cenário)')
+            continue
+
+        rps_change = change(
+            base_result['throughput_rps'], head_result['throughput_rps']
+        )
+        p99_change = change(base_result['p99_ms'], head_result['p99_ms'])
+        print(f'{name:<12} rps {rps_change:+7.1f}%   p99 {p99_change:+7.1f}%')
+        if rps_change < -args.threshold or p99_change > args.threshold:
+            regressions.append(name)
+
+    if regressions:
+        print(f'regressões: {", ".join(regressions)}')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
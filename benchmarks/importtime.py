@@ -0,0 +1,122 @@
+"""Relatório de tempo de import (``python -X importtime``) com orçamento.
+
+Importa o módulo em subprocessos limpos, usa a execução mais rápida
+para reduzir ruído e lista os imports mais caros. Sai com código 1 se
+o tempo cumulativo passar de ``--budget-ms`` ou se algum módulo de
+``--forbid`` for importado.
+
+Os subsistemas opcionais (clientes redis, driver do banco, servidores
+uvicorn/gunicorn) só são importados no primeiro uso; ``--forbid``
+garante que continuem fora do import de ``app.main``. O restante do
+tempo é de FastAPI, SQLAlchemy e pydantic, que a aplicação precisa para
+montar rotas, modelos e schemas, e do ``cryptography`` que o PyJWT
+carrega ao ser importado.
+
+Uso:
+    PYTHONPATH=src python -m benchmarks.importtime --budget-ms 1500
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+
+LAZY_MODULES = ('redis', 'psycopg', 'uvicorn', 'gunicorn')
+
+
+@dataclass(slots=True)
+class ImportEntry:
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def parse_importtime(output: str) -> list[ImportEntry]:
+    entries: list[ImportEntry] = []
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        fields = line.removeprefix('import time:').split('|')
+        self_us, cumulative_us, name = fields
+        entries.append(
+            ImportEntry(
+                module=name.strip(),
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+            )
+        )
+    return entries
+
+
+def measure(module: str) -> list[ImportEntry]:
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True,
+        text=True,
+        env=os.environ.copy(),
+        check=False,
+    )
+    if result.returncode != 0:
+        sys.exit(result.stderr)
+    return parse_importtime(result.stderr)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument('--module', default='app.main')
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--top', type=int, default=15)
+    parser.add_argument('--budget-ms', type=float)
+    parser.add_argument(
+        '--forbid',
+        nargs='*',
+        default=list(LAZY_MODULES),
+        help='pacotes que não podem ser importados pelo módulo',
+    )
+    args = parser.parse_args()
+
+    def total_us(entries: list[ImportEntry]) -> int:
+        return next(
+            e.cumulative_us for e in entries if e.module == args.module
+        )
+
+    runs = [measure(args.module) for _ in range(args.runs)]
+    best = min(runs, key=total_us)
+    total_ms = total_us(best) / 1000
+
+    print(f'{"cumulativo":>12} {"próprio":>10}  módulo')
+    for entry in sorted(best, key=lambda e: -e.cumulative_us)[: args.top]:
+        print(
+            f'{entry.cumulative_us / 1000:10.1f}ms '
+            f'{entry.self_us / 1000:8.1f}ms  {entry.module}'
+        )
+
+    first_party = [e for e in best if e.module.split('.')[0] == 'app']
+    print(f'\nmódulos de app ({len(first_party)}), por tempo próprio:')
+    for entry in sorted(first_party, key=lambda e: -e.self_us)[: args.top]:
+        print(f'{entry.self_us / 1000:10.1f}ms  {entry.module}')
+
+    print(f'\nimport {args.module}: {total_ms:.1f}ms (melhor de {args.runs})')
+    failed = False
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        print(f'acima do orçamento de {args.budget_ms:.0f}ms')
+        failed = True
+
+    eager = sorted({
+        e.module.split('.')[0]
+        for e in best
+        if e.module.split('.')[0] in args.forbid
+    })
+    if eager:
+        print(f'importados no carregamento, deveriam ser lazy: {eager}')
+        failed = True
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""Custo de serialização do envelope ``Response`` por tamanho de payload.
+
+Compara o caminho padrão do FastAPI (``jsonable_encoder`` +
+``JSONResponse``), ``model_dump(mode='json')`` + ``JSONResponse`` e o
+``FastJSONResponse``.
+
+Uso:
+    PYTHONPATH=src python -m benchmarks.json_serialization
+"""
+
+import argparse
+import timeit
+from datetime import UTC, datetime
+from typing import Any, Callable
+from uuid import uuid4
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.schemas.response import Response
+from app.schemas.user.user_input_create import UserResponse
+from app.utils.json_response import FastJSONResponse
+
+
+def build_envelope(size: int) -> Response[list[UserResponse]]:
+    users = [
+        UserResponse(
+            id=uuid4(),
+            email=f'user{i}@example.com',
+            first_name='Bench',
+            last_name='Mark',
+            phone=f'{i:011d}',
+            is_active=True,
+            updated_at=datetime.now(UTC),
+        )
+        for i in range(size)
+    ]
+    return Response[list[UserResponse]](
+        data=users, message='Usuários encontrados.', status_code=200
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--iterations', type=int, default=2000)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        envelope = build_envelope(size)
+        strategies: dict[str, Callable[[], Any]] = {
+            'jsonable_encoder': lambda: JSONResponse(
+                jsonable_encoder(envelope)
+            ),
+            'model_dump': lambda: JSONResponse(
+                envelope.model_dump(mode='json')
+            ),
+            'FastJSONResponse': lambda: FastJSONResponse(envelope),
+        }
+        body_size = len(FastJSONResponse(envelope).body)
+        print(f'{size} item(s), {body_size} bytes')
+        for name, strategy in strategies.items():
+            elapsed = timeit.timeit(strategy, number=args.iterations)
+            per_response = elapsed / args.iterations * 1_000_000
+            print(f'  {name:<18} {per_response:10.2f} us/response')
+
+
+if __name__ == '__main__':
+    main()
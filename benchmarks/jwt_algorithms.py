@@ -0,0 +1,97 @@
+"""Assinatura e verificação de JWT por algoritmo.
+
+Compara HS512 com RS256, ES256 e EdDSA e, para os assimétricos, o custo
+de passar a chave em PEM (parseada a cada chamada) em vez do objeto já
+carregado, como faz ``app.signing_keys``.
+
+Uso:
+    PYTHONPATH=src python -m benchmarks.jwt_algorithms --iterations 2000
+"""
+
+import argparse
+import timeit
+from typing import Any, Callable
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+from jwt import decode, encode
+
+CLAIMS = {'sub': 'a1b2c3d4', 'iss': 'benchmark', 'aud': 'benchmark'}
+
+
+def generate_keys() -> dict[str, tuple[Any, Any]]:
+    """``algoritmo -> (chave privada, chave pública)``"""
+    private_keys: dict[str, Any] = {
+        'RS256': rsa.generate_private_key(
+            public_exponent=65537, key_size=2048
+        ),
+        'ES256': ec.generate_private_key(ec.SECP256R1()),
+        'EdDSA': ed25519.Ed25519PrivateKey.generate(),
+    }
+    return {
+        algorithm: (key, key.public_key())
+        for algorithm, key in private_keys.items()
+    }
+
+
+def to_pem(private_key: Any) -> tuple[bytes, bytes]:
+    return (
+        private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ),
+        private_key.public_key().public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        ),
+    )
+
+
+def ops_per_second(fn: Callable[[], Any], iterations: int) -> float:
+    return iterations / timeit.timeit(fn, number=iterations)
+
+
+def report(
+    label: str, algorithm: str, signing: Any, verifying: Any, iterations: int
+) -> None:
+    token = encode(CLAIMS, signing, algorithm=algorithm)
+    sign = ops_per_second(
+        lambda: encode(CLAIMS, signing, algorithm=algorithm), iterations
+    )
+    verify = ops_per_second(
+        lambda: decode(
+            token,
+            verifying,
+            algorithms=[algorithm],
+            audience='benchmark',
+            issuer='benchmark',
+        ),
+        iterations,
+    )
+    print(f'{label:<14} {sign:>12,.0f} {verify:>12,.0f}')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument('--iterations', type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f'{"algoritmo":<14} {"assinar/s":>12} {"verificar/s":>12}')
+    report('HS512', 'HS512', 'x' * 64, 'x' * 64, args.iterations)
+    for algorithm, (private_key, public_key) in generate_keys().items():
+        report(algorithm, algorithm, private_key, public_key, args.iterations)
+        private_pem, public_pem = to_pem(private_key)
+        report(
+            f'{algorithm} (PEM)',
+            algorithm,
+            private_pem,
+            public_pem,
+            args.iterations,
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""Custo por requisição da validação do JWT com e sem cache.
+
+Uso:
+    PYTHONPATH=src python -m benchmarks.jwt_decode_cache --iterations 20000
+"""
+
+import argparse
+import timeit
+from uuid import uuid4
+
+from jwt import decode
+
+from app.config import settings
+from app.security import create_access_token, decode_access_token, token_cache
+
+
+def decode_uncached(token: str) -> None:
+    decode(
+        token,
+        settings.JWT_SECRET_KEY,
+        algorithms=[settings.JWT_ALGORITHM],
+        audience=settings.JWT_AUDIENCE,
+        issuer=settings.JWT_ISSUER,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--iterations', type=int, default=20_000)
+    args = parser.parse_args()
+
+    token = create_access_token(data={'sub': str(uuid4())})
+    token_cache.clear()
+
+    uncached = timeit.timeit(
+        lambda: decode_uncached(token), number=args.iterations
+    )
+    cached = timeit.timeit(
+        lambda: decode_access_token(token), number=args.iterations
+    )
+
+    uncached_us = uncached / args.iterations * 1_000_000
+    cached_us = cached / args.iterations * 1_000_000
+    print(f'jwt.decode:           {uncached_us:8.2f} us/req')
+    print(f'decode_access_token:  {cached_us:8.2f} us/req')
+    print(f'speedup:              {uncached_us / cached_us:8.1f}x')
+    print(f'cache:                {token_cache.stats()}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,296 @@
+"""Teste de carga de ``app.main.app`` com resultados em JSON.
+
+Cenários: ``login`` (POST /auth/login), ``me`` (GET /auth/me) e
+``create_user`` (POST /users). Para cada cenário são reportados
+throughput, latência p50/p95/p99 e atraso do event loop.
+
+Backends:
+    memory    repositório em memória (padrão, sem banco)
+    postgres  banco de ``DATABASE_URL`` (ex.: ``make docker-up``)
+
+Transportes:
+    asgi      httpx.ASGITransport, no mesmo processo (padrão)
+    uvicorn   servidor uvicorn local, via TCP
+
+Uso:
+    PYTHONPATH=src python -m benchmarks.load --duration 10 \\
+        --output benchmarks/results/$(git rev-parse --short HEAD).json
+    PYTHONPATH=src python -m benchmarks.compare old.json new.json
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import subprocess
+import time
+from collections import Counter
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+import httpx
+import uvicorn
+
+from app.config import settings
+from app.database import (
+    async_session,
+    dispose_engines,
+    get_engine,
+    table_registry,
+)
+from app.main import app
+from app.metrics import LoopMonitor
+from app.models import User
+from app.repository.user import UserRepository
+from app.routers.deps import (
+    get_refresh_token_repository,
+    get_user_loader,
+    get_user_repository,
+)
+from app.security import create_access_token, get_password_hash
+from benchmarks.support import (
+    InMemoryRefreshTokenRepository,
+    InMemoryUserRepository,
+    memory_user_loader,
+    percentile,
+)
+
+PASSWORD = 'bench-password'
+SCENARIOS = ('login', 'me', 'create_user')
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    requests: int
+    duration_s: float
+    throughput_rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    status_codes: dict[str, int]
+    loop_lag_p99_ms: float
+    loop_lag_max_ms: float
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+async def seed_user(backend: str, create_schema: bool) -> User:
+    email = f'bench-{uuid4().hex[:12]}@example.com'
+    phone = uuid4().hex[:15]
+
+    if backend == 'memory':
+        repository = InMemoryUserRepository()
+        app.dependency_overrides[get_user_repository] = lambda: repository
+        user_loader = memory_user_loader(repository)
+        app.dependency_overrides[get_user_loader] = lambda: user_loader
+        refresh_tokens = InMemoryRefreshTokenRepository()
+        app.dependency_overrides[get_refresh_token_repository] = (
+            lambda: refresh_tokens
+        )
+        return repository.seed(email, PASSWORD, phone)
+
+    if create_schema:
+        async with get_engine().begin() as connection:
+            await connection.run_sync(table_registry.metadata.create_all)
+
+    async with async_session() as session:
+        return await UserRepository(session).create(
+            User(
+                email=email,
+                password=get_password_hash(PASSWORD),
+                first_name='Bench',
+                last_name='Mark',
+                phone=phone,
+            )
+        )
+
+
+@asynccontextmanager
+async def open_client(
+    transport: str, concurrency: int
+) -> AsyncIterator[httpx.AsyncClient]:
+    limits = httpx.Limits(max_connections=concurrency)
+
+    if transport == 'asgi':
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url='http://bench',
+            limits=limits,
+        ) as client:
+            yield client
+        return
+
+    config = uvicorn.Config(
+        app, host='127.0.0.1', port=0, log_level='warning', lifespan='on'
+    )
+    server = uvicorn.Server(config)
+    serve_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+
+    port = server.servers[0].sockets[0].getsockname()[1]
+    try:
+        async with httpx.AsyncClient(
+            base_url=f'http://127.0.0.1:{port}', limits=limits
+        ) as client:
+            yield client
+    finally:
+        server.should_exit = True
+        await serve_task
+
+
+async def run_scenario(
+    name: str,
+    make_request: Callable[[], Awaitable[httpx.Response]],
+    duration: float,
+    concurrency: int,
+) -> ScenarioResult:
+    latencies: list[float] = []
+    status_codes: Counter[str] = Counter()
+
+    lag_samples: list[float] = []
+    lag_monitor = LoopMonitor(
+        interval=0.01, on_lag=lambda lag: lag_samples.append(lag * 1000)
+    )
+    lag_monitor.start()
+    try:
+        started = time.perf_counter()
+        deadline = started + duration
+
+        async def worker() -> None:
+            while time.perf_counter() < deadline:
+                request_started = time.perf_counter()
+                try:
+                    response = await make_request()
+                    status_codes[str(response.status_code)] += 1
+                except httpx.HTTPError as e:
+                    status_codes[type(e).__name__] += 1
+                latencies.append(
+                    (time.perf_counter() - request_started) * 1000
+                )
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    finally:
+        await lag_monitor.stop()
+
+    return ScenarioResult(
+        name=name,
+        requests=len(latencies),
+        duration_s=round(elapsed, 3),
+        throughput_rps=round(len(latencies) / elapsed, 2),
+        p50_ms=round(percentile(latencies, 50), 3),
+        p95_ms=round(percentile(latencies, 95), 3),
+        p99_ms=round(percentile(latencies, 99), 3),
+        status_codes=dict(status_codes),
+        loop_lag_p99_ms=round(percentile(lag_samples, 99), 3),
+        loop_lag_max_ms=round(max(lag_samples, default=0.0), 3),
+    )
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    user = await seed_user(args.backend, args.create_schema)
+    token = create_access_token(data={'sub': str(user.id)})
+    prefix = settings.API_PREFIX
+
+    results: list[ScenarioResult] = []
+    async with open_client(args.transport, args.concurrency) as client:
+        requests: dict[str, Callable[[], Awaitable[httpx.Response]]] = {
+            'login': lambda: client.post(
+                f'{prefix}/auth/login',
+                data={'username': user.email, 'password': PASSWORD},
+            ),
+            'me': lambda: client.get(
+                f'{prefix}/auth/me',
+                headers={'Authorization': f'Bearer {token}'},
+            ),
+            'create_user': lambda: client.post(
+                f'{prefix}/users',
+                json={
+                    'email': f'{uuid4().hex}@example.com',
+                    'password': PASSWORD,
+                    'first_name': 'Bench',
+                    'last_name': 'Mark',
+                    'phone': uuid4().hex[:15],
+                },
+            ),
+        }
+        for name in args.scenarios:
+            result = await run_scenario(
+                name, requests[name], args.duration, args.concurrency
+            )
+            results.append(result)
+            print(
+                f'{name:<12} {result.throughput_rps:9.1f} req/s  '
+                f'p50={result.p50_ms:.2f}ms p95={result.p95_ms:.2f}ms '
+                f'p99={result.p99_ms:.2f}ms  '
+                f'lag_p99={result.loop_lag_p99_ms:.2f}ms  '
+                f'{result.status_codes}'
+            )
+
+    app.dependency_overrides.clear()
+    await dispose_engines()
+    return {
+        'revision': git_revision(),
+        'timestamp': datetime.now(UTC).isoformat(),
+        'python': platform.python_version(),
+        'config': {
+            'backend': args.backend,
+            'transport': args.transport,
+            'duration_s': args.duration,
+            'concurrency': args.concurrency,
+        },
+        'scenarios': {result.name: asdict(result) for result in results},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument(
+        '--backend', choices=['memory', 'postgres'], default='memory'
+    )
+    parser.add_argument(
+        '--transport', choices=['asgi', 'uvicorn'], default='asgi'
+    )
+    parser.add_argument(
+        '--scenarios', nargs='+', choices=SCENARIOS, default=list(SCENARIOS)
+    )
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument(
+        '--create-schema',
+        action='store_true',
+        help='cria as tabelas no banco antes do teste (backend postgres)',
+    )
+    parser.add_argument('--output', type=Path)
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(
+            json.dumps(report, indent=2) + '\n', encoding='utf-8'
+        )
+        print(f'resultados salvos em {args.output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,172 @@
+"""Requisições por segundo com a pilha ASGI pura vs. BaseHTTPMiddleware.
+
+O cenário ``before`` recria o antigo ``ResponseMiddleware`` (um
+``BaseHTTPMiddleware`` que apenas chama ``call_next``); ``after`` usa a
+pilha atual de ``app.main``. Hash e verificação de senha são
+substituídos por funções triviais para medir apenas o overhead HTTP.
+
+Uso:
+    PYTHONPATH=src python -m benchmarks.middleware_rps --requests 2000
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable
+from uuid import uuid4
+
+import httpx
+from fastapi import Request, Response
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.config import settings
+from app.main import app
+from app.routers.deps import (
+    get_auth_service,
+    get_user_loader,
+    get_user_repository,
+    get_user_service,
+)
+from app.security import create_access_token
+from app.services.auth import AuthService
+from app.services.user import UserService
+from benchmarks.support import InMemoryUserRepository, memory_user_loader
+
+EMAIL = 'bench@example.com'
+PASSWORD = 'bench-password'
+
+
+class LegacyResponseMiddleware(BaseHTTPMiddleware):
+    async def dispatch(  # noqa: PLR6301
+        self,
+        request: Request,
+        call_next: Callable[[Request], Awaitable[Response]],
+    ):
+        return await call_next(request)
+
+
+async def fast_hash(password: str) -> str:
+    return password
+
+
+async def fast_verify(plain_password: str, hashed_password: str) -> bool:
+    return True
+
+
+def install_overrides(repository: InMemoryUserRepository) -> None:
+    app.dependency_overrides[get_user_repository] = lambda: repository
+    user_loader = memory_user_loader(repository)
+    app.dependency_overrides[get_user_loader] = lambda: user_loader
+    app.dependency_overrides[get_user_service] = lambda: UserService(
+        user_repository=repository, password_hasher=fast_hash
+    )
+    app.dependency_overrides[get_auth_service] = lambda: AuthService(
+        user_repository=repository,
+        password_verifier=fast_verify,
+        token_creator=create_access_token,
+    )
+
+
+async def measure(
+    client: httpx.AsyncClient,
+    make_request: Callable[[], Awaitable[httpx.Response]],
+    total: int,
+    concurrency: int,
+) -> float:
+    remaining = total
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            await make_request()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return total / (time.perf_counter() - started)
+
+
+async def run_scenario(
+    label: str, total: int, concurrency: int
+) -> dict[str, float]:
+    repository = InMemoryUserRepository()
+    user = repository.seed(EMAIL, PASSWORD, '11999999999')
+    install_overrides(repository)
+
+    token = create_access_token(data={'sub': str(user.id)})
+    headers = {'Authorization': f'Bearer {token}'}
+    prefix = settings.API_PREFIX
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url='http://bench'
+    ) as client:
+
+        def get_me() -> Awaitable[httpx.Response]:
+            return client.get(f'{prefix}/auth/me', headers=headers)
+
+        def login() -> Awaitable[httpx.Response]:
+            return client.post(
+                f'{prefix}/auth/login',
+                data={'username': EMAIL, 'password': PASSWORD},
+            )
+
+        def create_user() -> Awaitable[httpx.Response]:
+            suffix = uuid4().hex[:10]
+            return client.post(
+                f'{prefix}/users',
+                json={
+                    'email': f'{suffix}@example.com',
+                    'password': PASSWORD,
+                    'first_name': 'Bench',
+                    'last_name': 'Mark',
+                    'phone': suffix,
+                },
+            )
+
+        results = {
+            'GET /auth/me': await measure(client, get_me, total, concurrency),
+            'POST /auth/login': await measure(
+                client, login, total, concurrency
+            ),
+            'POST /users': await measure(
+                client, create_user, total, concurrency
+            ),
+        }
+
+    app.dependency_overrides.clear()
+    print(label)
+    for route, rps in results.items():
+        print(f'  {route:<18} {rps:9.1f} req/s')
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=16)
+    args = parser.parse_args()
+
+    current_middleware = list(app.user_middleware)
+
+    app.user_middleware = [Middleware(LegacyResponseMiddleware)]
+    app.middleware_stack = None
+    before = asyncio.run(
+        run_scenario(
+            'before (BaseHTTPMiddleware)', args.requests, args.concurrency
+        )
+    )
+
+    app.user_middleware = current_middleware
+    app.middleware_stack = None
+    after = asyncio.run(
+        run_scenario('after (ASGI stack)', args.requests, args.concurrency)
+    )
+
+    for route, rps in after.items():
+        print(f'{route:<18} {rps / before[route]:5.2f}x')
+
+
+if __name__ == '__main__':
+    main()
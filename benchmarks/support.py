@@ -0,0 +1,248 @@
+import math
+from collections.abc import AsyncIterator, Sequence
+from contextlib import nullcontext
+from datetime import UTC, datetime
+from typing import Any, Optional
+from uuid import UUID, uuid4
+
+from app.exceptions.user_exception import UserModifiedConcurrently
+from app.models import RefreshToken, User
+from app.repository.token import IRefreshTokenRepositoryInterface
+from app.repository.user import (
+    IUserRepositoryInterface,
+    UserLoader,
+    UserView,
+)
+from app.security import get_password_hash
+from app.utils.pagination import Cursor
+
+
+class InMemoryUserRepository(IUserRepositoryInterface):
+    """Repositório em memória para isolar o custo da aplicação do banco"""
+
+    def __init__(self) -> None:
+        self._users: dict[UUID, User] = {}
+
+    def seed(self, email: str, password: str, phone: str) -> User:
+        """Cria um usuário com senha já hasheada"""
+        user = User(
+            email=email,
+            password=get_password_hash(password),
+            first_name='Bench',
+            last_name='Mark',
+            phone=phone,
+        )
+        return self._add(user)
+
+    def _add(self, user: User) -> User:
+        user.id = uuid4()
+        user.created_at = user.updated_at = datetime.now(UTC)  # type: ignore
+        self._users[user.id] = user
+        return user
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        return next(
+            (u for u in self._users.values() if u.email == email), None
+        )
+
+    async def get_by_phone(self, phone: str) -> Optional[User]:
+        return next(
+            (u for u in self._users.values() if u.phone == phone), None
+        )
+
+    async def get_by_id(self, user_id: UUID) -> Optional[User]:
+        return self._users.get(user_id)
+
+    @staticmethod
+    def _view(user: User) -> UserView:
+        return UserView(
+            id=user.id,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            email=user.email,
+            phone=user.phone,
+            is_active=user.is_active,
+            updated_at=user.updated_at,
+        )
+
+    async def get_view_by_id(self, user_id: UUID) -> Optional[UserView]:
+        user = await self.get_by_id(user_id)
+        return self._view(user) if user is not None else None
+
+    async def get_view_by_email(self, email: str) -> Optional[UserView]:
+        user = await self.get_by_email(email)
+        return self._view(user) if user is not None else None
+
+    async def is_admin(self, user_id: UUID) -> bool:
+        user = await self.get_by_id(user_id)
+        return user is not None and user.is_admin
+
+    async def get_views_by_ids(
+        self, user_ids: Sequence[UUID]
+    ) -> dict[UUID, UserView]:
+        return {
+            i: self._view(self._users[i]) for i in user_ids if i in self._users
+        }
+
+    async def get_many_by_ids(
+        self, user_ids: Sequence[UUID]
+    ) -> dict[UUID, User]:
+        return {i: self._users[i] for i in user_ids if i in self._users}
+
+    async def get_many_by_emails(
+        self, emails: Sequence[str]
+    ) -> dict[str, User]:
+        return {u.email: u for u in self._users.values() if u.email in emails}
+
+    async def list_page(
+        self, limit: int, after: Optional[Cursor] = None
+    ) -> list[User]:
+        users = sorted(
+            self._users.values(), key=lambda u: (u.created_at, u.id)
+        )
+        if after is not None:
+            users = [u for u in users if (u.created_at, u.id) > after]
+        return users[:limit]
+
+    async def stream_all(
+        self, batch_size: int
+    ) -> AsyncIterator[Sequence[Any]]:
+        for user in sorted(
+            self._users.values(), key=lambda u: (u.created_at, u.id)
+        ):
+            yield (
+                user.id,
+                user.email,
+                user.first_name,
+                user.last_name,
+                user.phone,
+                user.is_active,
+                user.created_at,
+            )
+
+    async def create(self, user: User) -> User:
+        return self._add(user)
+
+    async def bulk_create(self, users: list[User]) -> set[str]:
+        taken_emails, taken_phones = await self.find_taken(
+            [u.email for u in users], [u.phone for u in users]
+        )
+        inserted: set[str] = set()
+        for user in users:
+            if user.email in taken_emails or user.phone in taken_phones:
+                continue
+            self._add(user)
+            inserted.add(user.email)
+            taken_emails.add(user.email)
+            taken_phones.add(user.phone)
+        return inserted
+
+    async def find_taken(
+        self, emails: list[str], phones: list[str]
+    ) -> tuple[set[str], set[str]]:
+        existing = self._users.values()
+        return (
+            {u.email for u in existing if u.email in emails},
+            {u.phone for u in existing if u.phone in phones},
+        )
+
+    async def update_fields(
+        self,
+        user_id: UUID,
+        values: dict[str, Any],
+        expected_updated_at: Optional[datetime] = None,
+    ) -> Optional[User]:
+        user = self._users.get(user_id)
+        if user is None:
+            return None
+        if expected_updated_at not in {None, user.updated_at}:
+            raise UserModifiedConcurrently()
+        for name, value in values.items():
+            setattr(user, name, value)
+        user.updated_at = datetime.now(UTC)  # type: ignore
+        return user
+
+    async def replace_password_hash(
+        self, user_id: UUID, current_hash: str, new_hash: str
+    ) -> bool:
+        user = self._users.get(user_id)
+        if user is None or user.password != current_hash:
+            return False
+        user.password = new_hash
+        return True
+
+    async def delete(self, user_id: UUID) -> bool:
+        return self._users.pop(user_id, None) is not None
+
+    async def purge_deleted(  # noqa: PLR6301
+        self, before: datetime, limit: int
+    ) -> int:
+        return 0
+
+
+class InMemoryRefreshTokenRepository(IRefreshTokenRepositoryInterface):
+    """Refresh tokens em memória, sem detecção de reuso"""
+
+    def __init__(self) -> None:
+        self._tokens: dict[UUID, RefreshToken] = {}
+
+    async def create(self, token: RefreshToken) -> RefreshToken:
+        self._tokens[token.id] = token
+        return token
+
+    async def rotate(
+        self,
+        token_id: UUID,
+        token_hash: str,
+        new_token_id: UUID,
+        new_token_hash: str,
+        expires_at: datetime,
+    ) -> Optional[RefreshToken]:
+        token = self._tokens.get(token_id)
+        if (
+            token is None
+            or token.token_hash != token_hash
+            or token.revoked_at is not None
+        ):
+            return None
+        token.revoked_at = datetime.now(UTC)
+        token.replaced_by = new_token_id
+        return await self.create(
+            RefreshToken(
+                id=new_token_id,
+                session_id=token.session_id,
+                user_id=token.user_id,
+                token_hash=new_token_hash,
+                expires_at=expires_at,
+            )
+        )
+
+    async def revoke_session(self, session_id: UUID) -> None:
+        for token in self._tokens.values():
+            if token.session_id == session_id and token.revoked_at is None:
+                token.revoked_at = datetime.now(UTC)
+
+    async def revoked_sessions_since(
+        self, since: datetime
+    ) -> list[tuple[UUID, datetime]]:
+        return [
+            (token.session_id, token.revoked_at)
+            for token in self._tokens.values()
+            if token.revoked_at is not None
+            and token.revoked_at > since
+            and token.replaced_by is None
+        ]
+
+
+def memory_user_loader(repository: InMemoryUserRepository) -> UserLoader:
+    """``UserLoader`` que busca no repositório em memória"""
+    return UserLoader(repository_scope=lambda: nullcontext(repository))
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Percentil por nearest-rank; ``samples`` não precisa estar ordenado"""
+    if not samples:
+        return math.nan
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
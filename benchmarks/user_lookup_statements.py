@@ -0,0 +1,103 @@
+"""Custo em Python de montar e compilar as buscas quentes de usuário.
+
+Compara, por busca, o ``select`` reconstruído a cada chamada (antes)
+com o statement de módulo de ``user_repository`` (depois), sem cache de
+compilação e com ele, do jeito que o SQLAlchemy faz a cada ``execute``.
+Com ``--execute``, executa também as buscas contra ``DATABASE_URL`` e
+mede o tempo total por chamada, incluindo o round-trip.
+
+Uso:
+    PYTHONPATH=src python -m benchmarks.user_lookup_statements
+"""
+
+import argparse
+import asyncio
+import timeit
+from typing import Any, Callable
+from uuid import UUID
+
+from sqlalchemy import Select, select
+from sqlalchemy.dialects.postgresql.psycopg import PGDialect_psycopg
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_engine
+from app.models import User
+from app.repository.user.user_repository import (
+    SELECT_USER_BY_ID,
+    UserRepository,
+)
+
+USER_ID = UUID(int=0)
+dialect = PGDialect_psycopg()
+
+
+def build_select() -> Select[Any]:
+    return select(User).where(User.id == USER_ID, User.is_active)
+
+
+def compile_cached(stmt: Select[Any], cache: dict[Any, Any]) -> Any:
+    """Chave de cache + compilação reaproveitada, como em ``execute``"""
+    return stmt._compile_w_cache(  # type: ignore
+        dialect, compiled_cache=cache, column_keys=[]
+    )
+
+
+def per_call_us(fn: Callable[[], Any], iterations: int) -> float:
+    return timeit.timeit(fn, number=iterations) / iterations * 1_000_000
+
+
+async def execute_us(iterations: int) -> tuple[float, float]:
+    async with AsyncSession(get_engine()) as session:
+        repository = UserRepository(session)
+
+        async def rebuilt() -> None:
+            await session.execute(build_select())
+
+        async def module_level() -> None:
+            await repository.get_by_id(USER_ID)
+
+        results: list[float] = []
+        for lookup in (rebuilt, module_level):
+            for _ in range(100):
+                await lookup()
+            started = asyncio.get_running_loop().time()
+            for _ in range(iterations):
+                await lookup()
+            elapsed = asyncio.get_running_loop().time() - started
+            results.append(elapsed / iterations * 1_000_000)
+    await get_engine().dispose()
+    return results[0], results[1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument('--iterations', type=int, default=20_000)
+    parser.add_argument('--execute', action='store_true')
+    args = parser.parse_args()
+
+    cache: dict[Any, Any] = {}
+    rows = [
+        (
+            'montar + compilar',
+            lambda: build_select().compile(dialect=dialect),
+        ),
+        ('montar + cache', lambda: compile_cached(build_select(), cache)),
+        (
+            'módulo + cache',
+            lambda: compile_cached(SELECT_USER_BY_ID, cache),
+        ),
+    ]
+    print(f'{"get_by_id":<20} {"us/busca":>10}')
+    for label, fn in rows:
+        print(f'{label:<20} {per_call_us(fn, args.iterations):10.2f}')
+
+    if args.execute:
+        rebuilt, module_level = asyncio.run(execute_us(args.iterations))
+        print(f'\n{"execute (antes)":<20} {rebuilt:10.2f}')
+        print(f'{"execute (depois)":<20} {module_level:10.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+"""add users is_admin
+
+Revision ID: 9d3f5b1a7e42
+Revises: 5e0d7a3b9f12
+Create Date: 2026-10-18 17:12:44.918203
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d3f5b1a7e42'
+down_revision: Union[str, None] = '5e0d7a3b9f12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'tb_users',
+        sa.Column(
+            'is_admin',
+            sa.Boolean(),
+            server_default=sa.text('FALSE'),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('tb_users', 'is_admin')
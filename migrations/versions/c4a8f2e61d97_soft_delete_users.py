@@ -0,0 +1,89 @@
+"""soft delete users
+
+Revision ID: c4a8f2e61d97
+Revises: 7b1e9d42c6a3
+Create Date: 2026-10-18 15:48:12.301774
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a8f2e61d97'
+down_revision: Union[str, None] = '7b1e9d42c6a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'tb_users',
+        sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+    )
+    # Usuários já inativos ficam com deleted_at NULL: continuam ocultos,
+    # mas ninguém os excluiu, então a purga nunca os apaga. Cabe aos
+    # operadores revisá-los.
+    op.create_index(
+        'tb_users_email_active_key',
+        'tb_users',
+        ['email'],
+        unique=True,
+        postgresql_where=sa.text('is_active'),
+    )
+    op.create_index(
+        'tb_users_phone_active_key',
+        'tb_users',
+        ['phone'],
+        unique=True,
+        postgresql_where=sa.text('is_active'),
+    )
+    op.create_index(
+        'tb_users_deleted_at_idx',
+        'tb_users',
+        ['deleted_at'],
+        unique=False,
+        postgresql_where=sa.text('deleted_at IS NOT NULL'),
+    )
+    op.drop_constraint('tb_users_email_key', 'tb_users', type_='unique')
+    op.drop_constraint('tb_users_phone_key', 'tb_users', type_='unique')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Os excluídos continuam com is_active = FALSE, o que o esquema antigo
+    # já entende; só não dá para restaurar as constraints se um email ou
+    # telefone foi reutilizado depois de uma exclusão.
+    duplicated = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                'SELECT EXISTS ('
+                'SELECT 1 FROM tb_users WHERE email IS NOT NULL '
+                'GROUP BY email HAVING count(*) > 1 '
+                'UNION ALL '
+                'SELECT 1 FROM tb_users WHERE phone IS NOT NULL '
+                'GROUP BY phone HAVING count(*) > 1)'
+            )
+        )
+        .scalar()
+    )
+    if duplicated:
+        raise RuntimeError(
+            'Há emails ou telefones reutilizados após exclusões lógicas; '
+            'purgue ou corrija esses usuários antes do downgrade.'
+        )
+    op.create_unique_constraint(
+        'tb_users_phone_key', 'tb_users', ['phone']
+    )
+    op.create_unique_constraint(
+        'tb_users_email_key', 'tb_users', ['email']
+    )
+    op.drop_index('tb_users_deleted_at_idx', table_name='tb_users')
+    op.drop_index('tb_users_phone_active_key', table_name='tb_users')
+    op.drop_index('tb_users_email_active_key', table_name='tb_users')
+    op.drop_column('tb_users', 'deleted_at')
@@ -0,0 +1,12 @@
+from .cache_interface import ICacheBackend
+from .memory_cache import MemoryCacheBackend
+from .redis_cache import RedisCacheBackend
+from .ttl_cache import CacheStats, TTLCache
+
+__all__ = [
+    'CacheStats',
+    'ICacheBackend',
+    'MemoryCacheBackend',
+    'RedisCacheBackend',
+    'TTLCache',
+]
@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from app.cache.ttl_cache import CacheStats
+
+
+class ICacheBackend[V](ABC):
+    """Interface para backends de cache chave/valor com expiração"""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[V]:
+        """Busca um valor pela chave"""
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: V) -> None:
+        """Armazena um valor com a expiração padrão do backend"""
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove um valor"""
+        pass
+
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        """Contadores de hit/miss do backend"""
+        pass
@@ -0,0 +1,38 @@
+import time
+from typing import Callable, Optional
+
+from app.cache.cache_interface import ICacheBackend
+from app.cache.ttl_cache import CacheStats, TTLCache
+
+
+class MemoryCacheBackend[V](ICacheBackend[V]):
+    """Backend em memória do processo (LRU + TTL)
+
+    Em testes, ``clock`` permite controlar a expiração sem ``sleep``.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+        metrics_hook: Optional[Callable[[str], None]] = None,
+    ):
+        self._cache: TTLCache[str, V] = TTLCache(
+            max_size=max_size,
+            ttl=ttl,
+            clock=clock,
+            metrics_hook=metrics_hook,
+        )
+
+    async def get(self, key: str) -> Optional[V]:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: V) -> None:
+        self._cache.set(key, value)
+
+    async def delete(self, key: str) -> None:
+        self._cache.delete(key)
+
+    def stats(self) -> CacheStats:
+        return self._cache.stats()
@@ -0,0 +1,80 @@
+import logging
+from typing import Callable, Optional
+
+from app.cache.cache_interface import ICacheBackend
+from app.cache.ttl_cache import CacheStats
+
+logger = logging.getLogger(__name__)
+
+
+class RedisCacheBackend[V](ICacheBackend[V]):
+    """Backend compartilhado entre processos usando Redis
+
+    Requer o extra ``redis``. Falhas do Redis são tratadas como miss
+    para não derrubar as requisições. ``metrics_hook`` recebe ``'hit'``
+    ou ``'miss'``.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        url: str,
+        ttl: float,
+        dumps: Callable[[V], bytes],
+        loads: Callable[[bytes], V],
+        prefix: str = 'cache:',
+        *,
+        metrics_hook: Optional[Callable[[str], None]] = None,
+    ):
+        try:
+            from redis.asyncio import Redis  # noqa: PLC0415
+        except ImportError as e:
+            raise RuntimeError(
+                'O backend redis requer o pacote "redis" instalado.'
+            ) from e
+
+        # ``**kwargs`` de ``from_url`` não é tipado no pacote redis
+        self._client: Redis = Redis.from_url(url)  # pyright: ignore[reportUnknownMemberType]
+        self._ttl_ms = int(ttl * 1000)
+        self._dumps = dumps
+        self._loads = loads
+        self._prefix = prefix
+        self._hits = 0
+        self._misses = 0
+        self.metrics_hook = metrics_hook
+
+    async def get(self, key: str) -> Optional[V]:
+        try:
+            raw = await self._client.get(self._prefix + key)
+        except Exception:
+            logger.warning('Falha ao ler do cache redis', exc_info=True)
+            raw = None
+
+        if raw is None:
+            self._misses += 1
+            if self.metrics_hook is not None:
+                self.metrics_hook('miss')
+            return None
+
+        self._hits += 1
+        if self.metrics_hook is not None:
+            self.metrics_hook('hit')
+        return self._loads(raw if isinstance(raw, bytes) else raw.encode())
+
+    async def set(self, key: str, value: V) -> None:
+        try:
+            await self._client.set(
+                self._prefix + key, self._dumps(value), px=self._ttl_ms
+            )
+        except Exception:
+            logger.warning('Falha ao gravar no cache redis', exc_info=True)
+
+    async def delete(self, key: str) -> None:
+        try:
+            await self._client.delete(self._prefix + key)
+        except Exception:
+            logger.warning('Falha ao invalidar o cache redis', exc_info=True)
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self._hits, misses=self._misses, evictions=0, size=-1
+        )
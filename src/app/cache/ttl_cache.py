@@ -0,0 +1,99 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+
+@dataclass(slots=True, frozen=True)
+class CacheStats:
+    """Contadores de uso de um cache"""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class TTLCache[K, V]:
+    """Cache LRU em memória com limite de tamanho e expiração por item
+
+    Não é thread-safe: deve ser usado apenas a partir do event loop.
+    ``metrics_hook`` recebe ``'hit'``, ``'miss'`` ou ``'eviction'``.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+        metrics_hook: Optional[Callable[[str], None]] = None,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.metrics_hook = metrics_hook
+        self._clock = clock
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: K) -> Optional[V]:
+        """Retorna o valor ou ``None`` se ausente/expirado"""
+        item = self._data.get(key)
+        if item is None:
+            self._record_miss()
+            return None
+
+        expires_at, value = item
+        if expires_at <= self._clock():
+            del self._data[key]
+            self._record_miss()
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        if self.metrics_hook is not None:
+            self.metrics_hook('hit')
+        return value
+
+    def _record_miss(self) -> None:
+        self.misses += 1
+        if self.metrics_hook is not None:
+            self.metrics_hook('miss')
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        """Armazena o valor; ``ttl`` sobrescreve a expiração padrão"""
+        if self.max_size <= 0:
+            return
+
+        expires_at = self._clock() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self.evictions += 1
+            if self.metrics_hook is not None:
+                self.metrics_hook('eviction')
+
+    def delete(self, key: K) -> bool:
+        """Remove a chave; retorna se ela existia"""
+        return self._data.pop(key, None) is not None
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            size=len(self._data),
+        )
@@ -0,0 +1,82 @@
+"""Calibra os parâmetros do argon2 para um tempo alvo de verificação.
+
+Mantém ``memory_cost`` e ``parallelism`` e aumenta ``time_cost`` até a
+verificação atingir ``--target-ms`` neste host. Se nem ``time_cost=1``
+couber no alvo, reduz a memória pela metade. Imprime as variáveis de
+ambiente para o ``.env``.
+
+Uso:
+    python -m app.calibrate --target-ms 250
+"""
+
+import argparse
+import statistics
+import time
+
+from pwdlib.hashers.argon2 import Argon2Hasher
+
+MIN_MEMORY_COST = 8 * 1024
+MAX_TIME_COST = 20
+PASSWORD = 'calibration-password'
+
+
+def measure_verify_ms(hasher: Argon2Hasher, rounds: int) -> float:
+    """Mediana, em ms, de ``rounds`` verificações"""
+    hashed = hasher.hash(PASSWORD)
+    samples: list[float] = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        hasher.verify(PASSWORD, hashed)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def calibrate(
+    target_ms: float, memory_cost: int, parallelism: int, rounds: int
+) -> tuple[int, int, float]:
+    """Retorna ``(time_cost, memory_cost, ms)`` mais próximos do alvo"""
+    while True:
+        best = (1, memory_cost, 0.0)
+        for time_cost in range(1, MAX_TIME_COST + 1):
+            hasher = Argon2Hasher(
+                time_cost=time_cost,
+                memory_cost=memory_cost,
+                parallelism=parallelism,
+            )
+            elapsed = measure_verify_ms(hasher, rounds)
+            print(
+                f'  time_cost={time_cost:<3} memory_cost={memory_cost:<8} '
+                f'{elapsed:8.1f} ms'
+            )
+            if elapsed > target_ms:
+                break
+            best = (time_cost, memory_cost, elapsed)
+
+        if best[2] > 0 or memory_cost // 2 < MIN_MEMORY_COST:
+            return best
+        memory_cost //= 2
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument('--target-ms', type=float, default=250.0)
+    parser.add_argument(
+        '--memory-cost', type=int, default=65536, help='em KiB'
+    )
+    parser.add_argument('--parallelism', type=int, default=4)
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    time_cost, memory_cost, elapsed = calibrate(
+        args.target_ms, args.memory_cost, args.parallelism, args.rounds
+    )
+    print(f'verificação em {elapsed:.1f} ms (alvo {args.target_ms:.0f} ms)')
+    print(f'PASSWORD_ARGON2_TIME_COST={time_cost}')
+    print(f'PASSWORD_ARGON2_MEMORY_COST={memory_cost}')
+    print(f'PASSWORD_ARGON2_PARALLELISM={args.parallelism}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,7 @@
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import Annotated, Any, Literal, Optional
+
+from pydantic import field_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 from app.constants import Environment
 
@@ -13,12 +16,91 @@ class Settings(BaseSettings):
 
     ENVIRONMENT: Environment = Environment.LOCAL
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 100
+    DB_POOL_WARMUP_CONNECTIONS: int = 2
+    DB_MAX_CONNECTIONS: Optional[int] = None
+    DB_RESERVED_CONNECTIONS: int = 5
+    DATABASE_REPLICA_URLS: Annotated[list[str], NoDecode] = []
+    DB_REPLICA_STRATEGY: Literal['round_robin', 'least_connections'] = (
+        'round_robin'
+    )
+    DB_REPLICA_HEALTH_CHECK_INTERVAL: float = 5.0
+    DB_REPLICA_HEALTH_CHECK_TIMEOUT: float = 1.0
+    READINESS_CHECK_TIMEOUT: float = 1.0
+    READINESS_CACHE_TTL: float = 1.0
+    READINESS_MAX_POOL_WAIT: float = 0.5
     JWT_SECRET_KEY: str
     API_PREFIX: str = '/api/v1'
+    SERVER_HOST: str = '127.0.0.1'
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: Optional[int] = None
+    SERVER_GRACEFUL_TIMEOUT: float = 30.0
+    SERVER_KEEP_ALIVE: int = 65
+    SERVER_FORWARDED_ALLOW_IPS: str = '127.0.0.1'
+    COMPRESSION_MINIMUM_SIZE: int = 1024
     JWT_ALGORITHM: str = 'HS512'
-    JWT_EXPIRATION: int = 1
+    JWT_KEYS_DIR: Optional[str] = None
+    JWT_ACTIVE_KEY_ID: Optional[str] = None
+    JWT_JWKS_MAX_AGE: int = 300
+    JWT_ACCESS_TOKEN_TTL: int = 900
+    JWT_REFRESH_TOKEN_TTL: int = 30 * 86_400
     JWT_ISSUER: str = 'fastapi-jwt-auth'
     JWT_AUDIENCE: str = 'fastapi-jwt-auth'
+    JWT_LEEWAY: int = 0
+    JWT_CACHE_MAX_SIZE: int = 10_000
+    TOKEN_REVOCATION_POLL_INTERVAL: float = 2.0
+    USER_EXPORT_BATCH_SIZE: int = 1000
+    USER_IMPORT_BATCH_SIZE: int = 500
+    USER_IMPORT_HASH_CONCURRENCY: int = 4
+    USER_CACHE_BACKEND: Literal['memory', 'redis'] = 'memory'
+    USER_CACHE_TTL: float = 60.0
+    USER_CACHE_MAX_SIZE: int = 10_000
+    CACHE_REDIS_URL: Optional[str] = None
+    USER_LOADER_WINDOW: float = 0.0
+    USER_SOFT_DELETE: bool = True
+    USER_PURGE_ENABLED: bool = True
+    USER_PURGE_RETENTION: float = 30 * 86_400.0
+    USER_PURGE_INTERVAL: float = 3600.0
+    USER_PURGE_BATCH_SIZE: int = 500
+    USER_LOADER_MAX_BATCH_SIZE: int = 100
+    IDEMPOTENCY_BACKEND: Literal['memory', 'database'] = 'memory'
+    IDEMPOTENCY_TTL: float = 86_400.0
+    IDEMPOTENCY_MAX_SIZE: int = 10_000
+    IDEMPOTENCY_CLAIM_TTL: float = 30.0
+    IDEMPOTENCY_POLL_INTERVAL: float = 0.05
+    IDEMPOTENCY_PURGE_INTERVAL: float = 3600.0
+    IDEMPOTENCY_PURGE_BATCH_SIZE: int = 500
+    PASSWORD_HASHER_EXECUTOR: Literal['thread', 'process'] = 'thread'
+    PASSWORD_HASHER_WORKERS: int = 4
+    PASSWORD_HASHER_QUEUE_SIZE: int = 64
+    PASSWORD_ARGON2_TIME_COST: int = 3
+    PASSWORD_ARGON2_MEMORY_COST: int = 65536
+    PASSWORD_ARGON2_PARALLELISM: int = 4
+    LOGIN_NEGATIVE_CACHE_TTL: float = 10.0
+    LOGIN_NEGATIVE_CACHE_MAX_SIZE: int = 10_000
+    LOGIN_RATE_LIMIT_ENABLED: bool = True
+    LOGIN_RATE_LIMIT_BACKEND: Literal['memory', 'redis'] = 'memory'
+    LOGIN_RATE_LIMIT_MAX_KEYS: int = 100_000
+    LOGIN_RATE_LIMIT_IP_BURST: int = 20
+    LOGIN_RATE_LIMIT_IP_PER_SECOND: float = 1.0
+    LOGIN_RATE_LIMIT_ACCOUNT_BURST: int = 5
+    LOGIN_RATE_LIMIT_ACCOUNT_PER_SECOND: float = 0.1
+    METRICS_ENABLED: bool = True
+    METRICS_LOOP_LAG_INTERVAL: float = 0.1
+    METRICS_SLOW_CALLBACK_THRESHOLD: float = 0.1
+
+    @field_validator('DATABASE_REPLICA_URLS', mode='before')
+    @classmethod
+    def split_replica_urls(cls, value: Any) -> Any:
+        """Aceita as URLs separadas por vírgula"""
+        if isinstance(value, str):
+            return [url.strip() for url in value.split(',') if url.strip()]
+        return value
 
 
 settings: Settings = Settings()  # type: ignore
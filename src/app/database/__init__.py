@@ -1,4 +1,23 @@
-from .base import engine, table_registry
-from .session import get_async_session
+from .base import dispose_engines, get_engine, get_replica_set, table_registry
+from .pool import PoolStats, get_pool_stats
+from .readiness import Readiness, ReadinessProbe
+from .replicas import ReplicaSet, RoutingSession
+from .session import async_session, get_async_session, get_sessionmaker
+from .warmup import warm_up_pool
 
-__all__ = ['engine', 'table_registry', 'get_async_session']
+__all__ = [
+    'PoolStats',
+    'Readiness',
+    'ReadinessProbe',
+    'ReplicaSet',
+    'RoutingSession',
+    'async_session',
+    'dispose_engines',
+    'get_async_session',
+    'get_engine',
+    'get_pool_stats',
+    'get_replica_set',
+    'get_sessionmaker',
+    'table_registry',
+    'warm_up_pool',
+]
@@ -1,14 +1,83 @@
-from sqlalchemy import MetaData
-from sqlalchemy.ext.asyncio import create_async_engine
+from functools import cache
+from typing import Any
+
+from sqlalchemy import MetaData, event, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlalchemy.orm import registry
 
 from app.config import settings
 from app.constants import DB_NAMING_CONVENTION, Environment
+from app.database.pool import InstrumentedQueuePool
+from app.database.replicas import ReplicaSet
 
 metadata = MetaData(naming_convention=DB_NAMING_CONVENTION)
 table_registry = registry(metadata=metadata)
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.ENVIRONMENT == Environment.LOCAL,
-    future=True,
-)
+
+
+def _configure_prepared_statements(
+    dbapi_connection: Any, connection_record: Any
+) -> None:
+    """Ajusta o cache de prepared statements do psycopg"""
+    connection = dbapi_connection.driver_connection
+    if settings.DB_PREPARED_STATEMENT_CACHE_SIZE > 0:
+        connection.prepared_max = settings.DB_PREPARED_STATEMENT_CACHE_SIZE
+    else:
+        connection.prepare_threshold = None
+
+
+def _build_engine(url: str) -> AsyncEngine:
+    driver = make_url(url).get_driver_name()
+    connect_args: dict[str, Any] = {}
+    if driver == 'asyncpg':
+        connect_args['prepared_statement_cache_size'] = (
+            settings.DB_PREPARED_STATEMENT_CACHE_SIZE
+        )
+
+    async_engine = create_async_engine(
+        url,
+        echo=settings.ENVIRONMENT == Environment.LOCAL,
+        future=True,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args=connect_args,
+    )
+    if driver == 'psycopg':
+        event.listen(
+            async_engine.sync_engine,
+            'connect',
+            _configure_prepared_statements,
+        )
+    return async_engine
+
+
+@cache
+def get_engine() -> AsyncEngine:
+    """Engine do banco primário, criada no primeiro uso
+
+    Importar o pacote não cria a engine nem carrega o driver; o
+    ``lifespan`` da aplicação a cria e aquece na inicialização.
+    """
+    return _build_engine(settings.DATABASE_URL)
+
+
+@cache
+def get_replica_set() -> ReplicaSet:
+    """Réplicas de ``DATABASE_REPLICA_URLS``, criadas no primeiro uso"""
+    return ReplicaSet(
+        [_build_engine(url) for url in settings.DATABASE_REPLICA_URLS],
+        strategy=settings.DB_REPLICA_STRATEGY,
+        health_check_interval=settings.DB_REPLICA_HEALTH_CHECK_INTERVAL,
+        health_check_timeout=settings.DB_REPLICA_HEALTH_CHECK_TIMEOUT,
+    )
+
+
+async def dispose_engines() -> None:
+    """Fecha as conexões do primário e das réplicas já criados"""
+    if get_replica_set.cache_info().currsize:
+        await get_replica_set().dispose()
+    if get_engine.cache_info().currsize:
+        await get_engine().dispose()
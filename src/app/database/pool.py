@@ -0,0 +1,72 @@
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+
+@dataclass(slots=True)
+class PoolStats:
+    """Retrato do estado do pool de conexões"""
+
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    wait_time_total: float
+    wait_time_max: float
+    wait_time_last: float
+
+    @property
+    def wait_time_avg(self) -> float:
+        return self.wait_time_total / self.checkouts if self.checkouts else 0.0
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Pool assíncrono que mede o tempo de espera por uma conexão"""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+        self.wait_time_last = 0.0
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            elapsed = time.perf_counter() - started
+            self.checkouts += 1
+            self.wait_time_total += elapsed
+            self.wait_time_last = elapsed
+            self.wait_time_max = max(self.wait_time_max, elapsed)
+
+
+def get_pool_stats(engine: AsyncEngine) -> PoolStats:
+    """Coleta as estatísticas do pool da engine informada"""
+    pool = engine.sync_engine.pool
+    stats = PoolStats(
+        size=0,
+        checked_in=0,
+        checked_out=0,
+        overflow=0,
+        checkouts=0,
+        wait_time_total=0.0,
+        wait_time_max=0.0,
+        wait_time_last=0.0,
+    )
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        stats.size = pool.size()
+        stats.checked_in = pool.checkedin()
+        stats.checked_out = pool.checkedout()
+        stats.overflow = max(0, pool.overflow())
+    if isinstance(pool, InstrumentedQueuePool):
+        stats.checkouts = pool.checkouts
+        stats.wait_time_total = pool.wait_time_total
+        stats.wait_time_max = pool.wait_time_max
+        stats.wait_time_last = pool.wait_time_last
+    return stats
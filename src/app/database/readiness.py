@@ -0,0 +1,119 @@
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.database.pool import PoolStats, get_pool_stats
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class Readiness:
+    """Resultado de uma verificação de prontidão"""
+
+    ready: bool
+    reason: Optional[str]
+    pool: PoolStats
+    pool_wait_recent: float
+    checked_at: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'status': 'ready' if self.ready else 'not_ready',
+            'reason': self.reason,
+            'pool': {
+                'size': self.pool.size,
+                'checked_out': self.pool.checked_out,
+                'overflow': self.pool.overflow,
+                'wait_recent': round(self.pool_wait_recent, 6),
+                'wait_max': round(self.pool.wait_time_max, 6),
+            },
+        }
+
+
+class ReadinessProbe:
+    """Verifica se a instância pode receber tráfego
+
+    Executa ``SELECT 1`` numa conexão do pool com ``timeout`` e compara
+    a espera média por conexão desde a verificação anterior com
+    ``max_pool_wait``: acima dele o pool está saturado e a instância se
+    declara indisponível antes que a latência dispare. O resultado fica
+    em cache por ``cache_ttl`` segundos e verificações simultâneas
+    compartilham a mesma execução.
+    """
+
+    def __init__(
+        self,
+        engine: Callable[[], AsyncEngine],
+        timeout: float = 1.0,
+        cache_ttl: float = 1.0,
+        max_pool_wait: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._engine = engine
+        self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self.max_pool_wait = max_pool_wait
+        self._clock = clock
+        self._last: Optional[Readiness] = None
+        self._pending: Optional[asyncio.Task[Readiness]] = None
+        self._wait_baseline = (0, 0.0)
+
+    async def check(self) -> Readiness:
+        last = self._last
+        if (
+            last is not None
+            and self._clock() - last.checked_at < self.cache_ttl
+        ):
+            return last
+        if self._pending is None:
+            self._pending = asyncio.get_running_loop().create_task(
+                self._check()
+            )
+            self._pending.add_done_callback(self._clear_pending)
+        return await asyncio.shield(self._pending)
+
+    def _clear_pending(self, task: asyncio.Task[Readiness]) -> None:
+        self._pending = None
+
+    async def _check(self) -> Readiness:
+        engine = self._engine()
+        reason: Optional[str] = None
+        try:
+            async with asyncio.timeout(self.timeout):
+                async with engine.connect() as connection:
+                    await connection.execute(text('SELECT 1'))
+        except TimeoutError:
+            reason = 'database_timeout'
+        except Exception as e:
+            logger.warning('Verificação de prontidão falhou: %r', e)
+            reason = 'database_error'
+
+        stats = get_pool_stats(engine)
+        pool_wait_recent = self._recent_pool_wait(stats)
+        if reason is None and pool_wait_recent > self.max_pool_wait:
+            reason = 'pool_saturated'
+
+        self._last = Readiness(
+            ready=reason is None,
+            reason=reason,
+            pool=stats,
+            pool_wait_recent=pool_wait_recent,
+            checked_at=self._clock(),
+        )
+        return self._last
+
+    def _recent_pool_wait(self, stats: PoolStats) -> float:
+        """Espera média por conexão desde a verificação anterior"""
+        checkouts, wait_time_total = self._wait_baseline
+        self._wait_baseline = (stats.checkouts, stats.wait_time_total)
+        new_checkouts = stats.checkouts - checkouts
+        if new_checkouts <= 0:
+            return 0.0
+        return (stats.wait_time_total - wait_time_total) / new_checkouts
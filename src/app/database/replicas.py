@@ -0,0 +1,166 @@
+import asyncio
+import itertools
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Literal, Optional, Union
+
+from sqlalchemy import ClauseElement, Connection, Engine, event, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.base import Executable
+
+logger = logging.getLogger(__name__)
+
+type ReplicaStrategy = Literal['round_robin', 'least_connections']
+
+PRIMARY_ONLY_KEY = 'primary_only'
+PRIMARY_OPTION = 'primary'
+
+
+@dataclass(slots=True)
+class Replica:
+    index: int
+    engine: AsyncEngine
+    healthy: bool = True
+
+
+def _disconnect_listener(replica: Replica) -> Callable[[Any], None]:
+    def handle_error(context: Any) -> None:
+        if context.is_disconnect and replica.healthy:
+            replica.healthy = False
+            logger.warning('Réplica %d desconectada', replica.index)
+
+    return handle_error
+
+
+class ReplicaSet:
+    """Réplicas de leitura com seleção por estratégia e health check
+
+    Uma task periódica executa ``SELECT 1`` em cada réplica; réplicas que
+    falham (ou que sinalizam desconexão numa query) ficam fora da
+    rotação até voltarem a responder. Sem réplicas saudáveis, ``pick``
+    devolve ``None`` e a leitura volta para o primário.
+    """
+
+    def __init__(
+        self,
+        engines: list[AsyncEngine],
+        strategy: ReplicaStrategy = 'round_robin',
+        health_check_interval: float = 5.0,
+        health_check_timeout: float = 1.0,
+    ):
+        self.replicas = [
+            Replica(index=i, engine=engine) for i, engine in enumerate(engines)
+        ]
+        self.strategy = strategy
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+        self._counter = itertools.count()
+        self._task: Optional[asyncio.Task[None]] = None
+        for replica in self.replicas:
+            event.listen(
+                replica.engine.sync_engine,
+                'handle_error',
+                _disconnect_listener(replica),
+            )
+
+    def __bool__(self) -> bool:
+        return bool(self.replicas)
+
+    def pick(self) -> Optional[Engine]:
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            return None
+        if self.strategy == 'least_connections':
+            chosen = min(
+                healthy,
+                key=lambda r: r.engine.sync_engine.pool.checkedout(),  # type: ignore
+            )
+        else:
+            chosen = healthy[next(self._counter) % len(healthy)]
+        return chosen.engine.sync_engine
+
+    async def _check(self, replica: Replica) -> None:
+        try:
+            async with asyncio.timeout(self.health_check_timeout):
+                async with replica.engine.connect() as connection:
+                    await connection.execute(text('SELECT 1'))
+        except Exception as e:
+            if replica.healthy:
+                logger.warning(
+                    'Réplica %d fora de rotação: %r', replica.index, e
+                )
+            replica.healthy = False
+        else:
+            if not replica.healthy:
+                logger.info('Réplica %d de volta à rotação', replica.index)
+            replica.healthy = True
+
+    async def check_health(self) -> None:
+        await asyncio.gather(*(self._check(r) for r in self.replicas))
+
+    async def _run_health_checks(self) -> None:
+        while True:
+            await self.check_health()
+            await asyncio.sleep(self.health_check_interval)
+
+    def start_health_checks(self) -> None:
+        if self.replicas and self._task is None:
+            self._task = asyncio.get_running_loop().create_task(
+                self._run_health_checks()
+            )
+
+    async def stop_health_checks(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def dispose(self) -> None:
+        await self.stop_health_checks()
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+
+class RoutingSession(Session):
+    """Sessão que envia leituras para as réplicas
+
+    ``SELECT`` vai para uma réplica enquanto a sessão não escreveu nada.
+    Depois do primeiro flush ou escrita, todas as queries da sessão (uma
+    por requisição) ficam no primário, garantindo leitura das próprias
+    escritas. Um ``SELECT`` que precisa do primário (ex.: ``FOR UPDATE``
+    ou leituras que alimentam caches) deve usar
+    ``.execution_options(primary=True)``.
+    """
+
+    def __init__(
+        self, *args: Any, replicas: Optional[ReplicaSet] = None, **kwargs: Any
+    ):
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas
+
+    def get_bind(
+        self,
+        mapper: Any = None,
+        *,
+        clause: Optional[ClauseElement] = None,
+        **kwargs: Any,
+    ) -> Union[Engine, Connection]:
+        if self.replicas and not self.info.get(PRIMARY_ONLY_KEY):
+            is_read = (
+                isinstance(clause, Executable)
+                and clause.is_select
+                and not self._flushing
+                and not clause.get_execution_options().get(PRIMARY_OPTION)
+            )
+            if is_read:
+                replica = self.replicas.pick()
+                if replica is not None:
+                    return replica
+            else:
+                self.info[PRIMARY_ONLY_KEY] = True
+        return super().get_bind(mapper, clause=clause, **kwargs)
@@ -1,13 +1,28 @@
 from collections.abc import AsyncIterator
+from functools import cache
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.database import engine
+from app.database.base import get_engine, get_replica_set
+from app.database.replicas import RoutingSession
 
 
-async def get_async_session() -> AsyncIterator[AsyncSession]:
-    async_session = async_sessionmaker(
-        engine, class_=AsyncSession, expire_on_commit=False
+@cache
+def get_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        get_engine(),
+        class_=AsyncSession,
+        sync_session_class=RoutingSession,
+        expire_on_commit=False,
+        replicas=get_replica_set(),
     )
+
+
+def async_session() -> AsyncSession:
+    """Abre uma sessão; a engine é criada na primeira chamada"""
+    return get_sessionmaker()()
+
+
+async def get_async_session() -> AsyncIterator[AsyncSession]:
     async with async_session() as session:
         yield session
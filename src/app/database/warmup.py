@@ -0,0 +1,90 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from contextlib import AsyncExitStack
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+type StatementPrimer = Callable[[AsyncConnection], Awaitable[None]]
+
+
+async def _prepare_threshold(connection: AsyncConnection) -> int:
+    """Execuções até o psycopg preparar uma query (1 nos demais drivers)"""
+    raw_connection = await connection.get_raw_connection()
+    threshold = getattr(
+        raw_connection.driver_connection, 'prepare_threshold', 1
+    )
+    return max(1, threshold or 1)
+
+
+async def _warm_connection(
+    connection: AsyncConnection, primer: Optional[StatementPrimer]
+) -> None:
+    if primer is None:
+        return
+    for _ in range(await _prepare_threshold(connection)):
+        await primer(connection)
+    await connection.rollback()
+
+
+async def warm_up_pool(
+    engine: AsyncEngine,
+    connections: int,
+    primer: Optional[StatementPrimer] = None,
+    timeout: float = 10.0,
+) -> int:
+    """Abre ``connections`` conexões do pool e prepara as queries quentes
+
+    As conexões são abertas em paralelo e devolvidas ao pool ao final.
+    ``primer`` executa as queries mais usadas em cada conexão, o que
+    aquece o cache de compilação do SQLAlchemy e os prepared statements
+    do driver. Falhas e estouro de ``timeout`` são registrados e não
+    impedem a inicialização.
+
+    Returns:
+        int: Número de conexões aquecidas
+    """
+    if connections <= 0:
+        return 0
+
+    try:
+        async with asyncio.timeout(timeout):
+            return await _open_and_prime(engine, connections, primer)
+    except TimeoutError:
+        logger.warning('Aquecimento do pool excedeu %.1fs', timeout)
+        return 0
+
+
+async def _open_and_prime(
+    engine: AsyncEngine,
+    connections: int,
+    primer: Optional[StatementPrimer],
+) -> int:
+    async with AsyncExitStack() as stack:
+        results = await asyncio.gather(
+            *(
+                stack.enter_async_context(engine.connect())
+                for _ in range(connections)
+            ),
+            return_exceptions=True,
+        )
+        opened = [r for r in results if isinstance(r, AsyncConnection)]
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            logger.warning(
+                'Aquecimento abriu %d de %d conexões: %r',
+                len(opened),
+                connections,
+                errors[0],
+            )
+
+        try:
+            await asyncio.gather(
+                *(_warm_connection(c, primer) for c in opened)
+            )
+        except Exception:
+            logger.warning('Falha ao preparar as queries', exc_info=True)
+        return len(opened)
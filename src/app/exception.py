@@ -1,3 +1,4 @@
+import math
 from http import HTTPStatus
 from typing import Any, Optional
 
@@ -45,6 +46,11 @@ class Conflict(DetailedHTTPException):
     DETAIL = 'Ops! Ocorreu um erro inesperado, tente novamente mais tarde.'
 
 
+class UnprocessableEntity(DetailedHTTPException):
+    STATUS_CODE = HTTPStatus.UNPROCESSABLE_ENTITY
+    DETAIL = 'Ops! Não foi possível processar a requisição.'
+
+
 class ServerError(DetailedHTTPException):
     STATUS_CODE = HTTPStatus.INTERNAL_SERVER_ERROR
     DETAIL = (
@@ -58,3 +64,21 @@ class NotAuthenticated(DetailedHTTPException):
 
     def __init__(self) -> None:
         super().__init__(headers={'WWW-Authenticate': 'Bearer'})
+
+
+class ServiceUnavailable(DetailedHTTPException):
+    STATUS_CODE = HTTPStatus.SERVICE_UNAVAILABLE
+    DETAIL = 'Ops! Estamos sobrecarregados, tente novamente em instantes.'
+
+    def __init__(self) -> None:
+        super().__init__(headers={'Retry-After': '1'})
+
+
+class TooManyRequests(DetailedHTTPException):
+    STATUS_CODE = HTTPStatus.TOO_MANY_REQUESTS
+    DETAIL = 'Ops! Muitas tentativas, tente novamente em instantes.'
+
+    def __init__(self, retry_after: float = 1) -> None:
+        super().__init__(
+            headers={'Retry-After': str(max(1, math.ceil(retry_after)))}
+        )
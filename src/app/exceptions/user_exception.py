@@ -1,4 +1,4 @@
-from app.exception import Conflict, NotAuthenticated
+from app.exception import Conflict, NotAuthenticated, PermissionDenied
 
 
 class UserEmailAlreadyExists(Conflict):
@@ -9,5 +9,15 @@ class UserPhoneAlreadyExists(Conflict):
     DETAIL = 'Telefone já cadastrado.'
 
 
+class UserModifiedConcurrently(Conflict):
+    DETAIL = (
+        'Usuário alterado por outra requisição. Recarregue e tente novamente.'
+    )
+
+
 class UserNotAuthenticated(NotAuthenticated):
     DETAIL = 'Senha ou e-mail incorretos.'
+
+
+class UserNotAdmin(PermissionDenied):
+    DETAIL = 'Ops! Este recurso é restrito a administradores.'
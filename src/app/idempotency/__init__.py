@@ -0,0 +1,15 @@
+from .database_store import DatabaseIdempotencyStore
+from .idempotency_manager import IdempotencyKeyReused, IdempotencyManager
+from .idempotency_purge_job import IdempotencyPurgeJob
+from .idempotency_store_interface import IdempotentResponse, IIdempotencyStore
+from .memory_store import MemoryIdempotencyStore
+
+__all__ = [
+    'DatabaseIdempotencyStore',
+    'IIdempotencyStore',
+    'IdempotencyKeyReused',
+    'IdempotencyManager',
+    'IdempotencyPurgeJob',
+    'IdempotentResponse',
+    'MemoryIdempotencyStore',
+]
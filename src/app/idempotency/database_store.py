@@ -0,0 +1,128 @@
+from datetime import UTC, datetime, timedelta
+from typing import Callable, Optional
+
+from sqlalchemy import delete, func, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.idempotency.idempotency_store_interface import (
+    PENDING_STATUS_CODE,
+    IdempotentResponse,
+    IIdempotencyStore,
+)
+from app.models import IdempotencyKey
+
+
+class DatabaseIdempotencyStore(IIdempotencyStore):
+    """Respostas na tabela ``tb_idempotency_keys``, visíveis a todos os
+    workers
+
+    Cada operação usa uma sessão própria no primário, independente da
+    transação da requisição. ``claim`` grava uma reserva pendente com
+    ``INSERT ... ON CONFLICT``, então só um worker executa cada chave; a
+    reserva vale ``claim_ttl`` segundos, para que a queda de um worker
+    não bloqueie a chave por todo o ``ttl``. Uma chave expirada é
+    sobrescrita na próxima reserva ou apagada por ``purge_expired``.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        ttl: float,
+        claim_ttl: float = 30.0,
+    ):
+        self._session_factory = session_factory
+        self._ttl = timedelta(seconds=ttl)
+        self._claim_ttl = timedelta(seconds=claim_ttl)
+
+    async def claim(
+        self, key: str, request_hash: str
+    ) -> Optional[IdempotentResponse]:
+        values = {
+            'request_hash': request_hash,
+            'status_code': PENDING_STATUS_CODE,
+            'body': b'',
+            'media_type': None,
+            'expires_at': datetime.now(UTC) + self._claim_ttl,
+        }
+        statement = (
+            insert(IdempotencyKey)
+            .values(key=key, **values)
+            .on_conflict_do_update(
+                index_elements=[IdempotencyKey.key],
+                set_=values,
+                where=IdempotencyKey.expires_at <= func.now(),
+            )
+            .returning(IdempotencyKey.key)
+        )
+        existing = (
+            select(IdempotencyKey)
+            .where(
+                IdempotencyKey.key == key,
+                IdempotencyKey.expires_at > func.now(),
+            )
+            .execution_options(primary=True)
+        )
+        async with self._session_factory() as session:
+            while True:
+                if await session.scalar(statement) is not None:
+                    await session.commit()
+                    return None
+                record = await session.scalar(existing)
+                await session.commit()
+                # Se a reserva foi desfeita entre as duas queries, tenta
+                # de novo
+                if record is not None:
+                    return IdempotentResponse(
+                        request_hash=record.request_hash,
+                        status_code=record.status_code,
+                        body=record.body,
+                        media_type=record.media_type,
+                    )
+
+    async def set(self, key: str, response: IdempotentResponse) -> None:
+        values = {
+            'request_hash': response.request_hash,
+            'status_code': response.status_code,
+            'body': response.body,
+            'media_type': response.media_type,
+            'expires_at': datetime.now(UTC) + self._ttl,
+        }
+        statement = insert(IdempotencyKey).values(key=key, **values)
+        statement = statement.on_conflict_do_update(
+            index_elements=[IdempotencyKey.key],
+            set_=values,
+            where=or_(
+                IdempotencyKey.status_code == PENDING_STATUS_CODE,
+                IdempotencyKey.expires_at <= func.now(),
+            ),
+        )
+        async with self._session_factory() as session:
+            await session.execute(statement)
+            await session.commit()
+
+    async def release(self, key: str) -> None:
+        statement = delete(IdempotencyKey).where(
+            IdempotencyKey.key == key,
+            IdempotencyKey.status_code == PENDING_STATUS_CODE,
+        )
+        async with self._session_factory() as session:
+            await session.execute(statement)
+            await session.commit()
+
+    async def purge_expired(self, limit: int) -> int:
+        """Apaga até ``limit`` chaves expiradas; retorna quantas"""
+        batch = (
+            select(IdempotencyKey.key)
+            .where(IdempotencyKey.expires_at <= func.now())
+            .order_by(IdempotencyKey.expires_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        statement = delete(IdempotencyKey).where(
+            IdempotencyKey.key.in_(batch.scalar_subquery())
+        )
+        async with self._session_factory() as session:
+            result = await session.execute(statement)
+            await session.commit()
+        return result.rowcount  # type: ignore
@@ -0,0 +1,121 @@
+import asyncio
+import hashlib
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import Optional
+
+from fastapi.responses import Response
+
+from app.exception import UnprocessableEntity
+from app.idempotency.idempotency_store_interface import (
+    IdempotentResponse,
+    IIdempotencyStore,
+)
+
+REPLAYED_HEADER = 'Idempotent-Replayed'
+
+
+class IdempotencyKeyReused(UnprocessableEntity):
+    DETAIL = 'Idempotency-Key já utilizada com outro corpo de requisição.'
+
+
+@dataclass(slots=True)
+class _InFlight:
+    request_hash: str
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+    response: Optional[IdempotentResponse] = None
+    error: Optional[Exception] = None
+
+
+class IdempotencyManager:
+    """Executa uma vez cada ``Idempotency-Key`` e repete a resposta
+
+    A resposta é guardada junto com o hash do corpo; repetir a chave com
+    outro corpo resulta em 422. Requisições concorrentes com a mesma
+    chave aguardam a que está em andamento: neste processo, por um
+    evento; em outro worker, consultando a reserva no store a cada
+    ``poll_interval`` segundos. Respostas 5xx não são guardadas e a
+    reserva é desfeita, para que o cliente possa tentar novamente.
+    """
+
+    def __init__(self, store: IIdempotencyStore, poll_interval: float = 0.05):
+        self._store = store
+        self._poll_interval = poll_interval
+        self._in_flight: dict[str, _InFlight] = {}
+
+    @staticmethod
+    def hash_body(body: bytes) -> str:
+        return hashlib.sha256(body).hexdigest()
+
+    async def execute(
+        self,
+        key: str,
+        body: bytes,
+        handler: Callable[[], Awaitable[Response]],
+    ) -> Response:
+        """Executa ``handler`` ou devolve a resposta já registrada
+
+        Raises:
+            IdempotencyKeyReused: Se a chave foi usada com outro corpo
+        """
+        request_hash = self.hash_body(body)
+
+        while (in_flight := self._in_flight.get(key)) is not None:
+            self._check_hash(in_flight.request_hash, request_hash)
+            await in_flight.done.wait()
+            if in_flight.error is not None:
+                raise in_flight.error
+            if in_flight.response is not None:
+                return self._replay(in_flight.response)
+            # A execução original foi cancelada: tenta assumir a chave
+
+        in_flight = _InFlight(request_hash)
+        self._in_flight[key] = in_flight
+        try:
+            while (
+                stored := await self._store.claim(key, request_hash)
+            ) is not None:
+                self._check_hash(stored.request_hash, request_hash)
+                if not stored.pending:
+                    in_flight.response = stored
+                    return self._replay(stored)
+                # Em andamento em outro worker
+                await asyncio.sleep(self._poll_interval)
+
+            try:
+                response = await handler()
+            except BaseException:
+                await self._store.release(key)
+                raise
+            in_flight.response = IdempotentResponse(
+                request_hash=request_hash,
+                status_code=response.status_code,
+                body=bytes(response.body),
+                media_type=response.media_type,
+            )
+            if response.status_code < HTTPStatus.INTERNAL_SERVER_ERROR:
+                await self._store.set(key, in_flight.response)
+            else:
+                await self._store.release(key)
+            return response
+        except Exception as e:
+            in_flight.error = e
+            raise
+        finally:
+            del self._in_flight[key]
+            in_flight.done.set()
+
+    @staticmethod
+    def _check_hash(expected: str, received: str) -> None:
+        if expected != received:
+            raise IdempotencyKeyReused()
+
+    @staticmethod
+    def _replay(stored: IdempotentResponse) -> Response:
+        return Response(
+            content=stored.body,
+            status_code=stored.status_code,
+            media_type=stored.media_type,
+            headers={REPLAYED_HEADER: 'true'},
+        )
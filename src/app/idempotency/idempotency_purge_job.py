@@ -0,0 +1,63 @@
+import asyncio
+import logging
+from typing import Optional
+
+from app.idempotency.database_store import DatabaseIdempotencyStore
+
+logger = logging.getLogger(__name__)
+
+
+class IdempotencyPurgeJob:
+    """Apaga em lotes as chaves de idempotência expiradas
+
+    A cada ``interval`` segundos apaga lotes de até ``batch_size``
+    linhas de ``tb_idempotency_keys``, usando o índice de
+    ``expires_at``, até não restar nada expirado.
+    """
+
+    def __init__(
+        self,
+        store: DatabaseIdempotencyStore,
+        interval: float = 3600.0,
+        batch_size: int = 500,
+    ):
+        self._store = store
+        self.interval = interval
+        self.batch_size = batch_size
+        self._task: Optional[asyncio.Task[None]] = None
+
+    async def run_once(self) -> int:
+        """Purga tudo o que já expirou; retorna a quantidade apagada"""
+        total = 0
+        while True:
+            purged = await self._store.purge_expired(self.batch_size)
+            total += purged
+            if purged < self.batch_size:
+                return total
+            # Cede o loop entre lotes
+            await asyncio.sleep(0)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                purged = await self.run_once()
+                if purged:
+                    logger.info('%d chaves de idempotência purgadas', purged)
+            except Exception:
+                logger.warning(
+                    'Falha ao purgar chaves de idempotência', exc_info=True
+                )
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -0,0 +1,45 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional
+
+# Marca uma chave reservada cuja requisição ainda está em andamento
+PENDING_STATUS_CODE = 0
+
+
+@dataclass(slots=True, frozen=True)
+class IdempotentResponse:
+    """Resposta armazenada para uma chave de idempotência"""
+
+    request_hash: str
+    status_code: int
+    body: bytes
+    media_type: Optional[str] = None
+
+    @property
+    def pending(self) -> bool:
+        return self.status_code == PENDING_STATUS_CODE
+
+
+class IIdempotencyStore(ABC):
+    """Interface para armazenamento de respostas idempotentes"""
+
+    @abstractmethod
+    async def claim(
+        self, key: str, request_hash: str
+    ) -> Optional[IdempotentResponse]:
+        """Reserva a chave para executar a requisição
+
+        Retorna ``None`` se a reserva foi feita; caso contrário, o
+        registro atual da chave (resposta guardada ou reserva pendente).
+        """
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, response: IdempotentResponse) -> None:
+        """Armazena a resposta da chave, substituindo a reserva"""
+        pass
+
+    @abstractmethod
+    async def release(self, key: str) -> None:
+        """Desfaz a reserva de uma execução que não gerou resposta"""
+        pass
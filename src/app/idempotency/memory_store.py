@@ -0,0 +1,48 @@
+import time
+from typing import Callable, Optional
+
+from app.cache.ttl_cache import TTLCache
+from app.idempotency.idempotency_store_interface import (
+    PENDING_STATUS_CODE,
+    IdempotentResponse,
+    IIdempotencyStore,
+)
+
+
+class MemoryIdempotencyStore(IIdempotencyStore):
+    """Respostas na memória do processo (LRU + TTL)
+
+    Não é compartilhado entre workers: uma repetição atendida por outro
+    processo é executada de novo.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._cache: TTLCache[str, IdempotentResponse] = TTLCache(
+            max_size=max_size, ttl=ttl, clock=clock
+        )
+
+    async def claim(
+        self, key: str, request_hash: str
+    ) -> Optional[IdempotentResponse]:
+        existing = self._cache.get(key)
+        if existing is None:
+            self._cache.set(
+                key,
+                IdempotentResponse(
+                    request_hash=request_hash,
+                    status_code=PENDING_STATUS_CODE,
+                    body=b'',
+                ),
+            )
+        return existing
+
+    async def set(self, key: str, response: IdempotentResponse) -> None:
+        self._cache.set(key, response)
+
+    async def release(self, key: str) -> None:
+        self._cache.delete(key)
@@ -1,42 +1,117 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from http import HTTPStatus
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
 
 from app.config import settings
+from app.database import (
+    ReadinessProbe,
+    dispose_engines,
+    get_engine,
+    get_replica_set,
+    warm_up_pool,
+)
 from app.exception import DetailedHTTPException
-from app.middlewares.response_middleware import ResponseMiddleware
+from app.metrics import LoopMonitor, instrument_engines
+from app.metrics.instruments import registry
+from app.metrics.runtime import collect_runtime_stats
+from app.middlewares import (
+    CompressionMiddleware,
+    HealthCheckMiddleware,
+    MetricsMiddleware,
+    RequestIdMiddleware,
+    TimingMiddleware,
+)
+from app.repository.user.user_repository import prime_statements
 from app.routers.auth_router import router as auth_router
+from app.routers.deps import (
+    idempotency_purge_job,
+    password_rehasher,
+    revocation_list,
+    user_purge_job,
+)
+from app.routers.jwks_router import router as jwks_router
+from app.routers.metrics_router import router as metrics_router
 from app.routers.user_router import router as user_router
+from app.security import password_pool
+from app.utils.json_response import FastJSONResponse
 from app.utils.response_handler import ResponseHandler
 
-app = FastAPI()
 
-app.add_middleware(ResponseMiddleware)
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    loop_monitor = LoopMonitor(
+        interval=settings.METRICS_LOOP_LAG_INTERVAL,
+        slow_threshold=settings.METRICS_SLOW_CALLBACK_THRESHOLD,
+    )
+    if settings.METRICS_ENABLED:
+        loop_monitor.start()
+    await warm_up_pool(
+        get_engine(),
+        settings.DB_POOL_WARMUP_CONNECTIONS,
+        primer=prime_statements,
+        timeout=settings.DB_POOL_TIMEOUT,
+    )
+    get_replica_set().start_health_checks()
+    revocation_list.start()
+    if settings.USER_PURGE_ENABLED:
+        user_purge_job.start()
+    if idempotency_purge_job is not None:
+        idempotency_purge_job.start()
+    yield
+    if idempotency_purge_job is not None:
+        await idempotency_purge_job.stop()
+    await user_purge_job.stop()
+    await revocation_list.stop()
+    await password_rehasher.drain()
+    await dispose_engines()
+    await loop_monitor.stop()
+    password_pool.shutdown()
+
+
+app = FastAPI(lifespan=lifespan, default_response_class=FastJSONResponse)
+
+app.add_middleware(
+    CompressionMiddleware, minimum_size=settings.COMPRESSION_MINIMUM_SIZE
+)
+app.add_middleware(TimingMiddleware)
+if settings.METRICS_ENABLED:
+    instrument_engines()
+    registry.add_collector(collect_runtime_stats)
+    app.add_middleware(MetricsMiddleware)
+app.add_middleware(RequestIdMiddleware)
+app.add_middleware(
+    HealthCheckMiddleware,
+    readiness=ReadinessProbe(
+        get_engine,
+        timeout=settings.READINESS_CHECK_TIMEOUT,
+        cache_ttl=settings.READINESS_CACHE_TTL,
+        max_pool_wait=settings.READINESS_MAX_POOL_WAIT,
+    ),
+)
 
 
 @app.exception_handler(DetailedHTTPException)
 async def detailed_http_exception_handler(
     request: Request, exc: DetailedHTTPException
 ):
-    response_data = ResponseHandler.error(
+    return ResponseHandler.error(
         message=exc.detail,
         status_code=exc.status_code,
         error=type(exc).__name__,
-    )
-    return JSONResponse(
-        status_code=exc.status_code, content=response_data.model_dump()
+        headers=exc.headers,
     )
 
 
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
-    response_data = ResponseHandler.error(
-        message=exc.detail, status_code=exc.status_code, error='HTTPException'
-    )
-    return JSONResponse(
-        status_code=exc.status_code, content=response_data.model_dump()
+    return ResponseHandler.error(
+        message=exc.detail,
+        status_code=exc.status_code,
+        error='HTTPException',
+        headers=exc.headers,
     )
 
 
@@ -44,30 +119,25 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 async def validation_exception_handler(
     request: Request, exc: RequestValidationError
 ):
-    response_data = ResponseHandler.error(
+    return ResponseHandler.error(
         message='Dados de entrada inválidos',
         status_code=HTTPStatus.BAD_REQUEST.value,
         error='ValidationError',
         data=exc.errors(),
     )
-    return JSONResponse(
-        status_code=HTTPStatus.BAD_REQUEST.value,
-        content=response_data.model_dump(),
-    )
 
 
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
-    response_data = ResponseHandler.error(
+    return ResponseHandler.error(
         message='Ops! Tivemos um problema inesperado, tente novamente mais tarde.',  # noqa: E501
         status_code=HTTPStatus.INTERNAL_SERVER_ERROR.value,
         error=type(exc).__name__,
     )
-    return JSONResponse(
-        status_code=HTTPStatus.INTERNAL_SERVER_ERROR.value,
-        content=response_data.model_dump(),
-    )
 
 
 app.include_router(user_router, prefix=settings.API_PREFIX, tags=['Users'])
 app.include_router(auth_router, prefix=settings.API_PREFIX, tags=['Auth'])
+app.include_router(jwks_router)
+if settings.METRICS_ENABLED:
+    app.include_router(metrics_router)
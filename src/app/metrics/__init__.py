@@ -0,0 +1,25 @@
+from .loop_monitor import LoopMonitor
+from .registry import (
+    CONTENT_TYPE,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+)
+from .request_timings import (
+    RequestTimings,
+    instrument_engines,
+    request_timings_ctx,
+)
+
+__all__ = [
+    'CONTENT_TYPE',
+    'Counter',
+    'Gauge',
+    'Histogram',
+    'LoopMonitor',
+    'MetricsRegistry',
+    'RequestTimings',
+    'instrument_engines',
+    'request_timings_ctx',
+]
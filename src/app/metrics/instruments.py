@@ -0,0 +1,79 @@
+from collections.abc import Callable
+
+from app.metrics.registry import Counter, Gauge, Histogram, MetricsRegistry
+
+registry = MetricsRegistry()
+
+http_request_duration = registry.register(
+    Histogram(
+        'http_request_duration_seconds',
+        'Tempo de processamento da requisição por rota',
+        ('method', 'route', 'status'),
+    )
+)
+request_db_duration = registry.register(
+    Histogram(
+        'http_request_db_duration_seconds',
+        'Tempo gasto no banco por requisição',
+        ('method', 'route'),
+    )
+)
+db_query_duration = registry.register(
+    Histogram('db_query_duration_seconds', 'Tempo de execução das queries')
+)
+event_loop_lag = registry.register(
+    Histogram(
+        'event_loop_lag_seconds',
+        'Atraso do event loop em relação ao agendado',
+        buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+    )
+)
+event_loop_blocked = registry.register(
+    Counter(
+        'event_loop_blocked_total',
+        'Vezes em que um callback bloqueou o event loop além do limite',
+    )
+)
+db_pool_connections = registry.register(
+    Gauge(
+        'db_pool_connections',
+        'Conexões do pool por estado',
+        ('state',),
+    )
+)
+db_pool_wait_seconds = registry.register(
+    Gauge(
+        'db_pool_wait_seconds',
+        'Tempo de espera por conexão do pool',
+        ('stat',),
+    )
+)
+db_replica_healthy = registry.register(
+    Gauge(
+        'db_replica_healthy',
+        'Réplica de leitura em rotação (1) ou fora (0)',
+        ('replica',),
+    )
+)
+password_pool_pending = registry.register(
+    Gauge(
+        'password_pool_pending',
+        'Tarefas de hash de senha em execução ou na fila',
+    )
+)
+cache_events = registry.register(
+    Counter(
+        'cache_events_total',
+        'Acessos aos caches em memória e redis por resultado',
+        ('cache', 'event'),
+    )
+)
+
+
+def cache_metrics_hook(cache: str) -> Callable[[str], None]:
+    """``metrics_hook`` de cache que conta os eventos em ``cache_events``"""
+
+    def hook(event: str) -> None:
+        cache_events.inc(labels=(cache, event))
+
+    return hook
@@ -0,0 +1,109 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections.abc import Callable
+from types import FrameType
+from typing import Optional
+
+from app.metrics.instruments import event_loop_blocked, event_loop_lag
+
+logger = logging.getLogger(__name__)
+
+
+def _thread_frame(thread_id: int) -> Optional[FrameType]:
+    """Frame em execução na thread informada
+
+    ``sys._current_frames`` é a única forma de ler a stack de outra
+    thread sem pará-la; é documentado, apesar do prefixo.
+    """
+    return sys._current_frames().get(thread_id)  # pyright: ignore[reportPrivateUsage]
+
+
+class LoopMonitor:
+    """Mede o atraso do event loop e registra callbacks que o bloqueiam
+
+    Uma task acorda a cada ``interval`` segundos e registra o atraso em
+    ``event_loop_lag_seconds``. Uma thread de vigia verifica o último
+    batimento da task; se o loop ficar parado por mais de
+    ``slow_threshold`` segundos, registra no log a stack da thread do
+    loop, apontando o código síncrono que o está bloqueando.
+    ``on_lag``, se informado, também recebe cada atraso medido.
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.1,
+        slow_threshold: float = 0.1,
+        stack_limit: int = 20,
+        on_lag: Optional[Callable[[float], None]] = None,
+    ):
+        self.interval = interval
+        self.slow_threshold = slow_threshold
+        self.stack_limit = stack_limit
+        self.on_lag = on_lag
+        self._heartbeat = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task[None]] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    async def _measure_lag(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            self._heartbeat = time.monotonic()
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - started - self.interval)
+            event_loop_lag.observe(lag)
+            if self.on_lag is not None:
+                self.on_lag(lag)
+
+    def _watch(self) -> None:
+        reported: Optional[float] = None
+        while not self._stopped.wait(self.slow_threshold / 2):
+            heartbeat = self._heartbeat
+            stalled = time.monotonic() - heartbeat - self.interval
+            if stalled < self.slow_threshold or reported == heartbeat:
+                continue
+
+            reported = heartbeat
+            event_loop_blocked.inc()
+            frame = _thread_frame(self._loop_thread_id or 0)
+            if frame is None:
+                continue
+            stack = ''.join(
+                traceback.format_stack(frame, limit=self.stack_limit)
+            )
+            logger.warning(
+                'Event loop bloqueado há %.0f ms:\n%s', stalled * 1000, stack
+            )
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stopped.clear()
+        self._task = asyncio.get_running_loop().create_task(
+            self._measure_lag()
+        )
+        self._watchdog = threading.Thread(
+            target=self._watch, name='loop-monitor', daemon=True
+        )
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stopped.set()
+        if self._watchdog is not None:
+            self._watchdog.join()
+            self._watchdog = None
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -0,0 +1,193 @@
+import math
+import threading
+from bisect import bisect_left
+from collections.abc import Callable, Iterator, Sequence
+from typing import ClassVar
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+DEFAULT_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+type Labels = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', r'\\').replace('\n', r'\n').replace('"', r'\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    return repr(float(value))
+
+
+class Metric:
+    """Base das métricas no formato de exposição do Prometheus"""
+
+    type_name: ClassVar[str]
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _check(self, labels: Labels) -> None:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f'{self.name} espera os labels {self.labelnames}')
+
+    def _label_str(self, labels: Labels, extra: str = '') -> str:
+        pairs = [
+            f'{name}="{_escape(value)}"'
+            for name, value in zip(self.labelnames, labels)
+        ]
+        if extra:
+            pairs.append(extra)
+        return '{' + ','.join(pairs) + '}' if pairs else ''
+
+    def samples(self) -> Iterator[str]:
+        raise NotImplementedError
+
+    def render(self) -> Iterator[str]:
+        yield f'# HELP {self.name} {self.documentation}'
+        yield f'# TYPE {self.name} {self.type_name}'
+        yield from self.samples()
+
+
+class _ValueMetric(Metric):
+    """Métrica com um único valor por combinação de labels"""
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[Labels, float] = {}
+
+    def samples(self) -> Iterator[str]:
+        with self._lock:
+            values = list(self._values.items())
+        for labels, value in values:
+            label_str = self._label_str(labels)
+            yield f'{self.name}{label_str} {_format_value(value)}'
+
+
+class Counter(_ValueMetric):
+    type_name = 'counter'
+
+    def inc(self, amount: float = 1.0, labels: Labels = ()) -> None:
+        self._check(labels)
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+
+class Gauge(_ValueMetric):
+    type_name = 'gauge'
+
+    def set(self, value: float, labels: Labels = ()) -> None:
+        self._check(labels)
+        with self._lock:
+            self._values[labels] = value
+
+
+class _HistogramSeries:
+    __slots__ = ('buckets', 'count', 'sum')
+
+    def __init__(self, size: int):
+        self.buckets = [0] * size
+        self.count = 0
+        self.sum = 0.0
+
+
+class Histogram(Metric):
+    type_name = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: dict[Labels, _HistogramSeries] = {}
+
+    def observe(self, value: float, labels: Labels = ()) -> None:
+        self._check(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = _HistogramSeries(
+                    len(self.buckets)
+                )
+            if index < len(self.buckets):
+                series.buckets[index] += 1
+            series.count += 1
+            series.sum += value
+
+    def samples(self) -> Iterator[str]:
+        with self._lock:
+            snapshot = [
+                (labels, list(series.buckets), series.count, series.sum)
+                for labels, series in self._series.items()
+            ]
+        for labels, buckets, count, total in snapshot:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, buckets):
+                cumulative += bucket_count
+                label_str = self._label_str(
+                    labels, f'le="{_format_value(bound)}"'
+                )
+                yield f'{self.name}_bucket{label_str} {cumulative}'
+            label_str = self._label_str(labels, 'le="+Inf"')
+            yield f'{self.name}_bucket{label_str} {count}'
+            label_str = self._label_str(labels)
+            yield f'{self.name}_sum{label_str} {_format_value(total)}'
+            yield f'{self.name}_count{label_str} {count}'
+
+
+class MetricsRegistry:
+    """Conjunto de métricas expostas em ``/metrics``
+
+    ``collectors`` são chamados antes de cada renderização para
+    atualizar métricas derivadas de estado (ex.: pool de conexões).
+    """
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+        self._collectors: list[Callable[[], None]] = []
+
+    def register[M: Metric](self, metric: M) -> M:
+        if metric.name in self._metrics:
+            raise ValueError(f'Métrica {metric.name} já registrada')
+        self._metrics[metric.name] = metric
+        return metric
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        for collector in self._collectors:
+            collector()
+        lines = [
+            line
+            for metric in self._metrics.values()
+            for line in metric.render()
+        ]
+        return '\n'.join(lines) + '\n'
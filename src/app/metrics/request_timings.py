@@ -0,0 +1,58 @@
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from sqlalchemy import Engine, event
+from sqlalchemy.engine import Connection
+
+from app.metrics.instruments import db_query_duration
+
+_QUERY_STARTED_KEY = 'query_started'
+
+
+@dataclass(slots=True)
+class RequestTimings:
+    """Tempos acumulados durante uma requisição"""
+
+    db_time: float = 0.0
+    db_queries: int = 0
+
+
+request_timings_ctx: ContextVar[Optional[RequestTimings]] = ContextVar(
+    'request_timings', default=None
+)
+
+
+def _before_cursor_execute(conn: Connection, *args: Any) -> None:
+    conn.info.setdefault(_QUERY_STARTED_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn: Connection, *args: Any) -> None:
+    elapsed = time.perf_counter() - conn.info[_QUERY_STARTED_KEY].pop()
+    db_query_duration.observe(elapsed)
+    timings = request_timings_ctx.get()
+    if timings is not None:
+        timings.db_time += elapsed
+        timings.db_queries += 1
+
+
+def _handle_error(context: Any) -> None:
+    started = context.connection and context.connection.info.get(
+        _QUERY_STARTED_KEY
+    )
+    if started:
+        started.pop()
+
+
+def instrument_engines() -> None:
+    """Mede o tempo das queries e acumula na requisição atual
+
+    Os eventos são registrados na classe ``Engine``, valendo para o
+    primário e as réplicas, inclusive as criadas depois desta chamada.
+    """
+    if event.contains(Engine, 'before_cursor_execute', _before_cursor_execute):
+        return
+    event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+    event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+    event.listen(Engine, 'handle_error', _handle_error)
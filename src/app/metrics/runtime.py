@@ -0,0 +1,23 @@
+from app.database import get_engine, get_pool_stats, get_replica_set
+from app.metrics.instruments import (
+    db_pool_connections,
+    db_pool_wait_seconds,
+    db_replica_healthy,
+    password_pool_pending,
+)
+from app.security import password_pool
+
+
+def collect_runtime_stats() -> None:
+    """Atualiza os gauges dos pools de conexões, réplicas e hash"""
+    stats = get_pool_stats(get_engine())
+    db_pool_connections.set(stats.size, ('size',))
+    db_pool_connections.set(stats.checked_in, ('checked_in',))
+    db_pool_connections.set(stats.checked_out, ('checked_out',))
+    db_pool_connections.set(stats.overflow, ('overflow',))
+    db_pool_wait_seconds.set(stats.wait_time_avg, ('avg',))
+    db_pool_wait_seconds.set(stats.wait_time_max, ('max',))
+    db_pool_wait_seconds.set(stats.wait_time_last, ('last',))
+    for replica in get_replica_set().replicas:
+        db_replica_healthy.set(replica.healthy, (str(replica.index),))
+    password_pool_pending.set(password_pool.pending)
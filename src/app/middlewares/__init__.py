@@ -0,0 +1,14 @@
+from .compression_middleware import CompressionMiddleware
+from .health_middleware import HealthCheckMiddleware
+from .metrics_middleware import MetricsMiddleware
+from .request_id_middleware import RequestIdMiddleware, request_id_ctx
+from .timing_middleware import TimingMiddleware
+
+__all__ = [
+    'CompressionMiddleware',
+    'HealthCheckMiddleware',
+    'MetricsMiddleware',
+    'RequestIdMiddleware',
+    'TimingMiddleware',
+    'request_id_ctx',
+]
@@ -0,0 +1,166 @@
+import zlib
+from typing import Any, Optional, Protocol
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli  # type: ignore
+except ImportError:  # pragma: no cover - dependência opcional
+    brotli = None
+
+
+class Compressor(Protocol):
+    """Protocol para compressores incrementais"""
+
+    def compress(self, data: bytes, finish: bool) -> bytes: ...
+
+
+class GzipCompressor:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(
+            level, zlib.DEFLATED, 16 + zlib.MAX_WBITS
+        )
+
+    def compress(self, data: bytes, finish: bool) -> bytes:
+        chunk = self._compressor.compress(data)
+        flush_mode = zlib.Z_FINISH if finish else zlib.Z_SYNC_FLUSH
+        return chunk + self._compressor.flush(flush_mode)
+
+
+class BrotliCompressor:
+    def __init__(self, quality: int):
+        self._compressor: Any = brotli.Compressor(  # type: ignore
+            quality=quality
+        )
+
+    def compress(self, data: bytes, finish: bool) -> bytes:
+        chunk: bytes = self._compressor.process(data)
+        if finish:
+            return chunk + self._compressor.finish()
+        return chunk + self._compressor.flush()
+
+
+def select_encoding(accept_encoding: str) -> Optional[str]:
+    """Escolhe ``br`` ou ``gzip`` a partir do ``Accept-Encoding``"""
+    accepted: set[str] = set()
+    for item in accept_encoding.lower().split(','):
+        coding, _, params = item.strip().partition(';')
+        if params.replace(' ', '') in {'q=0', 'q=0.0', 'q=0.00', 'q=0.000'}:
+            continue
+        accepted.add(coding.strip())
+
+    if brotli is not None and 'br' in accepted:
+        return 'br'
+    if 'gzip' in accepted:
+        return 'gzip'
+    return None
+
+
+class CompressionMiddleware:
+    """Compressão gzip/brotli de respostas acima de ``minimum_size`` bytes
+
+    Respostas que já possuem ``Content-Encoding`` e eventos SSE passam
+    sem alteração. Respostas em streaming são comprimidas por chunk.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        encoding = select_encoding(
+            Headers(scope=scope).get('accept-encoding', '')
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        compressor: Compressor = (
+            BrotliCompressor(self.brotli_quality)
+            if encoding == 'br'
+            else GzipCompressor(self.gzip_level)
+        )
+        responder = _CompressionResponder(
+            send, encoding, compressor, self.minimum_size
+        )
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(
+        self,
+        send: Send,
+        encoding: str,
+        compressor: Compressor,
+        minimum_size: int,
+    ):
+        self._send = send
+        self._encoding = encoding
+        self._compressor = compressor
+        self._minimum_size = minimum_size
+        self._initial_message: Optional[Message] = None
+        self._started = False
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        message_type = message['type']
+
+        if message_type == 'http.response.start':
+            headers = Headers(raw=message['headers'])
+            self._passthrough = 'content-encoding' in headers or (
+                headers.get('content-type', '').startswith('text/event-stream')
+            )
+            self._initial_message = message
+            return
+
+        if message_type != 'http.response.body' or self._passthrough:
+            await self._flush_initial_message()
+            await self._send(message)
+            return
+
+        body: bytes = message.get('body', b'')
+        more_body: bool = message.get('more_body', False)
+
+        if not self._started:
+            self._started = True
+            if not more_body and len(body) < self._minimum_size:
+                self._passthrough = True
+                await self._flush_initial_message()
+                await self._send(message)
+                return
+
+            assert self._initial_message is not None
+            headers = MutableHeaders(raw=self._initial_message['headers'])
+            headers['Content-Encoding'] = self._encoding
+            headers.add_vary_header('Accept-Encoding')
+            compressed = self._compressor.compress(body, finish=not more_body)
+            if more_body:
+                del headers['Content-Length']
+            else:
+                headers['Content-Length'] = str(len(compressed))
+            await self._flush_initial_message()
+            await self._send({**message, 'body': compressed})
+            return
+
+        await self._send({
+            **message,
+            'body': self._compressor.compress(body, finish=not more_body),
+        })
+
+    async def _flush_initial_message(self) -> None:
+        if self._initial_message is not None:
+            await self._send(self._initial_message)
+            self._initial_message = None
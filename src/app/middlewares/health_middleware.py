@@ -0,0 +1,55 @@
+from pydantic_core import to_json
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.database import ReadinessProbe
+
+
+class HealthCheckMiddleware:
+    """Responde ``/healthz`` e ``/readyz`` antes do restante da pilha
+
+    ``/healthz`` (liveness) não faz I/O: se o event loop atende a
+    requisição, o processo está vivo. ``/readyz`` devolve 503 quando a
+    ``ReadinessProbe`` indica banco indisponível ou pool saturado. Nenhuma
+    das duas passa por roteamento, dependências ou demais middlewares.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        readiness: ReadinessProbe,
+        liveness_path: str = '/healthz',
+        readiness_path: str = '/readyz',
+    ):
+        self.app = app
+        self.readiness = readiness
+        self.liveness_path = liveness_path
+        self.readiness_path = readiness_path
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] == 'http':
+            path = scope['path']
+            if path == self.liveness_path:
+                await _respond(send, 200, b'{"status":"ok"}')
+                return
+            if path == self.readiness_path:
+                readiness = await self.readiness.check()
+                await _respond(
+                    send,
+                    200 if readiness.ready else 503,
+                    to_json(readiness.to_dict()),
+                )
+                return
+        await self.app(scope, receive, send)
+
+
+async def _respond(send: Send, status: int, body: bytes) -> None:
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [
+            (b'content-type', b'application/json'),
+            (b'content-length', str(len(body)).encode()),
+            (b'cache-control', b'no-store'),
+        ],
+    })
+    await send({'type': 'http.response.body', 'body': body})
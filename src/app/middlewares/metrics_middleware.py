@@ -0,0 +1,59 @@
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.metrics import RequestTimings, request_timings_ctx
+from app.metrics.instruments import (
+    http_request_duration,
+    request_db_duration,
+)
+
+UNMATCHED_ROUTE = 'unmatched'
+
+
+class MetricsMiddleware:
+    """Registra o tempo por rota e adiciona ``Server-Timing``
+
+    ``app`` é o tempo até o início da resposta e ``db`` o tempo gasto
+    em queries da requisição até esse ponto. A rota é registrada pelo
+    template (``/users/{user_id}``) para manter a cardinalidade baixa.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = request_timings_ctx.set(timings)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_server_timing(message: Message) -> None:
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+                app_ms = (time.perf_counter() - started) * 1000
+                MutableHeaders(scope=message).append(
+                    'Server-Timing',
+                    f'app;dur={app_ms:.2f}, '
+                    f'db;dur={timings.db_time * 1000:.2f};'
+                    f'desc="{timings.db_queries} queries"',
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_server_timing)
+        finally:
+            request_timings_ctx.reset(token)
+            route = getattr(scope.get('route'), 'path', UNMATCHED_ROUTE)
+            method = scope['method']
+            http_request_duration.observe(
+                time.perf_counter() - started,
+                (method, route, str(status_code)),
+            )
+            request_db_duration.observe(timings.db_time, (method, route))
@@ -0,0 +1,46 @@
+import re
+from contextvars import ContextVar
+from typing import Optional
+from uuid import uuid4
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+request_id_ctx: ContextVar[Optional[str]] = ContextVar(
+    'request_id', default=None
+)
+
+_VALID_REQUEST_ID = re.compile(r'[A-Za-z0-9._-]{1,128}')
+
+
+class RequestIdMiddleware:
+    """Propaga o ``X-Request-ID`` recebido ou gera um novo por requisição"""
+
+    def __init__(self, app: ASGIApp, header_name: str = 'X-Request-ID'):
+        self.app = app
+        self.header_name = header_name
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        incoming = Headers(scope=scope).get(self.header_name)
+        request_id = (
+            incoming
+            if incoming and _VALID_REQUEST_ID.fullmatch(incoming)
+            else uuid4().hex
+        )
+
+        async def send_with_request_id(message: Message) -> None:
+            if message['type'] == 'http.response.start':
+                MutableHeaders(scope=message).append(
+                    self.header_name, request_id
+                )
+            await send(message)
+
+        token = request_id_ctx.set(request_id)
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id_ctx.reset(token)
@@ -1,3 +1,5 @@
+from .idempotency_key import IdempotencyKey
+from .refresh_token import RefreshToken
 from .user import User
 
-__all__ = ['User']
+__all__ = ['IdempotencyKey', 'RefreshToken', 'User']
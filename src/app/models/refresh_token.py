@@ -0,0 +1,52 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import DateTime, ForeignKey, Index, String, func, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import table_registry
+
+
+@table_registry.mapped_as_dataclass
+class RefreshToken:
+    """Refresh token opaco; só o hash do segredo é armazenado
+
+    Tokens de uma mesma sessão (``session_id``) formam uma cadeia de
+    rotação: cada uso revoga o token e aponta ``replaced_by`` para o
+    próximo. Revogar a sessão preenche ``revoked_at`` sem
+    ``replaced_by``.
+    """
+
+    __tablename__ = 'tb_refresh_tokens'
+    __table_args__ = (
+        Index('tb_refresh_tokens_session_id_idx', 'session_id'),
+        Index('tb_refresh_tokens_user_id_idx', 'user_id'),
+        Index(
+            'tb_refresh_tokens_revoked_at_idx',
+            'revoked_at',
+            postgresql_where=text('replaced_by IS NULL'),
+        ),
+    )
+
+    id: Mapped[UUID] = mapped_column(primary_key=True)
+    session_id: Mapped[UUID] = mapped_column(nullable=False)
+    user_id: Mapped[UUID] = mapped_column(
+        ForeignKey('tb_users.id', ondelete='CASCADE'), nullable=False
+    )
+    token_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        init=False,
+    )
+    revoked_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True, default=None
+    )
+    replaced_by: Mapped[Optional[UUID]] = mapped_column(
+        nullable=True, default=None
+    )
@@ -1,4 +1,7 @@
-from sqlalchemy import String, text
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, Index, String, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import table_registry
@@ -8,14 +11,40 @@ from app.models.base import TimestampedTable, UUIDTable
 @table_registry.mapped_as_dataclass
 class User(UUIDTable, TimestampedTable):
     __tablename__ = 'tb_users'
-
-    email: Mapped[str] = mapped_column(
-        String(200), unique=True, nullable=False
+    __table_args__ = (
+        Index('tb_users_created_at_idx', 'created_at', 'id'),
+        # Unicidade só entre usuários ativos: um email ou telefone de um
+        # usuário removido pode ser reutilizado
+        Index(
+            'tb_users_email_active_key',
+            'email',
+            unique=True,
+            postgresql_where=text('is_active'),
+        ),
+        Index(
+            'tb_users_phone_active_key',
+            'phone',
+            unique=True,
+            postgresql_where=text('is_active'),
+        ),
+        Index(
+            'tb_users_deleted_at_idx',
+            'deleted_at',
+            postgresql_where=text('deleted_at IS NOT NULL'),
+        ),
     )
+
+    email: Mapped[str] = mapped_column(String(200), nullable=False)
     password: Mapped[str] = mapped_column(nullable=False)
     first_name: Mapped[str] = mapped_column(String(80), nullable=False)
     last_name: Mapped[str] = mapped_column(String(80), nullable=False)
-    phone: Mapped[str] = mapped_column(String(15), nullable=True, unique=True)
+    phone: Mapped[str] = mapped_column(String(15), nullable=True)
     is_active: Mapped[bool] = mapped_column(
         nullable=False, server_default=text('TRUE'), default=True
     )
+    is_admin: Mapped[bool] = mapped_column(
+        nullable=False, server_default=text('FALSE'), default=False
+    )
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True, default=None, init=False
+    )
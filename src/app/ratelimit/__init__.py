@@ -0,0 +1,9 @@
+from .rate_limiter_interface import IRateLimiter
+from .redis_rate_limiter import RedisTokenBucketRateLimiter
+from .token_bucket import TokenBucketRateLimiter
+
+__all__ = [
+    'IRateLimiter',
+    'RedisTokenBucketRateLimiter',
+    'TokenBucketRateLimiter',
+]
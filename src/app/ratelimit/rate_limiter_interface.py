@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+
+class IRateLimiter(ABC):
+    """Interface para limitadores de taxa por chave"""
+
+    @abstractmethod
+    async def acquire(self, key: str) -> float:
+        """Consome uma permissão da chave
+
+        Returns:
+            float: ``0`` se permitido, senão segundos até a próxima
+            permissão
+        """
+        pass
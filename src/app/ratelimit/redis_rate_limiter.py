@@ -0,0 +1,68 @@
+import logging
+
+from app.ratelimit.rate_limiter_interface import IRateLimiter
+
+logger = logging.getLogger(__name__)
+
+# KEYS[1]: balde; ARGV: capacidade, fichas/s
+# Retorna 0 se permitido, senão ms até a próxima ficha
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local tokens = tonumber(bucket[1]) or capacity
+local updated_at = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + (now - updated_at) / 1000 * rate)
+local wait = 0
+if tokens < 1 then
+    wait = math.ceil((1 - tokens) / rate * 1000)
+else
+    tokens = tokens - 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated_at', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil((capacity - tokens) / rate * 1000))
+return wait
+"""
+
+
+class RedisTokenBucketRateLimiter(IRateLimiter):
+    """Token bucket compartilhado entre processos usando Redis
+
+    Requer o extra ``redis``. O balde é atualizado atomicamente por um
+    script Lua; falhas do Redis liberam a requisição para não derrubar
+    o login.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        capacity: int,
+        refill_rate: float,
+        prefix: str = 'ratelimit:',
+    ):
+        try:
+            from redis.asyncio import Redis  # noqa: PLC0415
+        except ImportError as e:
+            raise RuntimeError(
+                'O backend redis requer o pacote "redis" instalado.'
+            ) from e
+
+        # ``**kwargs`` de ``from_url`` não é tipado no pacote redis
+        self._client: Redis = Redis.from_url(url)  # pyright: ignore[reportUnknownMemberType]
+        self._script = self._client.register_script(TOKEN_BUCKET_SCRIPT)
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._prefix = prefix
+
+    async def acquire(self, key: str) -> float:
+        try:
+            wait_ms: int = await self._script(
+                keys=[self._prefix + key],
+                args=[self.capacity, self.refill_rate],
+            )
+        except Exception:
+            logger.warning('Falha no rate limit redis', exc_info=True)
+            return 0.0
+        return wait_ms / 1000
@@ -0,0 +1,49 @@
+import time
+from typing import Callable
+
+from app.cache.ttl_cache import TTLCache
+from app.ratelimit.rate_limiter_interface import IRateLimiter
+
+
+class TokenBucketRateLimiter(IRateLimiter):
+    """Token bucket em memória do processo
+
+    Cada chave tem até ``capacity`` fichas, repostas a ``refill_rate``
+    por segundo. Baldes ficam num ``TTLCache`` limitado a ``max_keys``;
+    um balde expira quando estaria cheio, o que equivale a recriá-lo.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        refill_rate: float,
+        max_keys: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._clock = clock
+        self._buckets: TTLCache[str, tuple[float, float]] = TTLCache(
+            max_size=max_keys, ttl=capacity / refill_rate, clock=clock
+        )
+
+    async def acquire(self, key: str) -> float:
+        now = self._clock()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            tokens = float(self.capacity)
+        else:
+            tokens, updated_at = bucket
+            tokens = min(
+                self.capacity, tokens + (now - updated_at) * self.refill_rate
+            )
+
+        if tokens < 1:
+            self._buckets.set(key, (tokens, now))
+            return (1 - tokens) / self.refill_rate
+
+        tokens -= 1
+        self._buckets.set(
+            key, (tokens, now), ttl=(self.capacity - tokens) / self.refill_rate
+        )
+        return 0.0
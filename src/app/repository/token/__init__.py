@@ -0,0 +1,6 @@
+from .refresh_token_repository import RefreshTokenRepository
+from .refresh_token_repository_interface import (
+    IRefreshTokenRepositoryInterface,
+)
+
+__all__ = ['IRefreshTokenRepositoryInterface', 'RefreshTokenRepository']
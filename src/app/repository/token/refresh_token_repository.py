@@ -0,0 +1,114 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import func, insert, literal, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import RefreshToken
+from app.repository.token.refresh_token_repository_interface import (
+    IRefreshTokenRepositoryInterface,
+)
+
+
+class RefreshTokenRepository(IRefreshTokenRepositoryInterface):
+    """Refresh tokens com rotação e detecção de reuso"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def create(self, token: RefreshToken) -> RefreshToken:
+        self.session.add(token)
+        await self.session.commit()
+        return token
+
+    async def rotate(
+        self,
+        token_id: UUID,
+        token_hash: str,
+        new_token_id: UUID,
+        new_token_hash: str,
+        expires_at: datetime,
+    ) -> Optional[RefreshToken]:
+        """Revoga o token atual e cria o próximo em um único comando
+
+        Se o token já tinha sido trocado, alguém o reutilizou (possível
+        vazamento): a sessão inteira é revogada.
+        """
+        rotated = (
+            update(RefreshToken)
+            .where(
+                RefreshToken.id == token_id,
+                RefreshToken.token_hash == token_hash,
+                RefreshToken.revoked_at.is_(None),
+                RefreshToken.expires_at > func.now(),
+            )
+            .values(revoked_at=func.now(), replaced_by=new_token_id)
+            .returning(RefreshToken.session_id, RefreshToken.user_id)
+            .cte('rotated')
+        )
+        stmt = (
+            insert(RefreshToken)
+            .from_select(
+                [
+                    RefreshToken.id,
+                    RefreshToken.session_id,
+                    RefreshToken.user_id,
+                    RefreshToken.token_hash,
+                    RefreshToken.expires_at,
+                ],
+                select(
+                    literal(new_token_id, RefreshToken.id.type),
+                    rotated.c.session_id,
+                    rotated.c.user_id,
+                    literal(new_token_hash, RefreshToken.token_hash.type),
+                    literal(expires_at, RefreshToken.expires_at.type),
+                ),
+            )
+            .returning(RefreshToken)
+        )
+        result = await self.session.scalars(stmt)
+        new_token = result.one_or_none()
+        if new_token is None:
+            await self._revoke_if_reused(token_id, token_hash)
+        await self.session.commit()
+        return new_token
+
+    async def _revoke_if_reused(self, token_id: UUID, token_hash: str) -> None:
+        session_id = await self.session.scalar(
+            select(RefreshToken.session_id).where(
+                RefreshToken.id == token_id,
+                RefreshToken.token_hash == token_hash,
+                RefreshToken.replaced_by.is_not(None),
+            )
+        )
+        if session_id is not None:
+            await self._revoke(session_id)
+
+    async def _revoke(self, session_id: UUID) -> None:
+        await self.session.execute(
+            update(RefreshToken)
+            .where(
+                RefreshToken.session_id == session_id,
+                RefreshToken.revoked_at.is_(None),
+            )
+            .values(revoked_at=func.now())
+        )
+
+    async def revoke_session(self, session_id: UUID) -> None:
+        await self._revoke(session_id)
+        await self.session.commit()
+
+    async def revoked_sessions_since(
+        self, since: datetime
+    ) -> list[tuple[UUID, datetime]]:
+        stmt = (
+            select(RefreshToken.session_id, func.max(RefreshToken.revoked_at))
+            .where(
+                RefreshToken.revoked_at > since,
+                RefreshToken.replaced_by.is_(None),
+            )
+            .group_by(RefreshToken.session_id)
+        )
+        result = await self.session.execute(stmt)
+        return [(session_id, revoked_at) for session_id, revoked_at in result]
@@ -0,0 +1,42 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from app.models import RefreshToken
+
+
+class IRefreshTokenRepositoryInterface(ABC):
+    @abstractmethod
+    async def create(self, token: RefreshToken) -> RefreshToken:
+        """Grava um novo refresh token"""
+        pass
+
+    @abstractmethod
+    async def rotate(
+        self,
+        token_id: UUID,
+        token_hash: str,
+        new_token_id: UUID,
+        new_token_hash: str,
+        expires_at: datetime,
+    ) -> Optional[RefreshToken]:
+        """Troca um token válido pelo próximo da mesma sessão
+
+        Returns:
+            O novo token, ou ``None`` se o token é inválido, expirou ou
+            já foi usado
+        """
+        pass
+
+    @abstractmethod
+    async def revoke_session(self, session_id: UUID) -> None:
+        """Revoga todos os tokens da sessão"""
+        pass
+
+    @abstractmethod
+    async def revoked_sessions_since(
+        self, since: datetime
+    ) -> list[tuple[UUID, datetime]]:
+        """Sessões revogadas depois de ``since``, com o instante"""
+        pass
@@ -1,4 +1,14 @@
+from .user_cache import UserCache, user_cache
+from .user_loader import UserLoader
 from .user_repository import UserRepository
 from .user_repository_interface import IUserRepositoryInterface
+from .user_view import UserView
 
-__all__ = ['IUserRepositoryInterface', 'UserRepository']
+__all__ = [
+    'IUserRepositoryInterface',
+    'UserCache',
+    'UserLoader',
+    'UserRepository',
+    'UserView',
+    'user_cache',
+]
@@ -0,0 +1,91 @@
+from typing import Optional
+from uuid import UUID
+
+from app.cache import (
+    CacheStats,
+    ICacheBackend,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+    TTLCache,
+)
+from app.config import settings
+from app.metrics.instruments import cache_metrics_hook
+from app.schemas.user.user_input_create import UserResponse
+
+
+class UserCache:
+    """Cache de usuários autenticados indexado por ID
+
+    Também guarda, localmente no processo, os emails que não existem
+    (cache negativo do login). Escritas no repositório removem o email
+    desse cache; outros processos o veem no máximo após o TTL.
+    """
+
+    def __init__(
+        self,
+        backend: ICacheBackend[UserResponse],
+        unknown_emails: Optional[TTLCache[str, bool]] = None,
+    ):
+        self._backend = backend
+        self._unknown_emails = unknown_emails
+
+    @staticmethod
+    def _key(user_id: UUID) -> str:
+        return f'user:{user_id}'
+
+    async def get(self, user_id: UUID) -> Optional[UserResponse]:
+        """Busca usuário no cache"""
+        return await self._backend.get(self._key(user_id))
+
+    async def set(self, user: UserResponse) -> None:
+        """Armazena usuário no cache"""
+        await self._backend.set(self._key(user.id), user)
+
+    async def invalidate(self, user_id: UUID) -> None:
+        """Remove usuário do cache"""
+        await self._backend.delete(self._key(user_id))
+
+    def is_unknown_email(self, email: str) -> bool:
+        """Indica se o email foi buscado recentemente e não existia"""
+        if self._unknown_emails is None:
+            return False
+        return self._unknown_emails.get(email) is not None
+
+    def mark_unknown_email(self, email: str) -> None:
+        """Registra que o email não existe"""
+        if self._unknown_emails is not None:
+            self._unknown_emails.set(email, True)
+
+    def forget_email(self, email: str) -> None:
+        """Remove o email do cache negativo"""
+        if self._unknown_emails is not None:
+            self._unknown_emails.delete(email)
+
+    def stats(self) -> CacheStats:
+        return self._backend.stats()
+
+
+def _build_backend() -> ICacheBackend[UserResponse]:
+    if settings.USER_CACHE_BACKEND == 'redis' and settings.CACHE_REDIS_URL:
+        return RedisCacheBackend(
+            url=settings.CACHE_REDIS_URL,
+            ttl=settings.USER_CACHE_TTL,
+            dumps=lambda user: user.model_dump_json().encode(),
+            loads=UserResponse.model_validate_json,
+            metrics_hook=cache_metrics_hook('user'),
+        )
+    return MemoryCacheBackend(
+        max_size=settings.USER_CACHE_MAX_SIZE,
+        ttl=settings.USER_CACHE_TTL,
+        metrics_hook=cache_metrics_hook('user'),
+    )
+
+
+user_cache = UserCache(
+    _build_backend(),
+    unknown_emails=TTLCache(
+        max_size=settings.LOGIN_NEGATIVE_CACHE_MAX_SIZE,
+        ttl=settings.LOGIN_NEGATIVE_CACHE_TTL,
+        metrics_hook=cache_metrics_hook('unknown_email'),
+    ),
+)
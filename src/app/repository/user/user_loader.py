@@ -0,0 +1,58 @@
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from typing import Optional
+from uuid import UUID
+
+from app.models import User
+from app.repository.user.user_repository_interface import (
+    IUserRepositoryInterface,
+)
+from app.repository.user.user_view import UserView
+from app.utils.batch_loader import BatchLoader
+
+
+class UserLoader:
+    """Buscas de usuário por ID e email agrupadas entre requisições
+
+    Requisições concorrentes que buscam usuários no mesmo intervalo
+    compartilham uma única consulta ``= ANY(...)``, feita com um
+    repositório de sessão própria. Por ID, só as colunas públicas são
+    lidas (``UserView``); por email, o usuário completo, desanexado da
+    sessão e somente leitura, pois o login precisa da senha.
+    """
+
+    def __init__(
+        self,
+        repository_scope: Callable[
+            [], AbstractAsyncContextManager[IUserRepositoryInterface]
+        ],
+        window: float = 0.0,
+        max_batch_size: int = 100,
+    ):
+        self._repository_scope = repository_scope
+        self._by_id = BatchLoader(
+            self._fetch_by_ids, window=window, max_batch_size=max_batch_size
+        )
+        self._by_email = BatchLoader(
+            self._fetch_by_emails,
+            window=window,
+            max_batch_size=max_batch_size,
+        )
+
+    async def get_view_by_id(self, user_id: UUID) -> Optional[UserView]:
+        """Busca as colunas públicas do usuário por ID"""
+        return await self._by_id.load(user_id)
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """Busca usuário por email"""
+        return await self._by_email.load(email)
+
+    async def _fetch_by_ids(
+        self, user_ids: list[UUID]
+    ) -> dict[UUID, UserView]:
+        async with self._repository_scope() as repository:
+            return await repository.get_views_by_ids(user_ids)
+
+    async def _fetch_by_emails(self, emails: list[str]) -> dict[str, User]:
+        async with self._repository_scope() as repository:
+            return await repository.get_many_by_emails(emails)
@@ -1,87 +1,465 @@
-from typing import Optional
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+from typing import Any, NoReturn, Optional
 from uuid import UUID
 
+from sqlalchemy import (
+    String,
+    Uuid,
+    any_,
+    bindparam,
+    delete,
+    func,
+    insert,
+    or_,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 from sqlalchemy.future import select
 
 from app.exceptions.user_exception import (
     UserEmailAlreadyExists,
+    UserModifiedConcurrently,
     UserPhoneAlreadyExists,
 )
 from app.models import User
-from app.repository.user import IUserRepositoryInterface
+from app.repository.user.user_cache import UserCache
+from app.repository.user.user_repository_interface import (
+    IUserRepositoryInterface,
+)
+from app.repository.user.user_view import USER_VIEW_COLUMNS, UserView
+from app.utils.pagination import Cursor
+
+EMAIL_UNIQUE_CONSTRAINT = f'{User.__tablename__}_email_active_key'
+PHONE_UNIQUE_CONSTRAINT = f'{User.__tablename__}_phone_active_key'
+
+# Buscas quentes montadas uma única vez: cada chamada só informa os
+# parâmetros e reaproveita a chave do cache de compilação do SQLAlchemy
+# e o prepared statement do driver, sem reconstruir o ``select``.
+SELECT_USER_BY_ID = select(User).where(
+    User.id == bindparam('user_id'), User.is_active
+)
+# Leituras que alimentam caches (``UserCache`` e o cache negativo de
+# login) vão ao primário: uma réplica atrasada gravaria no cache, por
+# todo o TTL, uma linha antiga, um usuário já removido ou um email
+# recém-cadastrado como desconhecido.
+SELECT_USER_BY_EMAIL = (
+    select(User)
+    .where(User.email == bindparam('email'), User.is_active)
+    .execution_options(primary=True)
+)
+SELECT_USER_BY_PHONE = select(User).where(
+    User.phone == bindparam('phone'), User.is_active
+)
+SELECT_USER_VIEW_BY_ID = select(*USER_VIEW_COLUMNS).where(
+    User.id == bindparam('user_id'), User.is_active
+)
+SELECT_USER_VIEW_BY_EMAIL = select(*USER_VIEW_COLUMNS).where(
+    User.email == bindparam('email'), User.is_active
+)
+# Autorização lê do primário: revogar o acesso vale na hora, sem
+# depender do atraso das réplicas
+SELECT_USER_IS_ADMIN = (
+    select(User.is_admin)
+    .where(User.id == bindparam('user_id'), User.is_active)
+    .execution_options(primary=True)
+)
+SELECT_USER_VIEWS_BY_IDS = (
+    select(*USER_VIEW_COLUMNS)
+    .where(
+        User.id == any_(bindparam('user_ids', type_=ARRAY(Uuid()))),
+        User.is_active,
+    )
+    .execution_options(primary=True)
+)
+
+
+def _constraint_name(error: IntegrityError) -> Optional[str]:
+    """Extrai o nome da constraint violada (psycopg ou asyncpg)"""
+    for candidate in (error.orig, getattr(error.orig, '__cause__', None)):
+        diag = getattr(candidate, 'diag', None)
+        name = getattr(diag, 'constraint_name', None) or getattr(
+            candidate, 'constraint_name', None
+        )
+        if name:
+            return name
+    return None
+
+
+def _raise_for_integrity_error(error: IntegrityError) -> NoReturn:
+    """Converte violações de unicidade em exceções de domínio"""
+    constraint = _constraint_name(error)
+    if constraint == EMAIL_UNIQUE_CONSTRAINT:
+        raise UserEmailAlreadyExists('Email já está em uso') from error
+    if constraint == PHONE_UNIQUE_CONSTRAINT:
+        raise UserPhoneAlreadyExists('Telefone já está em uso') from error
+    raise ValueError(
+        'Erro ao criar usuário. Verifique os dados informados.'
+    ) from error
 
 
 class UserRepository(IUserRepositoryInterface):
-    """Implementação concreta do repositório de usuários com SQLAlchemy"""
+    """Implementação concreta do repositório de usuários com SQLAlchemy
+
+    As buscas consideram apenas usuários ativos. Com ``soft_delete``, a
+    remoção só marca o usuário como inativo; ``purge_deleted`` apaga as
+    linhas depois.
+    """
 
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        user_cache: Optional[UserCache] = None,
+        soft_delete: bool = True,
+    ):
         self.session = session
+        self._user_cache = user_cache
+        self._soft_delete = soft_delete
+
+    async def _invalidate_cache(self, user_id: UUID) -> None:
+        if self._user_cache is not None:
+            await self._user_cache.invalidate(user_id)
+
+    def _forget_emails(self, *emails: str) -> None:
+        if self._user_cache is not None:
+            for email in emails:
+                self._user_cache.forget_email(email)
 
     async def get_by_email(self, email: str) -> Optional[User]:
         """Busca usuário por email"""
-        stmt = select(User).where(User.email == email)
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(
+            SELECT_USER_BY_EMAIL, {'email': email}
+        )
         return result.scalar_one_or_none()
 
     async def get_by_phone(self, phone: str) -> Optional[User]:
         """Busca usuário por telefone"""
-        stmt = select(User).where(User.phone == phone)
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(
+            SELECT_USER_BY_PHONE, {'phone': phone}
+        )
         return result.scalar_one_or_none()
 
     async def get_by_id(self, user_id: UUID) -> Optional[User]:
         """Busca usuário por ID"""
-        stmt = select(User).where(User.id == user_id)
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(
+            SELECT_USER_BY_ID, {'user_id': user_id}
+        )
         return result.scalar_one_or_none()
 
+    async def get_view_by_id(self, user_id: UUID) -> Optional[UserView]:
+        """Busca só as colunas públicas do usuário por ID"""
+        result = await self.session.execute(
+            SELECT_USER_VIEW_BY_ID, {'user_id': user_id}
+        )
+        row = result.one_or_none()
+        return UserView(*row) if row is not None else None
+
+    async def get_view_by_email(self, email: str) -> Optional[UserView]:
+        """Busca só as colunas públicas do usuário por email"""
+        result = await self.session.execute(
+            SELECT_USER_VIEW_BY_EMAIL, {'email': email}
+        )
+        row = result.one_or_none()
+        return UserView(*row) if row is not None else None
+
+    async def is_admin(self, user_id: UUID) -> bool:
+        """Indica se o usuário ativo é administrador"""
+        result = await self.session.execute(
+            SELECT_USER_IS_ADMIN, {'user_id': user_id}
+        )
+        return bool(result.scalar_one_or_none())
+
+    async def get_views_by_ids(
+        self, user_ids: Sequence[UUID]
+    ) -> dict[UUID, UserView]:
+        """Colunas públicas com ``id = ANY(:user_ids)``, sem a senha"""
+        if not user_ids:
+            return {}
+
+        result = await self.session.execute(
+            SELECT_USER_VIEWS_BY_IDS, {'user_ids': list(user_ids)}
+        )
+        return {row[0]: UserView(*row) for row in result}
+
+    async def get_many_by_ids(
+        self, user_ids: Sequence[UUID]
+    ) -> dict[UUID, User]:
+        """Busca usuários com ``id = ANY(:user_ids)``
+
+        Um único parâmetro de array mantém o mesmo SQL (e o mesmo
+        prepared statement) para qualquer quantidade de IDs.
+        """
+        if not user_ids:
+            return {}
+
+        stmt = select(User).where(
+            User.id
+            == any_(
+                bindparam('user_ids', list(user_ids), type_=ARRAY(Uuid()))
+            ),
+            User.is_active,
+        )
+        result = await self.session.scalars(stmt)
+        return {user.id: user for user in result}
+
+    async def get_many_by_emails(
+        self, emails: Sequence[str]
+    ) -> dict[str, User]:
+        """Busca usuários com ``email = ANY(:emails)``, no primário"""
+        if not emails:
+            return {}
+
+        stmt = (
+            select(User)
+            .where(
+                User.email
+                == any_(
+                    bindparam('emails', list(emails), type_=ARRAY(String()))
+                ),
+                User.is_active,
+            )
+            .execution_options(primary=True)
+        )
+        result = await self.session.scalars(stmt)
+        return {user.email: user for user in result}
+
+    async def list_page(
+        self, limit: int, after: Optional[Cursor] = None
+    ) -> list[User]:
+        """Lista usuários por keyset em (created_at, id)"""
+        stmt = (
+            select(User)
+            .where(User.is_active)
+            .order_by(User.created_at, User.id)
+            .limit(limit)
+        )
+        if after is not None:
+            stmt = stmt.where(tuple_(User.created_at, User.id) > after)
+        result = await self.session.scalars(stmt)
+        return list(result.all())
+
+    async def stream_all(
+        self, batch_size: int
+    ) -> AsyncIterator[Sequence[Any]]:
+        """Percorre todos os usuários sem carregá-los no identity map"""
+        stmt = (
+            select(
+                User.id,
+                User.email,
+                User.first_name,
+                User.last_name,
+                User.phone,
+                User.is_active,
+                User.created_at,
+            )
+            .where(User.is_active)
+            .order_by(User.created_at, User.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream(stmt)
+        async for row in result:
+            yield row
+
     async def create(self, user: User) -> User:
-        """Cria um novo usuário com validações"""
-        # Validar email único
-        existing_user_email = await self.get_by_email(user.email)
-        if existing_user_email:
-            raise UserEmailAlreadyExists('Email já está em uso')
+        """Cria um novo usuário em um único INSERT ... RETURNING
+
+        A unicidade de email e telefone é garantida pelas constraints
+        do banco, sem consultas prévias.
+        """
+        stmt = (
+            insert(User)
+            .values(
+                email=user.email,
+                password=user.password,
+                first_name=user.first_name,
+                last_name=user.last_name,
+                phone=user.phone,
+                is_active=user.is_active,
+            )
+            .returning(User)
+        )
+        try:
+            result = await self.session.scalars(stmt)
+            created_user = result.one()
+            await self.session.commit()
+            self._forget_emails(created_user.email)
+            return created_user
+        except IntegrityError as e:
+            await self.session.rollback()
+            _raise_for_integrity_error(e)
+
+    async def bulk_create(self, users: list[User]) -> set[str]:
+        """Insere usuários em um único INSERT multi-VALUES
 
-        # Validar telefone único
-        existing_user_phone = await self.get_by_phone(user.phone)
-        if existing_user_phone:
-            raise UserPhoneAlreadyExists('Telefone já está em uso')
+        Linhas que violam email/telefone únicos são ignoradas
+        (``ON CONFLICT DO NOTHING``); retorna os emails inseridos.
+        """
+        if not users:
+            return set()
 
+        stmt = (
+            pg_insert(User)
+            .values([
+                {
+                    'email': user.email,
+                    'password': user.password,
+                    'first_name': user.first_name,
+                    'last_name': user.last_name,
+                    'phone': user.phone,
+                    'is_active': user.is_active,
+                }
+                for user in users
+            ])
+            .on_conflict_do_nothing()
+            .returning(User.email)
+        )
         try:
-            self.session.add(user)
+            result = await self.session.scalars(stmt)
+            inserted = set(result.all())
             await self.session.commit()
-            await self.session.refresh(user)
-            return user
+            self._forget_emails(*inserted)
+            return inserted
         except IntegrityError as e:
             await self.session.rollback()
-            raise ValueError(
-                'Erro ao criar usuário. Verifique os dados informados.'
-            ) from e
+            _raise_for_integrity_error(e)
+
+    async def find_taken(
+        self, emails: list[str], phones: list[str]
+    ) -> tuple[set[str], set[str]]:
+        """Busca emails e telefones já cadastrados em uma consulta"""
+        if not emails and not phones:
+            return set(), set()
+
+        stmt = select(User.email, User.phone).where(
+            or_(User.email.in_(emails), User.phone.in_(phones)),
+            User.is_active,
+        )
+        result = await self.session.execute(stmt)
+        taken_emails: set[str] = set()
+        taken_phones: set[str] = set()
+        for email, phone in result:
+            taken_emails.add(email)
+            if phone is not None:
+                taken_phones.add(phone)
+        return taken_emails, taken_phones
+
+    async def update_fields(
+        self,
+        user_id: UUID,
+        values: dict[str, Any],
+        expected_updated_at: Optional[datetime] = None,
+    ) -> Optional[User]:
+        """Atualiza em um único ``UPDATE ... RETURNING``, sem SELECT prévio
+
+        Com ``expected_updated_at``, a linha só é alterada se não mudou
+        desde então (concorrência otimista).
+
+        Raises:
+            UserModifiedConcurrently: Se ``updated_at`` não confere
+            UserEmailAlreadyExists: Se o email já está em uso
+            UserPhoneAlreadyExists: Se o telefone já está em uso
+        """
+        stmt = (
+            update(User)
+            .where(User.id == user_id, User.is_active)
+            .values(**values)
+            .returning(User)
+            .execution_options(populate_existing=True)
+        )
+        if expected_updated_at is not None:
+            stmt = stmt.where(User.updated_at == expected_updated_at)
 
-    async def update(self, user: User) -> User:
-        """Atualiza um usuário existente"""
         try:
+            result = await self.session.scalars(stmt)
+            user = result.one_or_none()
             await self.session.commit()
-            await self.session.refresh(user)
-            return user
         except IntegrityError as e:
             await self.session.rollback()
-            raise ValueError(
-                'Erro ao atualizar usuário. Verifique os dados informados.'
-            ) from e
+            _raise_for_integrity_error(e)
 
-    async def delete(self, user_id: UUID) -> bool:
-        """Remove um usuário"""
-        user = await self.get_by_id(user_id)
-        if not user:
-            return False
+        if user is None:
+            # Só no caminho de falha: distingue inexistente de conflito
+            if expected_updated_at is not None and await self.get_by_id(
+                user_id
+            ):
+                raise UserModifiedConcurrently()
+            return None
+
+        await self._invalidate_cache(user_id)
+        self._forget_emails(user.email)
+        return user
+
+    async def replace_password_hash(
+        self, user_id: UUID, current_hash: str, new_hash: str
+    ) -> bool:
+        """Compare-and-swap do hash em um único ``UPDATE`` no primário
+
+        Não altera ``updated_at``: o rehash não é uma edição do usuário
+        e não deve invalidar caches nem a concorrência otimista.
+        """
+        result = await self.session.execute(
+            update(User)
+            .where(
+                User.id == user_id,
+                User.is_active,
+                User.password == current_hash,
+            )
+            .values(password=new_hash, updated_at=User.updated_at)
+        )
+        await self.session.commit()
+        return result.rowcount > 0  # type: ignore
 
+    async def delete(self, user_id: UUID) -> bool:
+        """Remove um usuário em um único UPDATE (ou DELETE) ... RETURNING"""
+        stmt = (
+            update(User)
+            .where(User.id == user_id, User.is_active)
+            .values(is_active=False, deleted_at=func.now())
+            if self._soft_delete
+            else delete(User).where(User.id == user_id)
+        )
         try:
-            await self.session.delete(user)
+            result = await self.session.scalars(stmt.returning(User.id))
+            deleted = result.one_or_none() is not None
             await self.session.commit()
-            return True
         except Exception as e:
             await self.session.rollback()
             raise ValueError('Erro ao deletar usuário') from e
+
+        if deleted:
+            await self._invalidate_cache(user_id)
+        return deleted
+
+    async def purge_deleted(self, before: datetime, limit: int) -> int:
+        """Apaga até ``limit`` usuários removidos antes de ``before``
+
+        ``SKIP LOCKED`` permite que vários workers purguem ao mesmo
+        tempo sem disputar as mesmas linhas.
+        """
+        batch = (
+            select(User.id)
+            .where(User.deleted_at < before)
+            .order_by(User.deleted_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .execution_options(primary=True)
+        )
+        stmt = delete(User).where(User.id.in_(batch.scalar_subquery()))
+        result = await self.session.execute(stmt)
+        await self.session.commit()
+        return result.rowcount  # type: ignore
+
+
+async def prime_statements(connection: AsyncConnection) -> None:
+    """Executa as buscas por ID, email e telefone, para aquecimento"""
+    async with AsyncSession(bind=connection) as session:
+        repository = UserRepository(session)
+        await repository.get_by_id(UUID(int=0))
+        await repository.get_by_email('')
+        await repository.get_by_phone('')
+        await repository.get_view_by_id(UUID(int=0))
+        await repository.get_view_by_email('')
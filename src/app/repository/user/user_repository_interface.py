@@ -1,8 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+from typing import Any, Optional
 from uuid import UUID
 
 from app.models import User
+from app.repository.user.user_view import UserView
+from app.utils.pagination import Cursor
 
 
 class IUserRepositoryInterface(ABC):
@@ -21,17 +25,94 @@ class IUserRepositoryInterface(ABC):
         """Busca usuário por ID"""
         pass
 
+    @abstractmethod
+    async def get_view_by_id(self, user_id: UUID) -> Optional[UserView]:
+        """Busca só as colunas públicas do usuário por ID"""
+        pass
+
+    @abstractmethod
+    async def get_view_by_email(self, email: str) -> Optional[UserView]:
+        """Busca só as colunas públicas do usuário por email"""
+        pass
+
+    @abstractmethod
+    async def is_admin(self, user_id: UUID) -> bool:
+        """Indica se o usuário ativo é administrador"""
+        pass
+
+    @abstractmethod
+    async def get_views_by_ids(
+        self, user_ids: Sequence[UUID]
+    ) -> dict[UUID, UserView]:
+        """Busca as colunas públicas de vários usuários em uma consulta"""
+        pass
+
+    @abstractmethod
+    async def get_many_by_ids(
+        self, user_ids: Sequence[UUID]
+    ) -> dict[UUID, User]:
+        """Busca vários usuários por ID em uma consulta"""
+        pass
+
+    @abstractmethod
+    async def get_many_by_emails(
+        self, emails: Sequence[str]
+    ) -> dict[str, User]:
+        """Busca vários usuários por email em uma consulta"""
+        pass
+
+    @abstractmethod
+    async def list_page(
+        self, limit: int, after: Optional[Cursor] = None
+    ) -> list[User]:
+        """Lista usuários ordenados por (created_at, id) após o cursor"""
+        pass
+
+    @abstractmethod
+    def stream_all(self, batch_size: int) -> AsyncIterator[Sequence[Any]]:
+        """Percorre todos os usuários via cursor no servidor"""
+        pass
+
     @abstractmethod
     async def create(self, user: User) -> User:
         """Cria um novo usuário"""
         pass
 
     @abstractmethod
-    async def update(self, user: User) -> User:
-        """Atualiza um usuário existente"""
+    async def bulk_create(self, users: list[User]) -> set[str]:
+        """Insere usuários em lote, ignorando conflitos"""
+        pass
+
+    @abstractmethod
+    async def find_taken(
+        self, emails: list[str], phones: list[str]
+    ) -> tuple[set[str], set[str]]:
+        """Retorna quais emails e telefones já estão cadastrados"""
+        pass
+
+    @abstractmethod
+    async def update_fields(
+        self,
+        user_id: UUID,
+        values: dict[str, Any],
+        expected_updated_at: Optional[datetime] = None,
+    ) -> Optional[User]:
+        """Atualiza só as colunas informadas; ``None`` se não existe"""
+        pass
+
+    @abstractmethod
+    async def replace_password_hash(
+        self, user_id: UUID, current_hash: str, new_hash: str
+    ) -> bool:
+        """Troca o hash só se ainda for ``current_hash``"""
         pass
 
     @abstractmethod
     async def delete(self, user_id: UUID) -> bool:
         """Remove um usuário"""
         pass
+
+    @abstractmethod
+    async def purge_deleted(self, before: datetime, limit: int) -> int:
+        """Apaga definitivamente usuários removidos antes de ``before``"""
+        pass
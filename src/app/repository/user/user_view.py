@@ -0,0 +1,46 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from app.models import User
+from app.schemas.user.user_input_create import UserResponse
+
+
+@dataclass(slots=True, frozen=True)
+class UserView:
+    """Colunas públicas do usuário, lidas por projeção e sem a senha
+
+    Não passa pelo mapa de identidade da sessão; os campos seguem a
+    ordem de ``USER_VIEW_COLUMNS``, então ``UserView(*row)`` basta.
+    """
+
+    id: UUID
+    first_name: str
+    last_name: str
+    email: str
+    phone: str
+    is_active: bool
+    updated_at: datetime
+
+    def to_response(self) -> UserResponse:
+        """``UserResponse`` sem revalidar dados que vieram do banco"""
+        return UserResponse.model_construct(
+            id=self.id,
+            first_name=self.first_name,
+            last_name=self.last_name,
+            email=self.email,
+            phone=self.phone,
+            is_active=self.is_active,
+            updated_at=self.updated_at,
+        )
+
+
+USER_VIEW_COLUMNS = (
+    User.id,
+    User.first_name,
+    User.last_name,
+    User.email,
+    User.phone,
+    User.is_active,
+    User.updated_at,
+)
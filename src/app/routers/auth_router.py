@@ -1,18 +1,31 @@
 from http import HTTPStatus
 from typing import Annotated, Any
+from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
+from fastapi import Response as HTTPResponse
 from fastapi.security import OAuth2PasswordRequestForm
 
-from app.models.user import User
-from app.routers.deps import get_auth_service, get_current_user
+from app.routers.deps import (
+    get_auth_service,
+    get_current_user,
+    get_token_claims,
+    get_token_service,
+)
 from app.schemas.response import Response
 from app.schemas.user.user_input_create import UserResponse
-from app.schemas.user.user_login_input import UserLoginInput, UserLoginResponse
-from app.services.auth import IAuthServiceInterface
+from app.schemas.user.user_login_input import (
+    RefreshTokenInput,
+    UserLoginInput,
+    UserLoginResponse,
+)
+from app.services.auth import IAuthServiceInterface, TokenService
+from app.utils.json_response import FastJSONResponse
 
 AuthService = Annotated[IAuthServiceInterface, Depends(get_auth_service)]
-CurrentUser = Annotated[User, Depends(get_current_user)]
+CurrentUser = Annotated[UserResponse, Depends(get_current_user)]
+TokenClaims = Annotated[dict[str, Any], Depends(get_token_claims)]
+Tokens = Annotated[TokenService, Depends(get_token_service)]
 router = APIRouter(prefix='/auth')
 
 
@@ -43,18 +56,25 @@ router = APIRouter(prefix='/auth')
             'model': Response[Any],
             'description': 'Validation error. Please check the input data.',
         },
+        HTTPStatus.TOO_MANY_REQUESTS.value: {
+            'model': Response[Any],
+            'description': 'Too many login attempts. See Retry-After.',
+        },
     },
 )
 async def user_login(
+    request: Request,
     auth_service: AuthService,
     form_data: OAuth2PasswordRequestForm = Depends(),
-) -> UserLoginResponse:
+) -> FastJSONResponse:
     login_input = UserLoginInput(
         email=form_data.username, password=form_data.password
     )
-    return await auth_service.login(
+    login_response = await auth_service.login(
         login_input=login_input,
+        client_ip=request.client.host if request.client else None,
     )
+    return FastJSONResponse(content=login_response)
 
 
 @router.get(
@@ -74,9 +94,56 @@ async def user_login(
         },
     },
 )
-async def get_me(current_user: CurrentUser) -> Response[UserResponse]:
-    return Response[UserResponse](
-        data=UserResponse.model_validate(current_user),
-        message='Usuário encontrado.',
-        status_code=HTTPStatus.OK.value,
+async def get_me(current_user: CurrentUser) -> FastJSONResponse:
+    return FastJSONResponse(
+        content=Response[UserResponse](
+            data=current_user,
+            message='Usuário encontrado.',
+            status_code=HTTPStatus.OK.value,
+        )
     )
+
+
+@router.post(
+    '/refresh',
+    response_model=UserLoginResponse,
+    status_code=HTTPStatus.OK,
+    summary='Refresh tokens',
+    description='This endpoint exchanges a refresh token for a new access token and a new refresh token. '  # noqa: E501
+    'Each refresh token can be used only once; reusing one revokes the whole session.',  # noqa: E501
+    responses={
+        HTTPStatus.OK.value: {
+            'model': UserLoginResponse,
+            'description': 'Tokens refreshed successfully.',
+        },
+        HTTPStatus.UNAUTHORIZED.value: {
+            'model': Response[Any],
+            'description': 'Invalid, expired or already used refresh token.',
+        },
+    },
+)
+async def refresh_tokens(
+    refresh_input: RefreshTokenInput, token_service: Tokens
+) -> FastJSONResponse:
+    login_response = await token_service.refresh(refresh_input.refresh_token)
+    return FastJSONResponse(content=login_response)
+
+
+@router.post(
+    '/logout',
+    status_code=HTTPStatus.NO_CONTENT,
+    summary='Logout',
+    description='This endpoint revokes the current session. Its refresh token stops working '  # noqa: E501
+    'immediately and its access tokens are rejected within seconds.',
+    responses={
+        HTTPStatus.UNAUTHORIZED.value: {
+            'model': Response[Any],
+            'description': 'User not authenticated.',
+        },
+    },
+)
+async def logout(claims: TokenClaims, token_service: Tokens) -> HTTPResponse:
+    session_id = claims.get('sid')
+    if session_id is not None:
+        await token_service.revoke(UUID(session_id))
+    return HTTPResponse(status_code=HTTPStatus.NO_CONTENT.value)
@@ -1,22 +1,52 @@
-from typing import Annotated
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Annotated, Any
 from uuid import UUID
 
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
-from jwt import DecodeError, decode
+from jwt import InvalidTokenError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
-from app.database.session import get_async_session
-from app.exceptions.user_exception import UserNotAuthenticated
-from app.repository.user import IUserRepositoryInterface, user_repository
+from app.database.session import async_session, get_async_session
+from app.exceptions.user_exception import UserNotAdmin, UserNotAuthenticated
+from app.idempotency import (
+    DatabaseIdempotencyStore,
+    IdempotencyManager,
+    IdempotencyPurgeJob,
+    IIdempotencyStore,
+    MemoryIdempotencyStore,
+)
+from app.repository.token import (
+    IRefreshTokenRepositoryInterface,
+    RefreshTokenRepository,
+)
+from app.repository.user import (
+    IUserRepositoryInterface,
+    UserLoader,
+    user_cache,
+    user_repository,
+)
+from app.schemas.user.user_input_create import UserResponse
 from app.security import (
     create_access_token,
-    get_password_hash,
-    verify_password,
+    decode_access_token,
+    get_dummy_password_hash,
+    get_password_hash_async,
+    password_needs_rehash,
+    verify_password_async,
 )
-from app.services.auth import AuthService, IAuthServiceInterface
-from app.services.user import UserService
+from app.services.auth import (
+    AuthService,
+    IAuthServiceInterface,
+    PasswordRehasher,
+    RevocationList,
+    TokenService,
+    login_rate_limiter,
+)
+from app.services.user import UserPurgeJob, UserService
 
 oauth2_scheme = OAuth2PasswordBearer(
     tokenUrl=f'{settings.API_PREFIX}/auth/login'
@@ -25,7 +55,74 @@ Session = Annotated[AsyncSession, Depends(get_async_session)]
 
 
 def get_user_repository(session: Session) -> IUserRepositoryInterface:
-    return user_repository.UserRepository(session=session)
+    return user_repository.UserRepository(
+        session=session,
+        user_cache=user_cache,
+        soft_delete=settings.USER_SOFT_DELETE,
+    )
+
+
+@asynccontextmanager
+async def user_repository_scope() -> AsyncIterator[IUserRepositoryInterface]:
+    """Repositório com sessão própria, que sobrevive ao fim da requisição"""
+    async with async_session() as session:
+        yield user_repository.UserRepository(
+            session=session,
+            user_cache=user_cache,
+            soft_delete=settings.USER_SOFT_DELETE,
+        )
+
+
+password_rehasher = PasswordRehasher(
+    needs_rehash=password_needs_rehash,
+    password_hasher=get_password_hash_async,
+    repository_scope=user_repository_scope,
+)
+
+user_purge_job = UserPurgeJob(
+    repository_scope=user_repository_scope,
+    retention=settings.USER_PURGE_RETENTION,
+    interval=settings.USER_PURGE_INTERVAL,
+    batch_size=settings.USER_PURGE_BATCH_SIZE,
+)
+
+user_loader = UserLoader(
+    repository_scope=user_repository_scope,
+    window=settings.USER_LOADER_WINDOW,
+    max_batch_size=settings.USER_LOADER_MAX_BATCH_SIZE,
+)
+
+
+def get_user_loader() -> UserLoader:
+    return user_loader
+
+
+def _build_idempotency_store() -> IIdempotencyStore:
+    if settings.IDEMPOTENCY_BACKEND == 'database':
+        return DatabaseIdempotencyStore(
+            session_factory=async_session,
+            ttl=settings.IDEMPOTENCY_TTL,
+            claim_ttl=settings.IDEMPOTENCY_CLAIM_TTL,
+        )
+    return MemoryIdempotencyStore(
+        max_size=settings.IDEMPOTENCY_MAX_SIZE, ttl=settings.IDEMPOTENCY_TTL
+    )
+
+
+idempotency_store = _build_idempotency_store()
+user_create_idempotency = IdempotencyManager(
+    idempotency_store, poll_interval=settings.IDEMPOTENCY_POLL_INTERVAL
+)
+# A memória já é limitada por tamanho e TTL; só a tabela precisa de purga
+idempotency_purge_job = (
+    IdempotencyPurgeJob(
+        idempotency_store,
+        interval=settings.IDEMPOTENCY_PURGE_INTERVAL,
+        batch_size=settings.IDEMPOTENCY_PURGE_BATCH_SIZE,
+    )
+    if isinstance(idempotency_store, DatabaseIdempotencyStore)
+    else None
+)
 
 
 def get_user_service(
@@ -34,7 +131,48 @@ def get_user_service(
     ],
 ) -> UserService:
     return UserService(
-        user_repository=user_repository, password_hasher=get_password_hash
+        user_repository=user_repository,
+        password_hasher=get_password_hash_async,
+        repository_scope=user_repository_scope,
+    )
+
+
+async def load_revoked_sessions(
+    since: datetime,
+) -> list[tuple[UUID, datetime]]:
+    async with async_session() as session:
+        return await RefreshTokenRepository(session).revoked_sessions_since(
+            since
+        )
+
+
+revocation_list = RevocationList(
+    loader=load_revoked_sessions,
+    ttl=settings.JWT_ACCESS_TOKEN_TTL + settings.JWT_LEEWAY,
+    poll_interval=settings.TOKEN_REVOCATION_POLL_INTERVAL,
+)
+
+
+def get_refresh_token_repository(
+    session: Session,
+) -> IRefreshTokenRepositoryInterface:
+    return RefreshTokenRepository(session=session)
+
+
+def get_token_service(
+    refresh_tokens: Annotated[
+        IRefreshTokenRepositoryInterface,
+        Depends(get_refresh_token_repository),
+    ],
+    user_loader: Annotated[UserLoader, Depends(get_user_loader)],
+) -> TokenService:
+    return TokenService(
+        refresh_tokens=refresh_tokens,
+        token_creator=create_access_token,
+        access_token_ttl=settings.JWT_ACCESS_TOKEN_TTL,
+        refresh_token_ttl=settings.JWT_REFRESH_TOKEN_TTL,
+        user_loader=user_loader,
+        revocation_list=revocation_list,
     )
 
 
@@ -42,48 +180,92 @@ def get_auth_service(
     user_repository: Annotated[
         IUserRepositoryInterface, Depends(get_user_repository)
     ],
+    user_loader: Annotated[UserLoader, Depends(get_user_loader)],
+    token_service: Annotated[TokenService, Depends(get_token_service)],
 ) -> IAuthServiceInterface:
     """Factory para serviço de autenticação"""
     return AuthService(
         user_repository=user_repository,
-        password_verifier=verify_password,
+        password_verifier=verify_password_async,
         token_creator=create_access_token,
+        dummy_hash_provider=get_dummy_password_hash,
+        user_cache=user_cache,
+        rate_limiter=(
+            login_rate_limiter if settings.LOGIN_RATE_LIMIT_ENABLED else None
+        ),
+        password_rehasher=password_rehasher,
+        user_loader=user_loader,
+        token_service=token_service,
     )
 
 
-async def get_current_user(
-    user_repository: Annotated[
-        IUserRepositoryInterface, Depends(get_user_repository)
-    ],
+async def get_token_claims(
     token: str = Depends(oauth2_scheme),
-):
-    try:
-        payload = decode(
-            token,
-            settings.JWT_SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM],
-            audience=settings.JWT_AUDIENCE,
-            issuer=settings.JWT_ISSUER,
-        )
-        sub_user_id = payload.get('sub')
+) -> dict[str, Any]:
+    """Valida o access token sem acessar o banco
 
-        if not sub_user_id:
-            raise UserNotAuthenticated()
+    Tokens de sessões revogadas são recusados assim que a revogação
+    chega à ``revocation_list``.
+    """
+    try:
+        claims = decode_access_token(token)
+    except InvalidTokenError:
+        raise UserNotAuthenticated()
 
+    session_id = claims.get('sid')
+    if session_id is not None:
         try:
-            user_id = (
-                UUID(sub_user_id)
-                if isinstance(sub_user_id, str)
-                else sub_user_id
-            )
+            revoked = revocation_list.is_revoked(UUID(session_id))
         except ValueError:
             raise UserNotAuthenticated()
-    except DecodeError:
+        if revoked:
+            raise UserNotAuthenticated()
+    return claims
+
+
+def _claims_user_id(claims: dict[str, Any]) -> UUID:
+    sub_user_id = claims.get('sub')
+    if not sub_user_id:
+        raise UserNotAuthenticated()
+
+    try:
+        return (
+            UUID(sub_user_id) if isinstance(sub_user_id, str) else sub_user_id
+        )
+    except ValueError:
         raise UserNotAuthenticated()
 
-    user = await user_repository.get_by_id(user_id)
+
+async def get_current_user(
+    user_loader: Annotated[UserLoader, Depends(get_user_loader)],
+    claims: Annotated[dict[str, Any], Depends(get_token_claims)],
+) -> UserResponse:
+    user_id = _claims_user_id(claims)
+
+    cached_user = await user_cache.get(user_id)
+    if cached_user is not None:
+        return cached_user
+
+    user = await user_loader.get_view_by_id(user_id)
 
     if not user:
         raise UserNotAuthenticated()
 
-    return user
+    current_user = user.to_response()
+    await user_cache.set(current_user)
+    return current_user
+
+
+async def require_admin(
+    repository: Annotated[
+        IUserRepositoryInterface, Depends(get_user_repository)
+    ],
+    claims: Annotated[dict[str, Any], Depends(get_token_claims)],
+) -> None:
+    """Restringe a rota a administradores
+
+    O papel é lido do banco a cada requisição, sem cache, para que
+    revogar o acesso valha imediatamente.
+    """
+    if not await repository.is_admin(_claims_user_id(claims)):
+        raise UserNotAdmin()
@@ -0,0 +1,24 @@
+import hashlib
+
+from fastapi import APIRouter, Request, Response
+
+from app.config import settings
+from app.signing_keys import get_key_ring
+
+router = APIRouter()
+
+_EMPTY_JWKS = b'{"keys":[]}'
+
+
+@router.get('/.well-known/jwks.json', include_in_schema=False)
+async def jwks(request: Request) -> Response:
+    key_ring = get_key_ring()
+    body = key_ring.jwks_json if key_ring is not None else _EMPTY_JWKS
+    etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    headers = {
+        'Cache-Control': f'public, max-age={settings.JWT_JWKS_MAX_AGE}',
+        'ETag': etag,
+    }
+    if request.headers.get('if-none-match') == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type='application/json', headers=headers)
@@ -1,12 +1,28 @@
+from collections.abc import AsyncIterator
 from http import HTTPStatus
-from typing import Annotated, Any
+from typing import Annotated, Any, Optional, cast
+from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Query, Request
+from fastapi import Response as HTTPResponse
+from fastapi.responses import StreamingResponse
+from pydantic_core import from_json
 
-from app.routers.deps import get_user_service
+from app.exception import BadRequest, PermissionDenied
+from app.routers.deps import (
+    get_current_user,
+    get_user_service,
+    require_admin,
+    user_create_idempotency,
+)
 from app.schemas.response import Response
+from app.schemas.user.user_import import UserImportResult
 from app.schemas.user.user_input_create import UserCreate, UserResponse
+from app.schemas.user.user_list import UserExportFormat, UserPage
+from app.schemas.user.user_update import UserUpdate
 from app.services.user.user_service_interface import IUserServiceInterface
+from app.utils.json_response import FastJSONResponse
+from app.utils.ndjson import iter_ndjson_lines
 
 router = APIRouter(
     prefix='/users',
@@ -20,7 +36,8 @@ UserService = Annotated[IUserServiceInterface, Depends(get_user_service)]
     status_code=HTTPStatus.CREATED,
     summary='Create a new user',
     description='This endpoint allows you to create a new user in the system. '
-    "You need to provide the user's email, password, first name, last name, and optionally a phone number.",  # noqa: E501
+    "You need to provide the user's email, password, first name, last name, and optionally a phone number. "  # noqa: E501
+    'Send an `Idempotency-Key` header to safely retry: the first response is replayed for the same key and body.',  # noqa: E501
     responses={
         HTTPStatus.CREATED.value: {
             'model': Response[UserResponse],
@@ -32,7 +49,7 @@ UserService = Annotated[IUserServiceInterface, Depends(get_user_service)]
         },
         HTTPStatus.UNPROCESSABLE_ENTITY.value: {
             'model': Response[Any],
-            'description': 'Invalid input data. Please check the provided information.',  # noqa: E501
+            'description': 'Invalid input data, or `Idempotency-Key` reused with a different body.',  # noqa: E501
         },
         HTTPStatus.INTERNAL_SERVER_ERROR.value: {
             'model': Response[Any],
@@ -45,7 +62,200 @@ UserService = Annotated[IUserServiceInterface, Depends(get_user_service)]
     },
 )
 async def create_user(
+    request: Request,
     user: UserCreate,
     user_service: UserService,
-) -> Response[UserResponse]:
-    return await user_service.store(user)
+    idempotency_key: Annotated[
+        Optional[str], Header(alias='Idempotency-Key', max_length=255)
+    ] = None,
+) -> HTTPResponse:
+    async def create() -> FastJSONResponse:
+        response = await user_service.store(user)
+        return FastJSONResponse(
+            content=response, status_code=response.status_code
+        )
+
+    if idempotency_key is None:
+        return await create()
+    return await user_create_idempotency.execute(
+        f'POST /users:{idempotency_key}', await request.body(), create
+    )
+
+
+@router.get(
+    '',
+    response_model=Response[UserPage],
+    status_code=HTTPStatus.OK,
+    summary='List users',
+    description='This endpoint lists users ordered by creation date using cursor pagination. '  # noqa: E501
+    'Use the returned `next_cursor` to fetch the next page.',
+    dependencies=[Depends(require_admin)],
+    responses={
+        HTTPStatus.OK.value: {
+            'model': Response[UserPage],
+            'description': 'Users found successfully.',
+        },
+        HTTPStatus.BAD_REQUEST.value: {
+            'model': Response[Any],
+            'description': 'Invalid cursor or query parameters.',
+        },
+        HTTPStatus.UNAUTHORIZED.value: {
+            'model': Response[Any],
+            'description': 'User not authenticated.',
+        },
+        HTTPStatus.FORBIDDEN.value: {
+            'model': Response[Any],
+            'description': 'User is not an administrator.',
+        },
+    },
+)
+async def list_users(
+    user_service: UserService,
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    cursor: Optional[str] = None,
+) -> FastJSONResponse:
+    response = await user_service.list_users(limit=limit, cursor=cursor)
+    return FastJSONResponse(content=response)
+
+
+@router.get(
+    '/export',
+    status_code=HTTPStatus.OK,
+    summary='Export users',
+    description='This endpoint streams every user as NDJSON or CSV using a server-side cursor.',  # noqa: E501
+    dependencies=[Depends(require_admin)],
+    response_class=StreamingResponse,
+    responses={
+        HTTPStatus.OK.value: {
+            'content': {'application/x-ndjson': {}, 'text/csv': {}},
+            'description': 'Users exported successfully.',
+        },
+        HTTPStatus.UNAUTHORIZED.value: {
+            'model': Response[Any],
+            'description': 'User not authenticated.',
+        },
+        HTTPStatus.FORBIDDEN.value: {
+            'model': Response[Any],
+            'description': 'User is not an administrator.',
+        },
+    },
+)
+async def export_users(
+    user_service: UserService,
+    export_format: Annotated[
+        UserExportFormat, Query(alias='format')
+    ] = UserExportFormat.NDJSON,
+) -> StreamingResponse:
+    media_type = (
+        'text/csv'
+        if export_format == UserExportFormat.CSV
+        else 'application/x-ndjson'
+    )
+    filename = f'users.{export_format.value}'
+    return StreamingResponse(
+        user_service.export_users(export_format),
+        media_type=media_type,
+        headers={'Content-Disposition': f'attachment; filename="{filename}"'},
+    )
+
+
+async def _iter_json_array(request: Request) -> AsyncIterator[object]:
+    try:
+        records: object = from_json(await request.body())
+    except ValueError as e:
+        raise BadRequest('JSON inválido.') from e
+    if not isinstance(records, list):
+        raise BadRequest('O corpo deve ser uma lista de usuários.')
+    for record in cast(list[object], records):
+        yield record
+
+
+@router.post(
+    '/import',
+    response_model=Response[UserImportResult],
+    status_code=HTTPStatus.OK,
+    summary='Bulk import users',
+    description='This endpoint imports many users at once from a JSON array (`application/json`) '  # noqa: E501
+    'or a NDJSON stream (`application/x-ndjson`). Conflicts and invalid rows are reported per row.',  # noqa: E501
+    dependencies=[Depends(require_admin)],
+    responses={
+        HTTPStatus.OK.value: {
+            'model': Response[UserImportResult],
+            'description': 'Import finished. Check `errors` for rejected rows.',  # noqa: E501
+        },
+        HTTPStatus.BAD_REQUEST.value: {
+            'model': Response[Any],
+            'description': 'Malformed request body.',
+        },
+        HTTPStatus.UNAUTHORIZED.value: {
+            'model': Response[Any],
+            'description': 'User not authenticated.',
+        },
+        HTTPStatus.FORBIDDEN.value: {
+            'model': Response[Any],
+            'description': 'User is not an administrator.',
+        },
+        HTTPStatus.SERVICE_UNAVAILABLE.value: {
+            'model': Response[Any],
+            'description': 'Password hashing pool is saturated. Retry later.',
+        },
+    },
+)
+async def import_users(
+    request: Request,
+    user_service: UserService,
+) -> FastJSONResponse:
+    content_type = request.headers.get('content-type', '')
+    records = (
+        iter_ndjson_lines(request.stream())
+        if 'ndjson' in content_type
+        else _iter_json_array(request)
+    )
+    response = await user_service.import_users(records)
+    return FastJSONResponse(content=response)
+
+
+@router.patch(
+    '/{user_id}',
+    response_model=Response[UserResponse],
+    status_code=HTTPStatus.OK,
+    summary='Update a user',
+    description='This endpoint updates only the fields sent in the body. The password is rehashed only when provided. '  # noqa: E501
+    'Send the last seen `updated_at` to reject the update if the user changed in the meantime.',  # noqa: E501
+    responses={
+        HTTPStatus.OK.value: {
+            'model': Response[UserResponse],
+            'description': 'User updated successfully.',
+        },
+        HTTPStatus.BAD_REQUEST.value: {
+            'model': Response[Any],
+            'description': 'Invalid input data. Please check the provided information.',  # noqa: E501
+        },
+        HTTPStatus.UNAUTHORIZED.value: {
+            'model': Response[Any],
+            'description': 'User not authenticated.',
+        },
+        HTTPStatus.FORBIDDEN.value: {
+            'model': Response[Any],
+            'description': 'Users can only update themselves.',
+        },
+        HTTPStatus.NOT_FOUND.value: {
+            'model': Response[Any],
+            'description': 'User not found.',
+        },
+        HTTPStatus.CONFLICT.value: {
+            'model': Response[Any],
+            'description': 'Email or phone already in use, or the user was modified since `updated_at`.',  # noqa: E501
+        },
+    },
+)
+async def update_user(
+    user_id: UUID,
+    user: UserUpdate,
+    user_service: UserService,
+    current_user: Annotated[UserResponse, Depends(get_current_user)],
+) -> FastJSONResponse:
+    if current_user.id != user_id:
+        raise PermissionDenied()
+    response = await user_service.update_user(user_id, user)
+    return FastJSONResponse(content=response, status_code=response.status_code)
@@ -1,8 +1,13 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
+
+# Limites das colunas de ``tb_users``; valores maiores falhariam no banco
+NAME_MAX_LENGTH = 80
+EMAIL_MAX_LENGTH = 200
+PHONE_MAX_LENGTH = 15
 
 
 class UserBase(BaseModel):
-    first_name: str
-    last_name: str
-    email: EmailStr
-    phone: str
+    first_name: str = Field(max_length=NAME_MAX_LENGTH)
+    last_name: str = Field(max_length=NAME_MAX_LENGTH)
+    email: EmailStr = Field(max_length=EMAIL_MAX_LENGTH)
+    phone: str = Field(max_length=PHONE_MAX_LENGTH)
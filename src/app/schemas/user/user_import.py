@@ -0,0 +1,16 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class UserImportError(BaseModel):
+    row: int
+    email: Optional[str] = None
+    error: str
+    message: str
+
+
+class UserImportResult(BaseModel):
+    created: int
+    failed: int
+    errors: list[UserImportError]
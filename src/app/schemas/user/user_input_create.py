@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from pydantic import UUID4, ConfigDict
 
 from .base import UserBase
@@ -10,5 +12,6 @@ class UserCreate(UserBase):
 class UserResponse(UserBase):
     is_active: bool
     id: UUID4
+    updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,16 @@
+from enum import StrEnum
+from typing import Optional
+
+from pydantic import BaseModel
+
+from .user_input_create import UserResponse
+
+
+class UserPage(BaseModel):
+    items: list[UserResponse]
+    next_cursor: Optional[str] = None
+
+
+class UserExportFormat(StrEnum):
+    NDJSON = 'ndjson'
+    CSV = 'csv'
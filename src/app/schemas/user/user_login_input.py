@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel, EmailStr
 
 
@@ -9,3 +11,9 @@ class UserLoginInput(BaseModel):
 class UserLoginResponse(BaseModel):
     access_token: str
     token_type: str = 'Bearer'
+    expires_in: Optional[int] = None
+    refresh_token: Optional[str] = None
+
+
+class RefreshTokenInput(BaseModel):
+    refresh_token: str
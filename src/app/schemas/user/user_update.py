@@ -0,0 +1,30 @@
+from datetime import datetime
+from typing import Optional, Self
+
+from pydantic import BaseModel, EmailStr, Field, model_validator
+
+from .base import EMAIL_MAX_LENGTH, NAME_MAX_LENGTH, PHONE_MAX_LENGTH
+
+REQUIRED_FIELDS = ('first_name', 'last_name', 'email', 'phone', 'password')
+
+
+class UserUpdate(BaseModel):
+    """Atualização parcial: só os campos enviados são alterados
+
+    ``updated_at``, se enviado, deve ser o valor lido pelo cliente; a
+    atualização é recusada se o usuário mudou desde então.
+    """
+
+    first_name: Optional[str] = Field(None, max_length=NAME_MAX_LENGTH)
+    last_name: Optional[str] = Field(None, max_length=NAME_MAX_LENGTH)
+    email: Optional[EmailStr] = Field(None, max_length=EMAIL_MAX_LENGTH)
+    phone: Optional[str] = Field(None, max_length=PHONE_MAX_LENGTH)
+    password: Optional[str] = None
+    updated_at: Optional[datetime] = None
+
+    @model_validator(mode='after')
+    def reject_null_required(self) -> Self:
+        for name in REQUIRED_FIELDS:
+            if name in self.model_fields_set and getattr(self, name) is None:
+                raise ValueError(f'{name} não pode ser nulo')
+        return self
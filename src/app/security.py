@@ -1,31 +1,141 @@
+import hashlib
+import secrets
+import time
 from datetime import datetime, timedelta
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+from uuid import UUID, uuid4
 from zoneinfo import ZoneInfo
 
-from jwt import encode
+from jwt import InvalidTokenError, decode, encode, get_unverified_header
 from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
 
+from app.cache import TTLCache
 from app.config import settings
+from app.metrics.instruments import cache_metrics_hook
+from app.signing_keys import get_key_ring
+from app.utils.worker_pool import BoundedWorkerPool
 
-pwd_context = PasswordHash.recommended()
+pwd_context = PasswordHash((
+    Argon2Hasher(
+        time_cost=settings.PASSWORD_ARGON2_TIME_COST,
+        memory_cost=settings.PASSWORD_ARGON2_MEMORY_COST,
+        parallelism=settings.PASSWORD_ARGON2_PARALLELISM,
+    ),
+))
+password_pool = BoundedWorkerPool(
+    max_workers=settings.PASSWORD_HASHER_WORKERS,
+    queue_size=settings.PASSWORD_HASHER_QUEUE_SIZE,
+    executor=settings.PASSWORD_HASHER_EXECUTOR,
+)
+token_cache: TTLCache[bytes, Dict[str, Any]] = TTLCache(
+    max_size=settings.JWT_CACHE_MAX_SIZE,
+    ttl=0,
+    metrics_hook=cache_metrics_hook('jwt'),
+)
+_dummy_password_hash: Optional[str] = None
 
 
 def create_access_token(data: Dict[str, Any]) -> str:
+    """Token de curta duração (``JWT_ACCESS_TOKEN_TTL`` segundos)
+
+    Recebe um ``jti`` único; ``data`` pode trazer o ``sid`` da sessão,
+    usado na revogação.
+    """
     to_encode = data.copy()
-    expire = datetime.now(ZoneInfo('UTC')) + timedelta(
-        days=settings.JWT_EXPIRATION
-    )
+    now = datetime.now(ZoneInfo('UTC'))
     to_encode.update({
-        'exp': expire,
+        'iat': now,
+        'exp': now + timedelta(seconds=settings.JWT_ACCESS_TOKEN_TTL),
+        'jti': uuid4().hex,
         'iss': settings.JWT_ISSUER,
         'aud': settings.JWT_AUDIENCE,
     })
 
-    token_decode = encode(
-        to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM
+    key_ring = get_key_ring()
+    if key_ring is None:
+        return encode(
+            to_encode,
+            settings.JWT_SECRET_KEY,
+            algorithm=settings.JWT_ALGORITHM,
+        )
+
+    signing_key = key_ring.signing_key
+    return encode(
+        to_encode,
+        signing_key.private_key,
+        algorithm=signing_key.algorithm,
+        headers={'kid': signing_key.kid},
     )
 
-    return str(token_decode, 'utf-8')
+
+def _verification_key(token: str) -> Any:
+    """Segredo HMAC ou chave pública indicada pelo ``kid`` do token
+
+    Um ``kid`` ausente ou desconhecido (chave já removida da rotação ou
+    token forjado) torna o token inválido, não um erro de configuração.
+    """
+    key_ring = get_key_ring()
+    if key_ring is None:
+        return settings.JWT_SECRET_KEY
+
+    signing_key = key_ring.get(get_unverified_header(token).get('kid'))
+    if signing_key is None:
+        raise InvalidTokenError('Chave de assinatura desconhecida.')
+    return signing_key.public_key
+
+
+def decode_access_token(token: str) -> Dict[str, Any]:
+    """Valida o token e retorna as claims, reaproveitando validações
+
+    As claims ficam em cache, indexadas pelo SHA-256 do token, até
+    ``exp + JWT_LEEWAY``. As claims retornadas não devem ser alteradas.
+
+    Raises:
+        jwt.InvalidTokenError: Se o token for inválido ou expirado
+    """
+    key = hashlib.sha256(token.encode()).digest()
+    cached_claims = token_cache.get(key)
+    if cached_claims is not None:
+        return cached_claims
+
+    claims: Dict[str, Any] = decode(
+        token,
+        _verification_key(token),
+        algorithms=[settings.JWT_ALGORITHM],
+        audience=settings.JWT_AUDIENCE,
+        issuer=settings.JWT_ISSUER,
+        leeway=settings.JWT_LEEWAY,
+    )
+
+    exp = claims.get('exp')
+    if isinstance(exp, (int, float)):
+        ttl = exp + settings.JWT_LEEWAY - time.time()
+        if ttl > 0:
+            token_cache.set(key, claims, ttl=ttl)
+
+    return claims
+
+
+def hash_refresh_token_secret(secret: str) -> str:
+    return hashlib.sha256(secret.encode()).hexdigest()
+
+
+def create_refresh_token(token_id: UUID) -> tuple[str, str]:
+    """Gera um refresh token opaco ``<id>.<segredo>`` e o hash do segredo"""
+    secret = secrets.token_urlsafe(32)
+    return f'{token_id}.{secret}', hash_refresh_token_secret(secret)
+
+
+def parse_refresh_token(token: str) -> Optional[tuple[UUID, str]]:
+    """Separa o refresh token em ``(id, hash do segredo)``"""
+    token_id, _, secret = token.partition('.')
+    if not secret:
+        return None
+    try:
+        return UUID(token_id), hash_refresh_token_secret(secret)
+    except ValueError:
+        return None
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -34,3 +144,34 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Indica se o hash usa parâmetros diferentes dos configurados"""
+    return pwd_context.current_hasher.check_needs_rehash(hashed_password)
+
+
+async def verify_password_async(
+    plain_password: str, hashed_password: str
+) -> bool:
+    return await password_pool.run(
+        verify_password, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    return await password_pool.run(get_password_hash, password)
+
+
+async def get_dummy_password_hash() -> str:
+    """Hash de uma senha aleatória, usado quando o usuário não existe
+
+    Verificar a senha contra ele faz o login de emails inexistentes
+    custar o mesmo que o de emails existentes.
+    """
+    global _dummy_password_hash  # noqa: PLW0603
+    if _dummy_password_hash is None:
+        _dummy_password_hash = await get_password_hash_async(
+            secrets.token_urlsafe(32)
+        )
+    return _dummy_password_hash
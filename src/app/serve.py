@@ -0,0 +1,205 @@
+"""Servidor de produção: workers por CPU e desligamento gradual.
+
+Sobe ``app.main:app`` com uvicorn (padrão) ou gunicorn + UvicornWorker.
+Usa uvloop e httptools quando instalados. No SIGTERM o servidor para de
+aceitar conexões, espera as requisições em andamento por até
+``--graceful-timeout`` segundos e executa o shutdown do ``lifespan``,
+que fecha os pools de conexão.
+
+O pool de cada worker é limitado para que ``workers * (pool_size +
+max_overflow)`` caiba no ``max_connections`` do banco, descontadas as
+conexões reservadas.
+
+Uso:
+    python -m app.serve --server gunicorn --host 0.0.0.0
+"""
+
+import argparse
+import logging
+import os
+from importlib.util import find_spec
+from typing import Any, Optional
+
+from app.config import settings
+
+logger = logging.getLogger('app.serve')
+
+APP = 'app.main:app'
+
+
+def default_workers() -> int:
+    """CPUs disponíveis para o processo (respeita affinity/cgroups)"""
+    if hasattr(os, 'sched_getaffinity'):
+        return max(1, len(os.sched_getaffinity(0)))
+    return os.cpu_count() or 1
+
+
+def fetch_max_connections() -> Optional[int]:
+    """Conexões disponíveis no primário, descontadas as de superusuário"""
+    from sqlalchemy import create_engine, make_url, text  # noqa: PLC0415
+    from sqlalchemy.pool import NullPool  # noqa: PLC0415
+
+    url = make_url(settings.DATABASE_URL)
+    if url.get_driver_name() != 'psycopg':
+        return None
+
+    engine = create_engine(
+        url, poolclass=NullPool, connect_args={'connect_timeout': 5}
+    )
+    try:
+        with engine.connect() as connection:
+            return connection.execute(
+                text(
+                    "SELECT current_setting('max_connections')::int"
+                    " - current_setting('superuser_reserved_connections')::int"
+                )
+            ).scalar_one()
+    except Exception as e:
+        logger.warning('Não foi possível ler max_connections: %r', e)
+        return None
+    finally:
+        engine.dispose()
+
+
+def size_pools(workers: int) -> tuple[int, int]:
+    """Ajusta ``DB_POOL_SIZE``/``DB_MAX_OVERFLOW`` por worker
+
+    Usa ``DB_MAX_CONNECTIONS`` ou, se ausente, consulta o banco. Os
+    valores vão para ``os.environ`` (herdado pelos workers) e para o
+    ``settings`` do processo atual.
+    """
+    pool_size = settings.DB_POOL_SIZE
+    max_overflow = settings.DB_MAX_OVERFLOW
+    max_connections = settings.DB_MAX_CONNECTIONS or fetch_max_connections()
+
+    if max_connections is not None:
+        available = max_connections - settings.DB_RESERVED_CONNECTIONS
+        budget = max(1, available // workers)
+        if pool_size + max_overflow > budget:
+            pool_size = min(pool_size, budget)
+            max_overflow = budget - pool_size
+            logger.warning(
+                'Pool limitado a %d+%d conexões por worker '
+                '(%d workers, max_connections=%d)',
+                pool_size,
+                max_overflow,
+                workers,
+                max_connections,
+            )
+
+    for name, value in (
+        ('DB_POOL_SIZE', pool_size),
+        ('DB_MAX_OVERFLOW', max_overflow),
+        (
+            'DB_POOL_WARMUP_CONNECTIONS',
+            min(settings.DB_POOL_WARMUP_CONNECTIONS, pool_size),
+        ),
+    ):
+        os.environ[name] = str(value)
+        setattr(settings, name, value)
+    return pool_size, max_overflow
+
+
+def run_uvicorn(args: argparse.Namespace) -> None:
+    import uvicorn  # noqa: PLC0415
+
+    uvicorn.run(
+        APP,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        loop='uvloop' if find_spec('uvloop') else 'asyncio',
+        http='httptools' if find_spec('httptools') else 'h11',
+        proxy_headers=True,
+        forwarded_allow_ips=args.forwarded_allow_ips,
+        timeout_keep_alive=args.keep_alive,
+        timeout_graceful_shutdown=int(args.graceful_timeout),
+        log_level=args.log_level,
+    )
+
+
+def run_gunicorn(args: argparse.Namespace) -> None:
+    # gunicorn não publica tipos; o uso aqui se limita a esta classe
+    from gunicorn.app.base import (  # noqa: PLC0415  # pyright: ignore[reportMissingTypeStubs]
+        BaseApplication,
+    )
+
+    options: dict[str, Any] = {
+        'bind': f'{args.host}:{args.port}',
+        'workers': args.workers,
+        'worker_class': 'uvicorn.workers.UvicornWorker',
+        'graceful_timeout': int(args.graceful_timeout),
+        'timeout': 120,
+        'keepalive': args.keep_alive,
+        'forwarded_allow_ips': args.forwarded_allow_ips,
+        'max_requests': args.max_requests,
+        'max_requests_jitter': args.max_requests // 10,
+        'accesslog': '-',
+        'errorlog': '-',
+        'loglevel': args.log_level,
+    }
+
+    class Application(BaseApplication):
+        def load_config(self) -> None:
+            # ``cfg`` é criado por BaseApplication antes de load_config
+            assert self.cfg is not None
+            for key, value in options.items():
+                self.cfg.set(key, value)  # pyright: ignore[reportUnknownMemberType]
+
+        def load(self) -> Any:  # noqa: PLR6301
+            from app.main import app  # noqa: PLC0415
+
+            return app
+
+    Application().run()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument(
+        '--server', choices=['uvicorn', 'gunicorn'], default='uvicorn'
+    )
+    parser.add_argument('--host', default=settings.SERVER_HOST)
+    parser.add_argument('--port', type=int, default=settings.SERVER_PORT)
+    parser.add_argument('--workers', type=int, default=settings.SERVER_WORKERS)
+    parser.add_argument(
+        '--graceful-timeout',
+        type=float,
+        default=settings.SERVER_GRACEFUL_TIMEOUT,
+    )
+    parser.add_argument(
+        '--keep-alive', type=int, default=settings.SERVER_KEEP_ALIVE
+    )
+    parser.add_argument(
+        '--forwarded-allow-ips', default=settings.SERVER_FORWARDED_ALLOW_IPS
+    )
+    parser.add_argument(
+        '--max-requests',
+        type=int,
+        default=1000,
+        help='reinicia o worker após N requisições (gunicorn)',
+    )
+    parser.add_argument('--log-level', default='info')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=args.log_level.upper())
+    args.workers = args.workers or default_workers()
+    pool_size, max_overflow = size_pools(args.workers)
+    logger.info(
+        '%s com %d workers, pool %d+%d por worker',
+        args.server,
+        args.workers,
+        pool_size,
+        max_overflow,
+    )
+
+    if args.server == 'gunicorn':
+        run_gunicorn(args)
+    else:
+        run_uvicorn(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,16 @@
 from .auth_service import AuthService
 from .auth_service_interface import IAuthServiceInterface
+from .login_rate_limiter import LoginRateLimiter, login_rate_limiter
+from .password_rehasher import PasswordRehasher
+from .revocation_list import RevocationList
+from .token_service import TokenService
 
-__all__ = ['IAuthServiceInterface', 'AuthService']
+__all__ = [
+    'IAuthServiceInterface',
+    'AuthService',
+    'LoginRateLimiter',
+    'PasswordRehasher',
+    'RevocationList',
+    'TokenService',
+    'login_rate_limiter',
+]
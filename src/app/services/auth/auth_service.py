@@ -1,60 +1,129 @@
-from typing import Dict, Protocol
+from typing import Optional, Protocol
 
 from app.exceptions.user_exception import UserNotAuthenticated
 from app.models import User
-from app.repository.user import IUserRepositoryInterface
+from app.repository.user import (
+    IUserRepositoryInterface,
+    UserCache,
+    UserLoader,
+)
 from app.schemas.user.user_login_input import UserLoginInput, UserLoginResponse
-from app.services.auth import IAuthServiceInterface
+from app.services.auth.auth_service_interface import IAuthServiceInterface
+from app.services.auth.login_rate_limiter import LoginRateLimiter
+from app.services.auth.password_rehasher import PasswordRehasher
+from app.services.auth.token_service import (
+    TokenCreatorProtocol,
+    TokenService,
+)
 
 
 class PasswordVerifierProtocol(Protocol):
     """Protocol para verificação de senhas"""
 
-    def __call__(self, plain_password: str, hashed_password: str) -> bool: ...
+    async def __call__(
+        self, plain_password: str, hashed_password: str
+    ) -> bool: ...
 
 
-class TokenCreatorProtocol(Protocol):
-    """Protocol para criação de tokens"""
+class DummyHashProviderProtocol(Protocol):
+    """Protocol para obter o hash usado quando o usuário não existe"""
 
-    def __call__(self, data: Dict[str, str]) -> str: ...
+    async def __call__(self) -> str: ...
 
 
 class AuthService(IAuthServiceInterface):
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         user_repository: IUserRepositoryInterface,
         password_verifier: PasswordVerifierProtocol,
         token_creator: TokenCreatorProtocol,
+        *,
+        dummy_hash_provider: Optional[DummyHashProviderProtocol] = None,
+        user_cache: Optional[UserCache] = None,
+        rate_limiter: Optional[LoginRateLimiter] = None,
+        password_rehasher: Optional[PasswordRehasher] = None,
+        user_loader: Optional[UserLoader] = None,
+        token_service: Optional[TokenService] = None,
     ):
         self._user_repository = user_repository
         self._password_verifier = password_verifier
         self._token_creator = token_creator
-
-    async def login(self, login_input: UserLoginInput) -> UserLoginResponse:
+        self._dummy_hash_provider = dummy_hash_provider
+        self._user_cache = user_cache
+        self._rate_limiter = rate_limiter
+        self._password_rehasher = password_rehasher
+        self._user_loader = user_loader
+        self._token_service = token_service
+
+    async def login(
+        self, login_input: UserLoginInput, client_ip: Optional[str] = None
+    ) -> UserLoginResponse:
         """
         Autentica um usuário e retorna token de acesso
 
+        Emails inexistentes ficam no cache negativo e são verificados
+        contra um hash fictício, com o mesmo custo de um email válido.
+        Hashes com parâmetros antigos são refeitos em segundo plano.
+        Com ``token_service``, abre uma sessão com refresh token.
+
         Args:
             login_input: Dados de login (email e senha)
+            client_ip: IP de origem, usado no rate limit
 
         Returns:
             UserLoginResponse: Resposta com token de acesso
 
         Raises:
+            TooManyRequests: Se o IP ou a conta excederam o limite
             UserNotAuthenticated: Se credenciais inválidas
         """
-        # Buscar usuário por email usando repositório injetado
-        user: User | None = await self._user_repository.get_by_email(
-            login_input.email
-        )
+        if self._rate_limiter is not None:
+            await self._rate_limiter.check(login_input.email, client_ip)
+
+        user = await self._find_user(login_input.email)
 
         # Validar usuário e senha
-        if not user or not self._password_verifier(
+        if user is None:
+            if self._dummy_hash_provider is not None:
+                await self._password_verifier(
+                    login_input.password, await self._dummy_hash_provider()
+                )
+            raise UserNotAuthenticated()
+
+        if not await self._password_verifier(
             login_input.password, user.password
         ):
             raise UserNotAuthenticated()
 
+        if self._password_rehasher is not None:
+            self._password_rehasher.schedule(
+                user.id, login_input.password, user.password
+            )
+
+        if self._token_service is not None:
+            return await self._token_service.start_session(user.id)
+
         # Criar token de acesso usando token creator injetado
         access_token = self._token_creator(data={'sub': str(user.id)})
 
         return UserLoginResponse(access_token=access_token)
+
+    async def _find_user(self, email: str) -> Optional[User]:
+        """Busca o usuário, consultando antes o cache negativo
+
+        Com ``user_loader``, tentativas simultâneas para o mesmo email
+        compartilham a consulta.
+        """
+        if self._user_cache is not None and self._user_cache.is_unknown_email(
+            email
+        ):
+            return None
+
+        user = (
+            await self._user_loader.get_by_email(email)
+            if self._user_loader is not None
+            else await self._user_repository.get_by_email(email)
+        )
+        if user is None and self._user_cache is not None:
+            self._user_cache.mark_unknown_email(email)
+        return user
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 
 from app.schemas.user.user_login_input import UserLoginInput, UserLoginResponse
 
@@ -7,6 +8,8 @@ class IAuthServiceInterface(ABC):
     """Interface para serviços de autenticação"""
 
     @abstractmethod
-    async def login(self, login_input: UserLoginInput) -> UserLoginResponse:
+    async def login(
+        self, login_input: UserLoginInput, client_ip: Optional[str] = None
+    ) -> UserLoginResponse:
         """Autentica um usuário e retorna token de acesso"""
         pass
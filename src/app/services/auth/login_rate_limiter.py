@@ -0,0 +1,72 @@
+from typing import Optional
+
+from app.config import settings
+from app.exception import TooManyRequests
+from app.ratelimit import (
+    IRateLimiter,
+    RedisTokenBucketRateLimiter,
+    TokenBucketRateLimiter,
+)
+
+
+class LoginRateLimiter:
+    """Limita tentativas de login por IP e por conta
+
+    O limite por IP é verificado primeiro, para que rajadas de um único
+    IP não consumam as fichas das contas atacadas.
+    """
+
+    def __init__(
+        self, ip_limiter: IRateLimiter, account_limiter: IRateLimiter
+    ):
+        self._ip_limiter = ip_limiter
+        self._account_limiter = account_limiter
+
+    async def check(self, email: str, client_ip: Optional[str]) -> None:
+        """Consome uma tentativa
+
+        Raises:
+            TooManyRequests: Se o IP ou a conta excederam o limite
+        """
+        if client_ip is not None:
+            retry_after = await self._ip_limiter.acquire(client_ip)
+            if retry_after > 0:
+                raise TooManyRequests(retry_after)
+
+        retry_after = await self._account_limiter.acquire(email.lower())
+        if retry_after > 0:
+            raise TooManyRequests(retry_after)
+
+
+def _build_limiter(
+    capacity: int, refill_rate: float, prefix: str
+) -> IRateLimiter:
+    if (
+        settings.LOGIN_RATE_LIMIT_BACKEND == 'redis'
+        and settings.CACHE_REDIS_URL
+    ):
+        return RedisTokenBucketRateLimiter(
+            url=settings.CACHE_REDIS_URL,
+            capacity=capacity,
+            refill_rate=refill_rate,
+            prefix=prefix,
+        )
+    return TokenBucketRateLimiter(
+        capacity=capacity,
+        refill_rate=refill_rate,
+        max_keys=settings.LOGIN_RATE_LIMIT_MAX_KEYS,
+    )
+
+
+login_rate_limiter = LoginRateLimiter(
+    ip_limiter=_build_limiter(
+        settings.LOGIN_RATE_LIMIT_IP_BURST,
+        settings.LOGIN_RATE_LIMIT_IP_PER_SECOND,
+        prefix='ratelimit:login:ip:',
+    ),
+    account_limiter=_build_limiter(
+        settings.LOGIN_RATE_LIMIT_ACCOUNT_BURST,
+        settings.LOGIN_RATE_LIMIT_ACCOUNT_PER_SECOND,
+        prefix='ratelimit:login:account:',
+    ),
+)
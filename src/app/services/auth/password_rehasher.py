@@ -0,0 +1,67 @@
+import asyncio
+import logging
+from typing import Callable
+from uuid import UUID
+
+from app.services.user.user_service import (
+    PasswordHasherProtocol,
+    RepositoryScopeProtocol,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class PasswordRehasher:
+    """Atualiza em segundo plano hashes gerados com parâmetros antigos
+
+    Chamado após um login bem-sucedido, quando a senha em texto puro
+    está disponível. O novo hash é calculado no pool de hash e gravado
+    com um repositório de sessão própria, sem atrasar a resposta. A
+    gravação é um compare-and-swap no primário: é ignorada se a senha
+    mudou nesse meio tempo.
+    """
+
+    def __init__(
+        self,
+        needs_rehash: Callable[[str], bool],
+        password_hasher: PasswordHasherProtocol,
+        repository_scope: RepositoryScopeProtocol,
+    ):
+        self._needs_rehash = needs_rehash
+        self._password_hasher = password_hasher
+        self._repository_scope = repository_scope
+        self._tasks: dict[UUID, asyncio.Task[None]] = {}
+
+    def schedule(
+        self, user_id: UUID, plain_password: str, hashed_password: str
+    ) -> bool:
+        """Agenda o rehash se necessário; retorna se foi agendado"""
+        if user_id in self._tasks or not self._needs_rehash(hashed_password):
+            return False
+
+        task = asyncio.create_task(
+            self._rehash(user_id, plain_password, hashed_password)
+        )
+        self._tasks[user_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(user_id, None))
+        return True
+
+    async def _rehash(
+        self, user_id: UUID, plain_password: str, hashed_password: str
+    ) -> None:
+        try:
+            new_hash = await self._password_hasher(plain_password)
+            async with self._repository_scope() as repository:
+                await repository.replace_password_hash(
+                    user_id, hashed_password, new_hash
+                )
+        except Exception:
+            logger.warning(
+                'Falha ao atualizar o hash do usuário %s',
+                user_id,
+                exc_info=True,
+            )
+
+    async def drain(self) -> None:
+        """Aguarda os rehashes em andamento"""
+        await asyncio.gather(*self._tasks.values(), return_exceptions=True)
@@ -0,0 +1,105 @@
+import asyncio
+import heapq
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from typing import Optional
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+type RevokedSessionsLoader = Callable[
+    [datetime], Awaitable[list[tuple[UUID, datetime]]]
+]
+
+
+class RevocationList:
+    """Sessões revogadas, em memória, carregadas incrementalmente
+
+    Uma sessão só precisa ficar na lista até o último access token dela
+    expirar (``revoked_at + ttl``); um heap ordenado por expiração
+    descarta as entradas vencidas. A cada ``poll_interval`` segundos
+    busca as revogações feitas desde a última carga, com ``overlap``
+    segundos de sobreposição para cobrir transações que terminaram
+    depois da consulta anterior e diferenças de relógio.
+    """
+
+    def __init__(
+        self,
+        loader: RevokedSessionsLoader,
+        ttl: float,
+        poll_interval: float = 2.0,
+        overlap: float = 30.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._loader = loader
+        self.ttl = ttl
+        self.poll_interval = poll_interval
+        self.overlap = overlap
+        self._clock = clock
+        self._revoked: dict[UUID, float] = {}
+        self._expiry: list[tuple[float, UUID]] = []
+        self._loaded_until: Optional[datetime] = None
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+    def add(self, session_id: UUID, revoked_at: datetime) -> None:
+        """Registra a revogação de uma sessão"""
+        expires_at = revoked_at.timestamp() + self.ttl
+        if expires_at <= self._clock():
+            return
+        if self._revoked.get(session_id, 0.0) >= expires_at:
+            return
+        self._revoked[session_id] = expires_at
+        heapq.heappush(self._expiry, (expires_at, session_id))
+
+    def is_revoked(self, session_id: UUID) -> bool:
+        self._prune()
+        return session_id in self._revoked
+
+    def _prune(self) -> None:
+        now = self._clock()
+        while self._expiry and self._expiry[0][0] <= now:
+            expires_at, session_id = heapq.heappop(self._expiry)
+            if self._revoked.get(session_id) == expires_at:
+                del self._revoked[session_id]
+
+    async def refresh(self) -> int:
+        """Carrega as revogações novas; retorna quantas vieram"""
+        started = datetime.fromtimestamp(self._clock(), UTC)
+        since = (
+            self._loaded_until - timedelta(seconds=self.overlap)
+            if self._loaded_until is not None
+            else started - timedelta(seconds=self.ttl)
+        )
+        revoked = await self._loader(since)
+        for session_id, revoked_at in revoked:
+            self.add(session_id, revoked_at)
+        self._loaded_until = started
+        return len(revoked)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                logger.warning(
+                    'Falha ao carregar sessões revogadas', exc_info=True
+                )
+            await asyncio.sleep(self.poll_interval)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -0,0 +1,110 @@
+from datetime import UTC, datetime, timedelta
+from typing import Any, Dict, Optional, Protocol
+from uuid import UUID, uuid4
+
+from app.exceptions.user_exception import UserNotAuthenticated
+from app.models import RefreshToken
+from app.repository.token import IRefreshTokenRepositoryInterface
+from app.repository.user import UserLoader
+from app.schemas.user.user_login_input import UserLoginResponse
+from app.security import create_refresh_token, parse_refresh_token
+from app.services.auth.revocation_list import RevocationList
+
+
+class TokenCreatorProtocol(Protocol):
+    """Protocol para criação de tokens"""
+
+    def __call__(self, data: Dict[str, Any]) -> str: ...
+
+
+class TokenService:
+    """Emite access tokens curtos e refresh tokens rotativos
+
+    Cada login abre uma sessão (``sid``). O refresh token é de uso
+    único: ao ser trocado, o anterior é revogado, e reusar um token já
+    trocado revoga a sessão inteira. Access tokens levam ``sid`` para
+    serem recusados assim que a sessão é revogada.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        refresh_tokens: IRefreshTokenRepositoryInterface,
+        token_creator: TokenCreatorProtocol,
+        access_token_ttl: int,
+        refresh_token_ttl: int,
+        *,
+        user_loader: Optional[UserLoader] = None,
+        revocation_list: Optional[RevocationList] = None,
+    ):
+        self._refresh_tokens = refresh_tokens
+        self._token_creator = token_creator
+        self._access_token_ttl = access_token_ttl
+        self._refresh_token_ttl = timedelta(seconds=refresh_token_ttl)
+        self._user_loader = user_loader
+        self._revocation_list = revocation_list
+
+    def _response(
+        self, user_id: UUID, session_id: UUID, refresh_token: str
+    ) -> UserLoginResponse:
+        claims: dict[str, Any] = {'sub': str(user_id), 'sid': str(session_id)}
+        return UserLoginResponse(
+            access_token=self._token_creator(data=claims),
+            expires_in=self._access_token_ttl,
+            refresh_token=refresh_token,
+        )
+
+    async def start_session(self, user_id: UUID) -> UserLoginResponse:
+        """Abre uma sessão para o usuário já autenticado"""
+        token_id = uuid4()
+        refresh_token, token_hash = create_refresh_token(token_id)
+        token = await self._refresh_tokens.create(
+            RefreshToken(
+                id=token_id,
+                session_id=uuid4(),
+                user_id=user_id,
+                token_hash=token_hash,
+                expires_at=datetime.now(UTC) + self._refresh_token_ttl,
+            )
+        )
+        return self._response(user_id, token.session_id, refresh_token)
+
+    async def refresh(self, refresh_token: str) -> UserLoginResponse:
+        """Troca o refresh token por um novo par de tokens
+
+        Raises:
+            UserNotAuthenticated: Se o token é inválido, expirou, já foi
+                usado ou o usuário não está mais ativo
+        """
+        parsed = parse_refresh_token(refresh_token)
+        if parsed is None:
+            raise UserNotAuthenticated()
+
+        token_id, token_hash = parsed
+        new_token_id = uuid4()
+        new_refresh_token, new_token_hash = create_refresh_token(new_token_id)
+        token = await self._refresh_tokens.rotate(
+            token_id,
+            token_hash,
+            new_token_id,
+            new_token_hash,
+            datetime.now(UTC) + self._refresh_token_ttl,
+        )
+        if token is None:
+            raise UserNotAuthenticated()
+
+        if (
+            self._user_loader is not None
+            and await self._user_loader.get_view_by_id(token.user_id) is None
+        ):
+            await self.revoke(token.session_id)
+            raise UserNotAuthenticated()
+
+        return self._response(
+            token.user_id, token.session_id, new_refresh_token
+        )
+
+    async def revoke(self, session_id: UUID) -> None:
+        """Encerra a sessão; neste processo vale imediatamente"""
+        await self._refresh_tokens.revoke_session(session_id)
+        if self._revocation_list is not None:
+            self._revocation_list.add(session_id, datetime.now(UTC))
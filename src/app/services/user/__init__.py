@@ -1,4 +1,5 @@
+from .user_purge_job import UserPurgeJob
 from .user_service import UserService
 from .user_service_interface import IUserServiceInterface
 
-__all__ = ['IUserServiceInterface', 'UserService']
+__all__ = ['IUserServiceInterface', 'UserPurgeJob', 'UserService']
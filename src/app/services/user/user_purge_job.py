@@ -0,0 +1,69 @@
+import asyncio
+import logging
+from datetime import UTC, datetime, timedelta
+from typing import Optional
+
+from app.services.user.user_service import RepositoryScopeProtocol
+
+logger = logging.getLogger(__name__)
+
+
+class UserPurgeJob:
+    """Apaga em lotes os usuários removidos há mais de ``retention``
+
+    A cada ``interval`` segundos apaga lotes de até ``batch_size``
+    linhas, cada um em sua própria transação, até não restar nada a
+    purgar. Lotes pequenos mantêm os locks e o WAL de cada transação
+    curtos.
+    """
+
+    def __init__(
+        self,
+        repository_scope: RepositoryScopeProtocol,
+        retention: float,
+        interval: float = 3600.0,
+        batch_size: int = 500,
+    ):
+        self._repository_scope = repository_scope
+        self.retention = timedelta(seconds=retention)
+        self.interval = interval
+        self.batch_size = batch_size
+        self._task: Optional[asyncio.Task[None]] = None
+
+    async def run_once(self) -> int:
+        """Purga tudo o que já expirou; retorna a quantidade apagada"""
+        before = datetime.now(UTC) - self.retention
+        total = 0
+        while True:
+            async with self._repository_scope() as repository:
+                purged = await repository.purge_deleted(
+                    before, self.batch_size
+                )
+            total += purged
+            if purged < self.batch_size:
+                return total
+            # Cede o loop entre lotes
+            await asyncio.sleep(0)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                purged = await self.run_once()
+                if purged:
+                    logger.info('%d usuários removidos purgados', purged)
+            except Exception:
+                logger.warning('Falha ao purgar usuários', exc_info=True)
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -1,19 +1,68 @@
+import asyncio
+import csv
+import io
+from collections.abc import AsyncIterable, AsyncIterator
+from contextlib import AbstractAsyncContextManager, nullcontext
 from http import HTTPStatus
-from typing import Protocol
+from typing import Any, Optional, Protocol
 from uuid import UUID
 
+from pydantic import ValidationError
+from pydantic_core import to_json
+
+from app.config import settings
+from app.exception import DetailedHTTPException
+from app.exceptions.user_exception import (
+    UserEmailAlreadyExists,
+    UserPhoneAlreadyExists,
+)
 from app.models import User
 from app.repository.user import IUserRepositoryInterface
 from app.schemas.response import Response
+from app.schemas.user.user_import import UserImportError, UserImportResult
 from app.schemas.user.user_input_create import UserCreate, UserResponse
-from app.security import get_password_hash
-from app.services.user import IUserServiceInterface
+from app.schemas.user.user_list import UserExportFormat, UserPage
+from app.schemas.user.user_update import UserUpdate
+from app.security import get_password_hash_async
+from app.services.user.user_service_interface import IUserServiceInterface
+from app.utils.pagination import decode_cursor, encode_cursor
+
+EXPORT_COLUMNS = (
+    'id',
+    'email',
+    'first_name',
+    'last_name',
+    'phone',
+    'is_active',
+    'created_at',
+)
+
+
+def _conflict(
+    row: int,
+    user: UserCreate,
+    exception: type[UserEmailAlreadyExists | UserPhoneAlreadyExists],
+) -> UserImportError:
+    return UserImportError(
+        row=row,
+        email=user.email,
+        error=exception.__name__,
+        message=exception.DETAIL,
+    )
 
 
 class PasswordHasherProtocol(Protocol):
     """Protocol para hash de senhas"""
 
-    def __call__(self, password: str) -> str: ...  # noqa: E704
+    async def __call__(self, password: str) -> str: ...
+
+
+class RepositoryScopeProtocol(Protocol):
+    """Protocol para abrir um repositório com sessão própria"""
+
+    def __call__(
+        self,
+    ) -> AbstractAsyncContextManager[IUserRepositoryInterface]: ...
 
 
 class UserService(IUserServiceInterface):
@@ -22,10 +71,12 @@ class UserService(IUserServiceInterface):
     def __init__(
         self,
         user_repository: IUserRepositoryInterface,
-        password_hasher: PasswordHasherProtocol = get_password_hash,
+        password_hasher: PasswordHasherProtocol = get_password_hash_async,
+        repository_scope: Optional[RepositoryScopeProtocol] = None,
     ):
         self._user_repository = user_repository
         self._password_hasher = password_hasher
+        self._repository_scope = repository_scope
 
     async def store(self, user: UserCreate) -> Response[UserResponse]:
         """Cria um novo usuário"""
@@ -33,7 +84,7 @@ class UserService(IUserServiceInterface):
             # Criar modelo do usuário
             user_model = User(
                 email=user.email,
-                password=self._password_hasher(user.password),
+                password=await self._password_hasher(user.password),
                 first_name=user.first_name,
                 last_name=user.last_name,
                 phone=user.phone,
@@ -48,6 +99,8 @@ class UserService(IUserServiceInterface):
                 status_code=HTTPStatus.CREATED.value,
             )
 
+        except DetailedHTTPException:
+            raise
         except ValueError as e:
             return Response[UserResponse](
                 data=None,
@@ -61,10 +114,194 @@ class UserService(IUserServiceInterface):
                 status_code=HTTPStatus.INTERNAL_SERVER_ERROR.value,
             )
 
+    async def import_users(
+        self, records: AsyncIterable[Any]
+    ) -> Response[UserImportResult]:
+        """Importa usuários em lote a partir de objetos ou linhas JSON
+
+        Cada registro é validado individualmente; conflitos e erros de
+        validação são reportados por linha sem abortar a importação.
+        """
+        errors: list[UserImportError] = []
+        batch: list[tuple[int, UserCreate]] = []
+        created = 0
+        row = 0
+
+        async for record in records:
+            row += 1
+            try:
+                user = (
+                    UserCreate.model_validate_json(record)
+                    if isinstance(record, (str, bytes))
+                    else UserCreate.model_validate(record)
+                )
+            except ValidationError as e:
+                first_error = e.errors()[0]
+                field = '.'.join(str(loc) for loc in first_error['loc'])
+                errors.append(
+                    UserImportError(
+                        row=row,
+                        error='ValidationError',
+                        message=f'{field}: {first_error["msg"]}',
+                    )
+                )
+                continue
+
+            batch.append((row, user))
+            if len(batch) >= settings.USER_IMPORT_BATCH_SIZE:
+                created += await self._import_batch(batch, errors)
+                batch = []
+
+        if batch:
+            created += await self._import_batch(batch, errors)
+
+        errors.sort(key=lambda error: error.row)
+        return Response[UserImportResult](
+            data=UserImportResult(
+                created=created, failed=len(errors), errors=errors
+            ),
+            message='Importação concluída.',
+            status_code=HTTPStatus.OK.value,
+        )
+
+    async def _import_batch(
+        self,
+        batch: list[tuple[int, UserCreate]],
+        errors: list[UserImportError],
+    ) -> int:
+        """Insere um lote, reportando conflitos sem gastar hash com eles"""
+        taken_emails, taken_phones = await self._user_repository.find_taken(
+            emails=[user.email for _, user in batch],
+            phones=[user.phone for _, user in batch if user.phone],
+        )
+
+        candidates: list[tuple[int, UserCreate]] = []
+        for row, user in batch:
+            if user.email in taken_emails:
+                errors.append(_conflict(row, user, UserEmailAlreadyExists))
+            elif user.phone and user.phone in taken_phones:
+                errors.append(_conflict(row, user, UserPhoneAlreadyExists))
+            else:
+                candidates.append((row, user))
+                taken_emails.add(user.email)
+                if user.phone:
+                    taken_phones.add(user.phone)
+
+        if not candidates:
+            return 0
+
+        semaphore = asyncio.Semaphore(settings.USER_IMPORT_HASH_CONCURRENCY)
+
+        async def hash_password(password: str) -> str:
+            async with semaphore:
+                return await self._password_hasher(password)
+
+        hashes = await asyncio.gather(
+            *(hash_password(user.password) for _, user in candidates)
+        )
+        inserted = await self._user_repository.bulk_create([
+            User(
+                email=user.email,
+                password=password_hash,
+                first_name=user.first_name,
+                last_name=user.last_name,
+                phone=user.phone,
+            )
+            for (_, user), password_hash in zip(candidates, hashes)
+        ])
+
+        # Linhas perdidas para inserções concorrentes entre a checagem e o
+        # INSERT; rara, então só aqui consultamos de novo o motivo.
+        lost = [
+            (row, user)
+            for row, user in candidates
+            if user.email not in inserted
+        ]
+        if lost:
+            taken_emails, _ = await self._user_repository.find_taken(
+                emails=[user.email for _, user in lost], phones=[]
+            )
+            for row, user in lost:
+                errors.append(
+                    _conflict(
+                        row,
+                        user,
+                        UserEmailAlreadyExists
+                        if user.email in taken_emails
+                        else UserPhoneAlreadyExists,
+                    )
+                )
+        return len(inserted)
+
+    async def list_users(
+        self, limit: int, cursor: Optional[str] = None
+    ) -> Response[UserPage]:
+        """Lista usuários com paginação por cursor"""
+        after = decode_cursor(cursor) if cursor else None
+        users = await self._user_repository.list_page(
+            limit=limit + 1, after=after
+        )
+
+        next_cursor = None
+        if len(users) > limit:
+            users = users[:limit]
+            last_user = users[-1]
+            next_cursor = encode_cursor(
+                last_user.created_at,  # type: ignore
+                last_user.id,
+            )
+
+        return Response[UserPage](
+            data=UserPage(
+                items=[UserResponse.model_validate(user) for user in users],
+                next_cursor=next_cursor,
+            ),
+            message='Usuários encontrados.',
+            status_code=HTTPStatus.OK.value,
+        )
+
+    async def export_users(
+        self, export_format: UserExportFormat
+    ) -> AsyncIterator[bytes]:
+        """Exporta todos os usuários em NDJSON ou CSV, em blocos"""
+        scope = (
+            self._repository_scope()
+            if self._repository_scope is not None
+            else nullcontext(self._user_repository)
+        )
+        batch_size = settings.USER_EXPORT_BATCH_SIZE
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        if export_format == UserExportFormat.CSV:
+            writer.writerow(EXPORT_COLUMNS)
+
+        async with scope as repository:
+            pending = 0
+            async for row in repository.stream_all(batch_size=batch_size):
+                if export_format == UserExportFormat.CSV:
+                    writer.writerow(row)
+                else:
+                    buffer.write(
+                        to_json(
+                            dict(zip(EXPORT_COLUMNS, row, strict=True))
+                        ).decode()
+                    )
+                    buffer.write('\n')
+
+                pending += 1
+                if pending >= batch_size:
+                    yield buffer.getvalue().encode()
+                    buffer.seek(0)
+                    buffer.truncate()
+                    pending = 0
+
+        if buffer.tell():
+            yield buffer.getvalue().encode()
+
     async def get_user_by_id(self, user_id: UUID) -> Response[UserResponse]:
         """Busca usuário por ID"""
         try:
-            user = await self._user_repository.get_by_id(user_id)
+            user = await self._user_repository.get_view_by_id(user_id)
 
             if not user:
                 return Response[UserResponse](
@@ -74,7 +311,7 @@ class UserService(IUserServiceInterface):
                 )
 
             return Response[UserResponse](
-                data=UserResponse.model_validate(user),
+                data=user.to_response(),
                 message='Usuário encontrado.',
                 status_code=HTTPStatus.OK.value,
             )
@@ -89,7 +326,7 @@ class UserService(IUserServiceInterface):
     async def get_user_by_email(self, email: str) -> Response[UserResponse]:
         """Busca usuário por email"""
         try:
-            user = await self._user_repository.get_by_email(email)
+            user = await self._user_repository.get_view_by_email(email)
 
             if not user:
                 return Response[UserResponse](
@@ -99,7 +336,7 @@ class UserService(IUserServiceInterface):
                 )
 
             return Response[UserResponse](
-                data=UserResponse.model_validate(user),
+                data=user.to_response(),
                 message='Usuário encontrado.',
                 status_code=HTTPStatus.OK.value,
             )
@@ -112,40 +349,31 @@ class UserService(IUserServiceInterface):
             )
 
     async def update_user(
-        self, user_id: UUID, user_data: UserCreate
+        self, user_id: UUID, user_data: UserUpdate
     ) -> Response[UserResponse]:
-        """Atualiza um usuário"""
-        try:
-            # Verificar se usuário existe
-            existing_user = await self._user_repository.get_by_id(user_id)
-            if not existing_user:
-                return Response[UserResponse](
-                    data=None,
-                    message='Usuário não encontrado.',
-                    status_code=HTTPStatus.NOT_FOUND.value,
-                )
-
-            # Atualizar campos
-            existing_user.email = user_data.email
-            existing_user.first_name = user_data.first_name
-            existing_user.last_name = user_data.last_name
-            existing_user.phone = user_data.phone
+        """Atualiza só os campos enviados
 
-            # Se senha foi fornecida, atualizar hash
-            if user_data.password:
-                existing_user.password = self._password_hasher(
+        A senha só é refeita (argon2) se foi enviada. Com ``updated_at``,
+        a atualização falha com 409 se o usuário mudou nesse meio tempo.
+        """
+        try:
+            values = user_data.model_dump(
+                exclude_unset=True, exclude={'password', 'updated_at'}
+            )
+            if user_data.password is not None:
+                values['password'] = await self._password_hasher(
                     user_data.password
                 )
 
-            # Salvar alterações
-            updated_user = await self._user_repository.update(existing_user)
-
-            return Response[UserResponse](
-                data=UserResponse.model_validate(updated_user),
-                message='Usuário atualizado com sucesso.',
-                status_code=HTTPStatus.OK.value,
+            user = (
+                await self._user_repository.update_fields(
+                    user_id, values, user_data.updated_at
+                )
+                if values
+                else await self._user_repository.get_by_id(user_id)
             )
-
+        except DetailedHTTPException:
+            raise
         except ValueError as e:
             return Response[UserResponse](
                 data=None,
@@ -159,6 +387,22 @@ class UserService(IUserServiceInterface):
                 status_code=HTTPStatus.INTERNAL_SERVER_ERROR.value,
             )
 
+        # Fora do try: a escrita já foi confirmada e uma falha daqui em
+        # diante não deve virar uma resposta de erro como se nada tivesse
+        # mudado
+        if not user:
+            return Response[UserResponse](
+                data=None,
+                message='Usuário não encontrado.',
+                status_code=HTTPStatus.NOT_FOUND.value,
+            )
+
+        return Response[UserResponse](
+            data=UserResponse.model_validate(user),
+            message='Usuário atualizado com sucesso.',
+            status_code=HTTPStatus.OK.value,
+        )
+
     async def delete_user(self, user_id: UUID) -> Response[None]:
         """Remove um usuário"""
         try:
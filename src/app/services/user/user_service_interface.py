@@ -1,8 +1,13 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Any, Optional
 from uuid import UUID
 
 from app.schemas.response import Response
+from app.schemas.user.user_import import UserImportResult
 from app.schemas.user.user_input_create import UserCreate, UserResponse
+from app.schemas.user.user_list import UserExportFormat, UserPage
+from app.schemas.user.user_update import UserUpdate
 
 
 class IUserServiceInterface(ABC):
@@ -13,6 +18,27 @@ class IUserServiceInterface(ABC):
         """Cria um novo usuário"""
         pass
 
+    @abstractmethod
+    async def import_users(
+        self, records: AsyncIterable[Any]
+    ) -> Response[UserImportResult]:
+        """Importa usuários em lote"""
+        pass
+
+    @abstractmethod
+    async def list_users(
+        self, limit: int, cursor: Optional[str] = None
+    ) -> Response[UserPage]:
+        """Lista usuários com paginação por cursor"""
+        pass
+
+    @abstractmethod
+    def export_users(
+        self, export_format: UserExportFormat
+    ) -> AsyncIterator[bytes]:
+        """Exporta todos os usuários em NDJSON ou CSV"""
+        pass
+
     @abstractmethod
     async def get_user_by_id(self, user_id: UUID) -> Response[UserResponse]:
         """Busca usuário por ID"""
@@ -25,9 +51,9 @@ class IUserServiceInterface(ABC):
 
     @abstractmethod
     async def update_user(
-        self, user_id: UUID, user_data: UserCreate
+        self, user_id: UUID, user_data: UserUpdate
     ) -> Response[UserResponse]:
-        """Atualiza um usuário"""
+        """Atualiza parcialmente um usuário"""
         pass
 
     @abstractmethod
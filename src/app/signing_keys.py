@@ -0,0 +1,92 @@
+"""Chaves assimétricas para assinar os JWTs, com rotação por ``kid``.
+
+Cada arquivo ``<kid>.pem`` em ``JWT_KEYS_DIR`` é uma chave privada. A
+chave ativa (``JWT_ACTIVE_KEY_ID`` ou, se ausente, o último ``kid`` em
+ordem alfabética) assina os tokens novos; todas são aceitas na
+verificação e publicadas em ``/.well-known/jwks.json``. Para rotacionar:
+adicione a nova chave, aguarde os clientes atualizarem o JWKS, ative-a
+e remova a antiga depois que os tokens dela expirarem.
+
+Os PEMs são lidos uma única vez; assinar e verificar usam os objetos de
+chave já carregados.
+"""
+
+import json
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from typing import Any, Optional
+
+from cryptography.hazmat.primitives.serialization import load_pem_private_key
+from jwt import get_algorithm_by_name
+
+from app.config import settings
+
+SYMMETRIC_ALGORITHMS = frozenset({'HS256', 'HS384', 'HS512'})
+
+
+@dataclass(slots=True, frozen=True)
+class SigningKey:
+    kid: str
+    algorithm: str
+    private_key: Any
+    public_key: Any
+
+    def to_jwk(self) -> dict[str, Any]:
+        # O PyJWT não anota o ``key_obj`` de ``Algorithm.to_jwk``
+        jwk = get_algorithm_by_name(self.algorithm).to_jwk(  # pyright: ignore[reportUnknownMemberType]
+            self.public_key, as_dict=True
+        )
+        jwk.update({'kid': self.kid, 'alg': self.algorithm, 'use': 'sig'})
+        return jwk
+
+
+class KeyRing:
+    """Chaves de assinatura indexadas por ``kid``"""
+
+    def __init__(self, keys: list[SigningKey], active_kid: str):
+        self._keys = {key.kid: key for key in keys}
+        if active_kid not in self._keys:
+            raise ValueError(f'Chave ativa "{active_kid}" não encontrada.')
+        self.signing_key = self._keys[active_kid]
+        self.jwks_json = json.dumps(
+            {'keys': [key.to_jwk() for key in keys]}, separators=(',', ':')
+        ).encode()
+
+    def get(self, kid: Optional[str]) -> Optional[SigningKey]:
+        return self._keys.get(kid) if kid is not None else None
+
+    @classmethod
+    def from_directory(
+        cls, path: Path, algorithm: str, active_kid: Optional[str] = None
+    ) -> 'KeyRing':
+        keys: list[SigningKey] = []
+        for pem_path in sorted(path.glob('*.pem')):
+            private_key = load_pem_private_key(
+                pem_path.read_bytes(), password=None
+            )
+            keys.append(
+                SigningKey(
+                    kid=pem_path.stem,
+                    algorithm=algorithm,
+                    private_key=private_key,
+                    public_key=private_key.public_key(),
+                )
+            )
+        if not keys:
+            raise ValueError(f'Nenhuma chave .pem em {path}.')
+        return cls(keys, active_kid or keys[-1].kid)
+
+
+@cache
+def get_key_ring() -> Optional[KeyRing]:
+    """Chaves carregadas no primeiro uso; ``None`` para algoritmos HMAC"""
+    if settings.JWT_ALGORITHM in SYMMETRIC_ALGORITHMS:
+        return None
+    if settings.JWT_KEYS_DIR is None:
+        raise ValueError(f'{settings.JWT_ALGORITHM} requer JWT_KEYS_DIR.')
+    return KeyRing.from_directory(
+        Path(settings.JWT_KEYS_DIR),
+        settings.JWT_ALGORITHM,
+        settings.JWT_ACTIVE_KEY_ID,
+    )
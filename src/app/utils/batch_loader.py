@@ -0,0 +1,86 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Mapping
+from typing import Optional
+
+
+class BatchLoader[K: Hashable, V]:
+    """Agrupa buscas por chave em uma única chamada de ``batch_fn``
+
+    Chaves pedidas na mesma volta do event loop (ou dentro de ``window``
+    segundos) são buscadas juntas; o lote é despachado antes se atingir
+    ``max_batch_size``. Uma chave já pendente ou em andamento reaproveita
+    o mesmo resultado (single-flight). Não há cache: após a resposta, a
+    próxima busca da chave vai ao banco de novo.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list[K]], Awaitable[Mapping[K, V]]],
+        window: float = 0.0,
+        max_batch_size: int = 100,
+    ):
+        self._batch_fn = batch_fn
+        self._window = window
+        self._max_batch_size = max(1, max_batch_size)
+        self._pending: dict[K, asyncio.Future[Optional[V]]] = {}
+        self._in_flight: dict[K, asyncio.Future[Optional[V]]] = {}
+        self._handle: Optional[asyncio.Handle] = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def load(self, key: K) -> Optional[V]:
+        """Busca uma chave; ``None`` se ``batch_fn`` não a retornou"""
+        future = self._in_flight.get(key) or self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = future
+            if len(self._pending) >= self._max_batch_size:
+                self._dispatch()
+            elif self._handle is None:
+                self._handle = (
+                    loop.call_later(self._window, self._dispatch)
+                    if self._window > 0
+                    else loop.call_soon(self._dispatch)
+                )
+        # Quem cancela a própria espera não cancela a busca dos outros
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Iterable[K]) -> dict[K, V]:
+        """Busca várias chaves; as ausentes ficam fora do resultado"""
+        unique = list(dict.fromkeys(keys))
+        values = await asyncio.gather(*(self.load(key) for key in unique))
+        return {
+            key: value
+            for key, value in zip(unique, values, strict=True)
+            if value is not None
+        }
+
+    def _dispatch(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, {}
+        self._in_flight.update(batch)
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: dict[K, asyncio.Future[Optional[V]]]) -> None:
+        try:
+            results = await self._batch_fn(list(batch))
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for key, future in batch.items():
+                if not future.done():
+                    future.set_result(results.get(key))
+        finally:
+            for key, future in batch.items():
+                del self._in_flight[key]
+                if not future.done():
+                    future.cancel()
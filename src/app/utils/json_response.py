@@ -0,0 +1,15 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse serializada direto para bytes pelo pydantic-core
+
+    Modelos pydantic são serializados sem o passo intermediário de
+    ``model_dump()`` + ``json.dumps``; valores desconhecidos viram ``str``.
+    """
+
+    def render(self, content: Any) -> bytes:  # noqa: PLR6301
+        return to_json(content, fallback=str)
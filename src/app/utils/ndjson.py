@@ -0,0 +1,16 @@
+from collections.abc import AsyncIterable, AsyncIterator
+
+
+async def iter_ndjson_lines(
+    chunks: AsyncIterable[bytes],
+) -> AsyncIterator[bytes]:
+    """Quebra um fluxo de bytes em linhas NDJSON não vazias"""
+    pending = b''
+    async for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b'\n')
+        for line in lines:
+            if line.strip():
+                yield line
+    if pending.strip():
+        yield pending
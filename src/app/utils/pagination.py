@@ -0,0 +1,25 @@
+import base64
+import binascii
+from datetime import datetime
+from uuid import UUID
+
+from app.exception import BadRequest
+
+Cursor = tuple[datetime, UUID]
+
+
+def encode_cursor(created_at: datetime, item_id: UUID) -> str:
+    """Codifica a posição ``(created_at, id)`` em um cursor opaco"""
+    raw = f'{created_at.isoformat()}|{item_id}'.encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    """Decodifica um cursor gerado por ``encode_cursor``"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded).decode()
+        created_at, item_id = raw.split('|', 1)
+        return datetime.fromisoformat(created_at), UUID(item_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise BadRequest('Cursor inválido.') from e
@@ -1,7 +1,8 @@
 from http import HTTPStatus
-from typing import Any, Optional, TypeVar
+from typing import Any, Mapping, Optional, TypeVar
 
 from app.schemas.response import Response
+from app.utils.json_response import FastJSONResponse
 
 T = TypeVar('T')
 
@@ -12,9 +13,14 @@ class ResponseHandler:
         data: Any = None,
         message: str = 'Sucesso',
         status_code: int = HTTPStatus.OK.value,
-    ) -> Response[Any]:
-        return Response(
-            data=data, message=message, status_code=status_code, error=None
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> FastJSONResponse:
+        return FastJSONResponse(
+            status_code=status_code,
+            content=Response(
+                data=data, message=message, status_code=status_code, error=None
+            ),
+            headers=headers,
         )
 
     @staticmethod
@@ -23,7 +29,15 @@ class ResponseHandler:
         status_code: int = HTTPStatus.INTERNAL_SERVER_ERROR.value,
         error: Optional[str] = None,
         data: Any = None,
-    ) -> Response[Any]:
-        return Response(
-            data=data, message=message, status_code=status_code, error=error
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> FastJSONResponse:
+        return FastJSONResponse(
+            status_code=status_code,
+            content=Response(
+                data=data,
+                message=message,
+                status_code=status_code,
+                error=error,
+            ),
+            headers=headers,
         )
@@ -0,0 +1,74 @@
+import asyncio
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from typing import Callable, Literal, Optional
+
+from app.exception import ServiceUnavailable
+
+ExecutorKind = Literal['thread', 'process']
+
+
+class BoundedWorkerPool:
+    """Pool de workers com fila limitada para tarefas CPU-bound
+
+    Tarefas que excedem ``max_workers + queue_size`` são rejeitadas com
+    ``ServiceUnavailable`` (503) em vez de acumular no event loop.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        queue_size: int,
+        executor: ExecutorKind = 'thread',
+    ):
+        self._max_workers = max(1, max_workers)
+        self._capacity = self._max_workers + max(0, queue_size)
+        self._executor_kind: ExecutorKind = executor
+        self._executor: Optional[Executor] = None
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Quantidade de tarefas em execução ou aguardando na fila"""
+        return self._pending
+
+    @property
+    def capacity(self) -> int:
+        """Quantidade máxima de tarefas aceitas simultaneamente"""
+        return self._capacity
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self._executor_kind == 'process':
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._max_workers
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix='worker-pool',
+                )
+        return self._executor
+
+    async def run[*Ts, R](self, func: Callable[[*Ts], R], *args: *Ts) -> R:
+        """Executa ``func`` no pool sem bloquear o event loop"""
+        if self._pending >= self._capacity:
+            raise ServiceUnavailable()
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._get_executor(), func, *args
+            )
+        finally:
+            self._pending -= 1
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Encerra o executor subjacente"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None